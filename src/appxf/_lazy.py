@@ -0,0 +1,45 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Lazy attribute loading for APPXF facades
+
+Facades map their exposed names to the sub-module providing them. The
+sub-module is imported on first access of the name (PEP 562) such that
+importing a facade does not load dependencies of sub-modules that are not
+used. Usage in a facade __init__.py:
+
+    __getattr__, __dir__ = lazy_attributes(__name__, {
+        'Buffer': '.buffer',
+        })
+'''
+
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_attributes(
+    module_name: str, attributes: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    '''Get module level __getattr__ and __dir__ for lazy loading
+
+    Arguments:
+        module_name -- __name__ of the facade
+        attributes -- mapping of exposed name to the (relative) sub-module
+            that provides it
+    '''
+    module_globals = importlib.import_module(module_name).__dict__
+
+    def __getattr__(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(f'module {module_name!r} has no attribute {name!r}')
+        value = getattr(importlib.import_module(attributes[name], module_name), name)
+        # cache in module namespace such that __getattr__ is not called again.
+        # This also covers sub-modules named like the exposed name which were
+        # bound to the facade by the import above.
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(module_globals) | set(attributes))
+
+    return __getattr__, __dir__
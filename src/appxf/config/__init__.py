@@ -2,4 +2,17 @@
 # SPDX-License-Identifier: Apache-2.0
 '''Facade for APPXF config module'''
 
-from .config import AppxfConfigError, Config
+from typing import TYPE_CHECKING
+
+from appxf._lazy import lazy_attributes
+
+# Loaded on first access (see appxf._lazy):
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        'AppxfConfigError': '.config',
+        'Config': '.config',
+    },
+)
+if TYPE_CHECKING:
+    from .config import AppxfConfigError, Config
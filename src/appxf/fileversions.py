@@ -13,8 +13,6 @@ import logging
 import os.path
 import re
 
-from babel.dates import format_date
-
 # Setup logging
 log = logging.getLogger(__name__)
 
@@ -138,6 +136,10 @@ def _fill_date_pattern(format: str, date: datetime.date):
                         outstr[:opening] + '.' + datestr + '.' + outstr[closing + 1 :]
                     )
             else:
+                # babel is imported on first use since it is expensive to
+                # import and not needed by most users of appxf.logging:
+                from babel.dates import format_date
+
                 datestr = format_date(date, datestr, locale=set_locale.locale)
                 outstr = outstr[:opening] + datestr + outstr[closing + 1 :]
         # avoid freezing programs due to programming errors
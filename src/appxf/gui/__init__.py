@@ -7,16 +7,44 @@
 # there will be a command line integration, this would be one staying in APPXF
 # scope.
 
-from .application import AppxfApplication
-from .common import AppxfGuiError, ButtonFrame, GridFrame, GridTk, GridToplevel
-from .config import ConfigMenu
-from .login import Login
-from .registration_admin import RegistrationAdmin
-from .registration_user import RegistrationUser
-from .setting_base import SettingFrameDefault
-from .setting_dict import (
-    SettingDictColumnFrame,
-    SettingDictSingleFrame,
-    SettingDictWindow,
+from typing import TYPE_CHECKING
+
+from appxf._lazy import lazy_attributes
+
+# Loaded on first access (see appxf._lazy) to not load tkinter and further GUI
+# dependencies before the GUI is used:
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        'AppxfApplication': '.application',
+        'AppxfGuiError': '.common',
+        'ButtonFrame': '.common',
+        'GridFrame': '.common',
+        'GridTk': '.common',
+        'GridToplevel': '.common',
+        'ConfigMenu': '.config',
+        'Login': '.login',
+        'RegistrationAdmin': '.registration_admin',
+        'RegistrationUser': '.registration_user',
+        'SettingFrameDefault': '.setting_base',
+        'SettingDictColumnFrame': '.setting_dict',
+        'SettingDictSingleFrame': '.setting_dict',
+        'SettingDictWindow': '.setting_dict',
+        'SettingSelectDetailFrame': '.setting_select',
+        'SettingSelectFrame': '.setting_select',
+    },
 )
-from .setting_select import SettingSelectDetailFrame, SettingSelectFrame
+if TYPE_CHECKING:
+    from .application import AppxfApplication
+    from .common import AppxfGuiError, ButtonFrame, GridFrame, GridTk, GridToplevel
+    from .config import ConfigMenu
+    from .login import Login
+    from .registration_admin import RegistrationAdmin
+    from .registration_user import RegistrationUser
+    from .setting_base import SettingFrameDefault
+    from .setting_dict import (
+        SettingDictColumnFrame,
+        SettingDictSingleFrame,
+        SettingDictWindow,
+    )
+    from .setting_select import SettingSelectDetailFrame, SettingSelectFrame
@@ -6,6 +6,8 @@ Exception UserAbortError is defined to terminate the application on
 Login.check().
 '''
 
+from __future__ import annotations
+
 import tkinter
 import tkinter.ttk
 
@@ -13,6 +15,7 @@ from appxf import logging
 from appxf.gui.locale import _
 from appxf.gui.setting_dict import SettingDictSingleFrame
 from appxf.security import Security
+from appxf.startup import Startup
 
 # from appxf.config import Config
 from appxf.setting import SettingDict
@@ -52,10 +55,18 @@ class Login:
         user_config: SettingDict | None = None,
         app_name='Login',
         pwd_min_length=6,
+        startup: Startup | None = None,
         **kwargs,
     ):
+        '''Login for security
+
+        A startup (for the same security) is run with the password instead of
+        only unlocking the user. This loads configuration and registry while
+        the key is derived from the password.
+        '''
         super().__init__(**kwargs)
         self._security = security
+        self._startup = startup
         if user_config is None:
             self._user_config = SettingDict()
         else:
@@ -176,13 +187,19 @@ class Login:
 
         def okButtonFunction(event=None):
             try:
-                self._security.unlock_user(pwdEntry.get())
-                guiRoot.destroy()
+                if self._startup is None:
+                    self._security.unlock_user(pwdEntry.get())
+                else:
+                    # only raises unlock failures, failures of other steps
+                    # are logged and collected in Startup.errors:
+                    self._startup.run(pwdEntry.get())
             except Exception:
                 self.log.debug(
                     'Password verification failed because of:', exc_info=True
                 )
                 self.log.warning('Password wrong, but we continue.')
+                return
+            guiRoot.destroy()
 
         okButton = tkinter.Button(
             guiRoot, text=_('button', 'OK'), command=okButtonFunction
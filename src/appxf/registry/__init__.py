@@ -2,11 +2,28 @@
 # SPDX-License-Identifier: Apache-2.0
 '''Facade for APPXF registry module'''
 
-from .registry import (
-    AppxfRegistryError,
-    AppxfRegistryRoleError,
-    AppxfRegistryUnknownUser,
-    Registry,
+from typing import TYPE_CHECKING
+
+from appxf._lazy import lazy_attributes
+
+# Loaded on first access (see appxf._lazy):
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        'AppxfRegistryError': '.registry',
+        'AppxfRegistryRoleError': '.registry',
+        'AppxfRegistryUnknownUser': '.registry',
+        'Registry': '.registry',
+        'SecureSharedStorage': '.shared_storage',
+        'SharedSync': '.shared_sync',
+    },
 )
-from .shared_storage import SecureSharedStorage
-from .shared_sync import SharedSync
+if TYPE_CHECKING:
+    from .registry import (
+        AppxfRegistryError,
+        AppxfRegistryRoleError,
+        AppxfRegistryUnknownUser,
+        Registry,
+    )
+    from .shared_storage import SecureSharedStorage
+    from .shared_sync import SharedSync
@@ -0,0 +1,120 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Versions of config settings for manual configuration updates
+
+Admins record a digest per setting of the exported config sections together
+with the config version in which the setting changed. Manual configuration
+updates can then include only the settings changed since a given config
+version. Users record the config version of the last applied update to detect
+missing updates.
+'''
+
+from __future__ import annotations
+
+import hashlib
+
+from appxf import logging
+from appxf.storage import CompactSerializer, Storable, Storage
+
+
+class ConfigVersions(Storable):
+    log = logging.getLogger(__name__ + '.ConfigVersions')
+
+    # pseudo setting key for the options of a section:
+    options_key = '_options'
+
+    def __init__(self, storage_method: Storage, **kwargs):
+        super().__init__(storage_method, **kwargs)
+        self._version = 1
+        # Latest config version (created by admins, applied by users):
+        self._config_version = 0
+        # Per section and setting key: [config version, digest] with an empty
+        # digest for removed settings (not used by users):
+        self._settings: dict[str, dict[str, list]] = {}
+
+    attributes = ['_version', '_config_version', '_settings']
+
+    @property
+    def config_version(self) -> int:
+        return self._config_version
+
+    @config_version.setter
+    def config_version(self, version: int):
+        self._config_version = version
+
+    @classmethod
+    def _split_state(cls, state: dict) -> tuple[dict, dict]:
+        '''Split SettingDict state into settings and options'''
+        if '_settings' in state:
+            options = {
+                key: value
+                for key, value in state.items()
+                if key not in ['_version', '_settings']
+            }
+            return state['_settings'], options
+        return {key: value for key, value in state.items() if key != '_version'}, {}
+
+    @classmethod
+    def _get_digests(cls, state: dict) -> dict[str, bytes]:
+        settings, options = cls._split_state(state)
+        digests = {
+            key: hashlib.sha256(CompactSerializer.serialize(value)).digest()
+            for key, value in settings.items()
+        }
+        digests[cls.options_key] = hashlib.sha256(
+            CompactSerializer.serialize(options)
+        ).digest()
+        return digests
+
+    def update(self, section_states: dict[str, dict]) -> bool:
+        '''Record the states of config sections
+
+        The states must be complete (SettingDict.FullExport). Changed, added
+        and removed settings are assigned to a new config version.
+
+        Returns: True if a new config version was started
+        '''
+        new_version = self._config_version + 1
+        changed = False
+        for section, state in section_states.items():
+            records = self._settings.setdefault(section, {})
+            digests = self._get_digests(state)
+            for key, digest in digests.items():
+                if key not in records or records[key][1] != digest:
+                    records[key] = [new_version, digest]
+                    changed = True
+            for key, record in records.items():
+                if key not in digests and record[1]:
+                    records[key] = [new_version, b'']
+                    changed = True
+        if changed:
+            self._config_version = new_version
+        return changed
+
+    def remove_section(self, section: str):
+        '''Forget the records of a removed section'''
+        self._settings.pop(section, None)
+
+    def get_delta(self, section: str, state: dict, since: int) -> tuple[dict, list]:
+        '''Reduce a recorded section state to changes since a config version
+
+        Returns: the state with changed settings only (empty dict if nothing
+            changed) and the list of removed setting keys
+        '''
+        records = self._settings[section]
+        settings, options = self._split_state(state)
+        delta_settings = {
+            key: value for key, value in settings.items() if records[key][0] > since
+        }
+        removed = [
+            key
+            for key, (version, digest) in records.items()
+            if not digest and version > since
+        ]
+        options_changed = records[self.options_key][0] > since
+        if not delta_settings and not options_changed:
+            return {}, removed
+        delta = {'_version': state['_version'], '_settings': delta_settings}
+        if options_changed:
+            delta.update(options)
+        return delta, removed
@@ -4,11 +4,12 @@
 
 The class RegistrationRequest serializes and deserializes a registration
 request from user to admin. It is expected to be handled in an encrypted file
-which is not in scope of this class.
+(see appxf.security.Envelope) which is not in scope of this class.
 '''
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any, TypedDict
 
 from appxf.security import Security
@@ -87,3 +88,25 @@ class RegistrationRequest:
     def get_request_bytes(self) -> bytes:
         '''Get serialized bytes for sending to admin'''
         return CompactSerializer.serialize(self._data)
+
+    @classmethod
+    def from_sections(cls, sections: Mapping[str, bytes | memoryview]):
+        '''Generate a RegistrationRequest from envelope sections
+
+        See get_sections() and appxf.security.Envelope.
+        '''
+        data: RegistrationRequestData = {
+            'version': 1,
+            'user_data': CompactSerializer.deserialize(sections['user_data']),  # type: ignore
+            'signing_key': bytes(sections['signing_key']),
+            'encryption_key': bytes(sections['encryption_key']),
+        }
+        return cls(data)
+
+    def get_sections(self) -> dict[str, bytes]:
+        '''Get sections for an envelope to admin (keys are not serialized)'''
+        return {
+            'user_data': CompactSerializer.serialize(self._data['user_data']),
+            'signing_key': self._data['signing_key'],
+            'encryption_key': self._data['encryption_key'],
+        }
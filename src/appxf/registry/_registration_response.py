@@ -4,17 +4,21 @@
 
 The class RegistrationResponse serializes and deserializes a registration
 response form admin to user. It is expected to be handled as an encrypted file
-which is not in scope of this class.
+(see appxf.security.Envelope) which is not in scope of this class.
 '''
 
 from __future__ import annotations
 
+import struct
+from collections.abc import Mapping
 from typing import Any, TypedDict
 
 from appxf.storage import CompactSerializer
 
 # TODO: apply DictStorable here but keep the get_bytes interface.
 
+_user_id_format = struct.Struct('<q')
+
 
 class AppxfExceptionRegistrationResponse(Exception):
     '''Error with handling a registration response'''
@@ -69,3 +73,31 @@ class RegistrationResponse:
     def get_response_bytes(self) -> bytes:
         '''Get serialized bytes for sending to user'''
         return CompactSerializer.serialize(self._data)
+
+    @classmethod
+    def from_sections(
+        cls, sections: Mapping[str, bytes | memoryview]
+    ) -> RegistrationResponse:
+        '''Generate a RegistrationResponse from envelope sections
+
+        See get_sections() and appxf.security.Envelope.
+        '''
+        data: RegistrationResponseData = {
+            'version': 1,
+            'user_id': _user_id_format.unpack(sections['user_id'])[0],
+            'user_db': CompactSerializer.deserialize(sections['user_db']),  # type: ignore
+            'config_sections': CompactSerializer.deserialize(  # type: ignore
+                sections['config_sections']
+            ),
+        }
+        return cls(data)
+
+    def get_sections(self) -> dict[str, bytes]:
+        '''Get sections for an envelope to the user'''
+        return {
+            'user_id': _user_id_format.pack(self._data['user_id']),
+            'user_db': CompactSerializer.serialize(self._data['user_db']),
+            'config_sections': CompactSerializer.serialize(
+                self._data['config_sections']
+            ),
+        }
@@ -74,3 +74,19 @@ class RegistryBase(ABC):
         data -- the data to be decrypted
         key_blob_dict -- a dictionary of key blobs, indexed by USER ID
         '''
+
+    @abstractmethod
+    def verify_key_signature(
+        self, data: bytes, signature: bytes, public_key: bytes
+    ) -> bool:
+        '''Return if signature of data is verified by the public signing key
+
+        Unlike verify_signature() of the Registry, the public key is not
+        required to belong to a registered user. For keys of registered users,
+        repeated verification of unchanged data may be served from a cache.
+
+        Keyword arguments:
+        data -- bytes of data that were signed
+        signature -- signature of data
+        public_key -- public signing key of the author
+        '''
@@ -1,32 +1,41 @@
 # Copyright 2023-2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
 # SPDX-License-Identifier: Apache-2.0
-from typing import Set, TypedDict
+import sys
+from array import array
 
 from appxf import logging
-from appxf.storage import Storable, Storage
+from appxf.storage import Storable, Storage, freeze
 
 
 class AppxfUserDatabaseException(Exception):
     '''Error in User Database handling'''
 
 
-class UserEntry(TypedDict):
-    id: int
-    roles: list[str]
-    validation_key: bytes
-    encryption_key: bytes
+# array typecodes for role masks by bytes per mask (see _role_mask_data):
+_mask_typecodes = {array(code).itemsize: code for code in 'bhiq'}
 
 
-# TODO: do we need the extra role storage in the UserEntry?
+class UserDatabase(Storable):
+    '''Users with their public keys and roles
 
+    Users are kept in columns indexed by the user ID such that the database
+    stays compact for many users and loads quickly:
+      * a role mask per user ID where bit i stands for the role _roles[i] and
+        -1 marks user IDs that are not registered
+      * validation and encryption keys of all users in one buffer with three
+        offsets per user ID
+
+    The stored state has a fixed binary layout for those columns (see the
+    _role_mask_data, _key_offset_data and _key_data properties). Maps from keys
+    and roles to users are derived and not stored.
+    '''
 
-class UserDatabase(Storable):
     log = logging.getLogger(__name__ + '.UserDatabase')
 
     def __init__(self, storage_method: Storage, **kwargs):
         super().__init__(storage_method, **kwargs)
 
-        self._version = 1
+        self._version = 2
         # ID handling:
         self._unused_id_list = []
         # negative user IDs are not allowed: we use negative user IDs as error
@@ -34,24 +43,53 @@ class UserDatabase(Storable):
         # with negative user ID such that even the initial admin should not use
         # ID 0.
         self._next_id = 1
-        # The user_map maps ID's to UserEntry objects (dictionaries).
-        self._user_db: dict[int, UserEntry] = {}
-        # The role_map maps roles to lists of ID's to quickly collect lists of
-        # keys.
-        self._role_map: dict[str, Set] = {'admin': set(), 'user': set()}
-        # The validation_key_map maps validation keys to user IDs for efficient
-        # lookup.
-        self._validation_key_map: dict[bytes, int] = {}
+        self._clear_users()
+        # Changes that are not yet published to the remote change log (see
+        # Registry). A change is a list [operation, user_id, *arguments] as
+        # consumed by apply_change().
+        self._changes: list[list] = []
+        # Version of the remote change log that is included in this database:
+        self._log_version = 0
+        # The generation is increased on any change of users, keys or roles.
+        # It invalidates the recipient_cache which maps role combinations to
+        # the encryption keys of the role members (see
+        # get_encryption_key_dict()) and the role_users which map roles to
+        # users (see get_users()). Those are not stored.
+        self._generation = 0
+        self._recipient_cache: dict[frozenset[str], dict[int, bytes]] = {}
+        self._role_users: dict[str, set[int]] = {}
+
+    def _clear_users(self):
+        # Roles by bit index in the role masks with the mask bit per role.
+        # admin and user are always present.
+        self._roles: list[str] = ['admin', 'user']
+        self._role_bits: dict[str, int] = {'admin': 1, 'user': 2}
+        # Role mask per user ID (index), -1 if the ID is not registered:
+        self._role_masks: list[int] = []
+        # Keys of all users in one buffer. User ID i has it's validation key at
+        # [offsets[3i]:offsets[3i+1]] and it's encryption key at
+        # [offsets[3i+1]:offsets[3i+2]]. Keys of replaced or purged users
+        # remain as unused bytes until the buffer is compacted on get_state().
+        self._keys = bytearray()
+        self._key_offsets = array('Q')
+        self._unused_key_bytes = 0
+        # Maps from validation and encryption keys to user IDs for lookup and
+        # duplicate detection. They are built on first use (see
+        # _get_key_maps()).
+        self._validation_key_map: dict[bytes, int] | None = None
+        self._encryption_key_map: dict[bytes, int] | None = None
 
     attributes = [
         '_version',
         '_next_id',
         '_unused_id_list',
-        '_user_db',
-        '_role_map',
-        '_validation_key_map',
+        '_roles',
+        '_role_mask_data',
+        '_key_offset_data',
+        '_key_data',
+        '_changes',
+        '_log_version',
     ]
-    # TODO: should apply custom get_state to apply version check
 
     # TODO: next_id / unused_id_list should rather be re-created than stored
     # and loaded (more prone for errors)
@@ -73,19 +111,27 @@ class UserDatabase(Storable):
         '''
         if role:
             role = role.lower()
-            if role not in self._role_map:
-                # requested roles does not exist, hence, no users exist:
-                return set()
-            # role exists, return IDs for the role
-            return self._role_map[role]
-        # no role filtering, return all IDs from the user DB
-        return set(self._user_db.keys())
+            users = self._role_users.get(role)
+            if users is None:
+                bit = self._role_bits.get(role)
+                # (no users if the role does not exist)
+                users = freeze(
+                    {
+                        user_id
+                        for user_id, mask in enumerate(self._role_masks)
+                        if bit is not None and mask > 0 and mask & bit
+                    }
+                )
+                self._role_users[role] = users
+            return users
+        # no role filtering, return all registered IDs
+        return {user_id for user_id, mask in enumerate(self._role_masks) if mask >= 0}
 
     def get_user_by_validation_key(self, key: bytes) -> int | None:
         '''get user ID from validation key
 
         Returns None if no user is found'''
-        return self._validation_key_map.get(key)
+        return self._get_key_maps()[0].get(key)
 
     def add_new(
         self,
@@ -107,27 +153,27 @@ class UserDatabase(Storable):
             roles = [role.lower() for role in roles]
 
         # check for existing keys (users)
-        for user_id, user_entry in self._user_db.items():
-            match_found = 0
-            if user_entry['validation_key'] == validation_key:
-                match_found += 1
-            if user_entry['encryption_key'] == encryption_key:
-                match_found += 1
-            # if keys exist with consistent IDs, update roles and conclude
-            if match_found == 2:
-                self.log.info(
-                    'New user already existing with ID %i. Updating roles to %s',
-                    user_id,
-                    str(roles),
-                )
-                self.set_roles(user_id, roles)
-                return user_id
-            # if keys exist but are inconsistent:
-            if match_found == 1:
-                # return the negative user ID (we ensured that user IDs start
-                # with 1, not with 0)
-                self.log.info(f'new user keys already exist for user ID {user_id}')
-                return -user_id
+        validation_key_map, encryption_key_map = self._get_key_maps()
+        validation_user = validation_key_map.get(validation_key)
+        encryption_user = encryption_key_map.get(encryption_key)
+        # if keys exist with consistent IDs, update roles and conclude
+        if validation_user is not None and validation_user == encryption_user:
+            self.log.info(
+                'New user already existing with ID %i. Updating roles to %s',
+                validation_user,
+                str(roles),
+            )
+            self.set_roles(validation_user, roles)
+            return validation_user
+        # if keys exist but are inconsistent:
+        if validation_user is not None or encryption_user is not None:
+            user_id = (
+                validation_user if validation_user is not None else encryption_user
+            )
+            # return the negative user ID (we ensured that user IDs start with
+            # 1, not with 0)
+            self.log.info(f'new user keys already exist for user ID {user_id}')
+            return -user_id
 
         # TODO: get determine new ID (implementation might already consider
         # sys.maxsize)
@@ -151,25 +197,40 @@ class UserDatabase(Storable):
         encryption_key: bytes,
         roles: list[str],
     ):
-
         roles = [role.lower() for role in roles]
+        self._add(user_id, validation_key, encryption_key, roles)
+        self._changes.append(['add', user_id, validation_key, encryption_key, roles])
 
-        entry = UserEntry(
-            id=user_id,
-            roles=roles,
-            validation_key=validation_key,
-            encryption_key=encryption_key,
+    def _add(
+        self,
+        user_id: int,
+        validation_key: bytes,
+        encryption_key: bytes,
+        roles: list[str],
+    ):
+        if self.is_registered(user_id):
+            # replacing an entry must not leave the old keys mapped:
+            self._remove_keys(user_id)
+        elif user_id >= len(self._role_masks):
+            missing = user_id + 1 - len(self._role_masks)
+            self._role_masks.extend([-1] * missing)
+            self._key_offsets.extend([0] * (3 * missing))
+        start = len(self._keys)
+        self._keys += validation_key
+        split = len(self._keys)
+        self._keys += encryption_key
+        self._key_offsets[3 * user_id : 3 * user_id + 3] = array(
+            'Q', (start, split, len(self._keys))
         )
-        # entry = UserEntry2(id=user_id, validation_key=validation_key)
-        self._user_db[user_id] = entry
-        # Update validation key mapping
-        self._validation_key_map[validation_key] = user_id
-
-        for role in roles:
-            # ensure role is present
-            if role not in self._role_map.keys():
-                self._role_map[role] = set()
-            self._role_map[role].add(user_id)
+        self._role_masks[user_id] = self._get_role_mask(roles)
+        # user IDs may be added from other admins (see apply_change()):
+        self._next_id = max(self._next_id, user_id + 1)
+        # Update key mappings
+        if self._validation_key_map is not None:
+            self._validation_key_map[validation_key] = user_id
+        if self._encryption_key_map is not None:
+            self._encryption_key_map[encryption_key] = user_id
+        self._changed()
 
     def remove_user(self, user_id: int):
         '''Remove user by deleting all role assignments
@@ -177,11 +238,13 @@ class UserDatabase(Storable):
         The user's public keys remain existent in case there is still shared
         data from this user that might need signature validation.
         '''
-        for role in self._role_map:
-            if user_id in self._role_map[role]:
-                self._role_map[role].remove(user_id)
-            if not self._role_map[role] and not role == 'user' and not role == 'admin':
-                del self._role_map[role]
+        self._remove_user(user_id)
+        self._changes.append(['remove', user_id])
+
+    def _remove_user(self, user_id: int):
+        if self.is_registered(user_id):
+            self._role_masks[user_id] = 0
+        self._changed()
 
     # TODO: When USER DB starts maintaining user information (USER CONFIG),
     # either remove or purge need to delete this information. To allow the
@@ -197,50 +260,243 @@ class UserDatabase(Storable):
         Using this should ensure that there is no data present anymore that
         needs to be authenticated against this user's signing key.
         '''
-
-        if user_id not in self._user_db:
+        if not self.is_registered(user_id):
             self.log.warning('Trying to purge USER ID %i which does not exist', user_id)
             return
-        # ensure steps from remove() - role_map being cleared
-        self.remove_user(user_id)
-        # remove from validation key map
-        validation_key = self._user_db[user_id]['validation_key']
-        if validation_key in self._validation_key_map:
-            del self._validation_key_map[validation_key]
-        # remove from user map and remember USER ID to be re-used:
-        del self._user_db[user_id]
+        self._purge_user(user_id)
+        self._changes.append(['purge', user_id])
+
+    def _purge_user(self, user_id: int):
+        if not self.is_registered(user_id):
+            return
+        # remove from key maps and key buffer
+        self._remove_keys(user_id)
+        self._key_offsets[3 * user_id : 3 * user_id + 3] = array('Q', (0, 0, 0))
+        # unregister and remember USER ID to be re-used:
+        self._role_masks[user_id] = -1
         self._unused_id_list.append(user_id)
+        self._changed()
+
+    def _remove_keys(self, user_id: int):
+        if self._validation_key_map is not None:
+            validation_key = self.get_verification_key(user_id)
+            if self._validation_key_map.get(validation_key) == user_id:
+                del self._validation_key_map[validation_key]
+        if self._encryption_key_map is not None:
+            encryption_key = self.get_encryption_key(user_id)
+            if self._encryption_key_map.get(encryption_key) == user_id:
+                del self._encryption_key_map[encryption_key]
+        start, _, end = self._key_offsets[3 * user_id : 3 * user_id + 3]
+        self._unused_key_bytes += end - start
+
+    def _get_key_maps(self) -> tuple[dict[bytes, int], dict[bytes, int]]:
+        '''Get maps from validation and encryption keys to user IDs'''
+        if self._validation_key_map is None or self._encryption_key_map is None:
+            validation_key_map = {}
+            encryption_key_map = {}
+            keys = self._keys
+            offsets = self._key_offsets
+            for user_id, mask in enumerate(self._role_masks):
+                if mask < 0:
+                    continue
+                start, split, end = offsets[3 * user_id : 3 * user_id + 3]
+                validation_key_map[bytes(keys[start:split])] = user_id
+                encryption_key_map[bytes(keys[split:end])] = user_id
+            self._validation_key_map = validation_key_map
+            self._encryption_key_map = encryption_key_map
+        return self._validation_key_map, self._encryption_key_map
+
+    def _get_role_mask(self, roles: list[str]) -> int:
+        mask = 0
+        for role in roles:
+            role = role.lower()
+            bit = self._role_bits.get(role)
+            if bit is None:
+                # new role:
+                bit = 1 << len(self._roles)
+                self._roles.append(role)
+                self._role_bits[role] = bit
+            mask |= bit
+        return mask
+
+    def _get_role_names(self, mask: int) -> list[str]:
+        return [role for role, bit in self._role_bits.items() if mask & bit]
+
+    def _changed(self):
+        self._generation += 1
+        self._recipient_cache = {}
+        self._role_users = {}
+
+    @property
+    def generation(self) -> int:
+        '''Counter that changes whenever users, keys or roles change'''
+        return self._generation
+
+    # #########################/
+    # State
+    # /
+    # The columns are stored with a fixed layout via the following properties
+    # (see attributes). Byte order is little endian.
+
+    @property
+    def _role_mask_data(self) -> bytes:
+        # one byte with the bytes per mask (including a sign bit) followed by
+        # the role mask of each user ID:
+        size = len(self._roles) // 8 + 1
+        size = min((item for item in _mask_typecodes if item >= size), default=size)
+        if size in _mask_typecodes:
+            masks = array(_mask_typecodes[size], self._role_masks)
+            if sys.byteorder == 'big':
+                masks.byteswap()
+            return bytes([size]) + masks.tobytes()
+        return bytes([size]) + b''.join(
+            mask.to_bytes(size, 'little', signed=True) for mask in self._role_masks
+        )
+
+    @_role_mask_data.setter
+    def _role_mask_data(self, data: bytes):
+        size = data[0]
+        if size in _mask_typecodes:
+            masks = array(_mask_typecodes[size])
+            masks.frombytes(data[1:])
+            if sys.byteorder == 'big':
+                masks.byteswap()
+            self._role_masks = masks.tolist()
+        else:
+            self._role_masks = [
+                int.from_bytes(data[i : i + size], 'little', signed=True)
+                for i in range(1, len(data), size)
+            ]
+
+    @property
+    def _key_offset_data(self) -> bytes:
+        # three unsigned 64 bit offsets per user ID (see _clear_users()):
+        self._compact_keys()
+        offsets = array('Q', self._key_offsets)
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+        return offsets.tobytes()
+
+    @_key_offset_data.setter
+    def _key_offset_data(self, data: bytes):
+        offsets = array('Q')
+        offsets.frombytes(data)
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+        self._key_offsets = offsets
+
+    @property
+    def _key_data(self) -> bytes:
+        self._compact_keys()
+        return bytes(self._keys)
+
+    @_key_data.setter
+    def _key_data(self, data: bytes):
+        self._keys = bytearray(data)
+        self._unused_key_bytes = 0
+
+    def _compact_keys(self):
+        '''Remove unused bytes from the key buffer'''
+        if not self._unused_key_bytes:
+            return
+        keys = bytearray()
+        offsets = array('Q')
+        old_keys = self._keys
+        old_offsets = self._key_offsets
+        for user_id, mask in enumerate(self._role_masks):
+            start = len(keys)
+            if mask >= 0:
+                old_start, old_split, old_end = old_offsets[
+                    3 * user_id : 3 * user_id + 3
+                ]
+                keys += old_keys[old_start:old_end]
+                offsets.extend((start, start + old_split - old_start, len(keys)))
+            else:
+                offsets.extend((0, 0, 0))
+        self._keys = keys
+        self._key_offsets = offsets
+        self._unused_key_bytes = 0
+
+    def set_state(self, data: object, **kwarg):
+        user_entries = None
+        if isinstance(data, dict) and '_user_db' in data:
+            # version 1 stored a dict per user and derived maps:
+            user_entries = data['_user_db']
+            data = {
+                key: value
+                for key, value in data.items()
+                if key not in ['_user_db', '_role_map', '_validation_key_map']
+            }
+            data['_version'] = 2
+            self._clear_users()
+        super().set_state(data, **kwarg)
+        if user_entries is not None:
+            for user_id, entry in user_entries.items():
+                self._add(
+                    user_id,
+                    entry['validation_key'],
+                    entry['encryption_key'],
+                    entry['roles'],
+                )
+        # derived maps are rebuilt to be consistent:
+        self._role_bits = {role: 1 << bit for bit, role in enumerate(self._roles)}
+        self._validation_key_map = None
+        self._encryption_key_map = None
+        self._changed()
+
+    # #########################/
+    # Access
+    # /
 
     def is_registered(self, user_id):
-        return user_id in self._user_db
+        return (
+            isinstance(user_id, int)
+            and 0 <= user_id < len(self._role_masks)
+            and self._role_masks[user_id] >= 0
+        )
 
-    def _get_user_entry(self, user_id) -> UserEntry:
+    def _ensure_registered(self, user_id):
         if not self.is_registered(user_id):
             raise AppxfUserDatabaseException(f'{user_id} is not registered.')
-        return self._user_db[user_id]
 
     def has_role(self, user_id: int, role: str):
-        role = role.lower()
-        if role not in self._role_map.keys():
+        bit = self._role_bits.get(role.lower())
+        if bit is None or not self.is_registered(user_id):
             return False
-        return user_id in self._role_map[role]
+        return bool(self._role_masks[user_id] & bit)
 
     def get_verification_key(self, user_id: int) -> bytes:
-        return self._get_user_entry(user_id)['validation_key']
+        self._ensure_registered(user_id)
+        start, split = self._key_offsets[3 * user_id : 3 * user_id + 2]
+        return bytes(self._keys[start:split])
 
     def get_encryption_key(self, user_id: int) -> bytes:
-        return self._get_user_entry(user_id)['encryption_key']
+        self._ensure_registered(user_id)
+        split, end = self._key_offsets[3 * user_id + 1 : 3 * user_id + 3]
+        return bytes(self._keys[split:end])
 
     def get_encryption_key_dict(self, roles: list[str] | str) -> dict[int, bytes]:
+        '''Get encryption keys of all users having any of the roles
+
+        The returned dict is a frozen snapshot (see appxf.storage.freeze())
+        which is reused for the same role combination until users or roles
+        change.
+        '''
         # resolve input ambiguity:
         if isinstance(roles, str):
-            roles = [roles.lower()]
+            roles = [roles]
+        role_set = frozenset(role.lower() for role in roles)
+        key_dict = self._recipient_cache.get(role_set)
+        if key_dict is not None:
+            return key_dict
         # accumulate user ID's according to role:
         role_users: set[int] = set()
-        for this_role in roles:
+        for this_role in role_set:
             role_users.update(self.get_users(this_role))
-        # return encryption keys for role users:
-        return {user: self._user_db[user]['encryption_key'] for user in role_users}
+        # encryption keys for role users:
+        key_dict = freeze({user: self.get_encryption_key(user) for user in role_users})
+        self._recipient_cache[role_set] = key_dict
+        return key_dict
 
     def get_roles(self, user_id: int | None = None) -> list[str]:
         '''Get list of roles
@@ -249,31 +505,82 @@ class UserDatabase(Storable):
         user_id -- Return roles for this user ID or, if None, return all roles
         '''
         if user_id is None:
-            # admin and user will always be present given that _role_map is
-            # intialized with those two roles and those two roles are never
-            # removed.
-            return list(self._role_map.keys())
-        entry = self._get_user_entry(user_id)
-        return entry['roles']
+            # admin and user will always be present, other roles only while
+            # they are assigned:
+            used_mask = self._role_bits['admin'] | self._role_bits['user']
+            for mask in set(self._role_masks):
+                if mask > 0:
+                    used_mask |= mask
+            return self._get_role_names(used_mask)
+        self._ensure_registered(user_id)
+        return self._get_role_names(self._role_masks[user_id])
 
     def set_roles(self, user_id: int, roles: list[str] | str):
         '''set roles for user ID'''
-        if user_id not in self._user_db:
+        if not self.is_registered(user_id):
             raise ValueError(f'User ID {user_id} is not registered.')
 
         if isinstance(roles, str):
             roles = [roles]
+        self._set_roles(user_id, roles)
+        self._changes.append(['set_roles', user_id, roles])
 
-        current_roles = self.get_roles(user_id)
-        for role in current_roles:
-            if role not in roles:
-                self._role_map[role].remove(user_id)
-        for role in roles:
-            if role not in current_roles:
-                if role not in self._role_map.keys():
-                    self._role_map[role] = set()
-                self._role_map[role].add(user_id)
-        self._user_db[user_id]['roles'] = roles
+    def _set_roles(self, user_id: int, roles: list[str]):
+        if not self.is_registered(user_id):
+            return
+        self._role_masks[user_id] = self._get_role_mask(roles)
+        self._changed()
+
+    # #########################/
+    # Change Log
+    # /
+    # Changes from add(), set_roles(), remove_user() and purge_user() are
+    # recorded such that the Registry can publish them as change log instead
+    # of the full database.
+
+    @property
+    def log_version(self) -> int:
+        '''Version of the remote change log included in this database'''
+        return self._log_version
+
+    def get_changes(self) -> list[list]:
+        '''Get changes that are not yet published'''
+        return list(self._changes)
+
+    def mark_published(self, count: int, log_version: int):
+        '''Remove the first count changes after publishing them'''
+        del self._changes[:count]
+        self._log_version = log_version
+
+    def discard_changes(self):
+        '''Discard changes that shall not be published'''
+        self._changes = []
+
+    def apply_change(self, change: list, log_version: int):
+        '''Apply a published change from get_changes()
+
+        The change is not recorded again.
+        '''
+        operation, user_id, *arguments = change
+        if operation == 'add':
+            self._add(user_id, *arguments)
+        elif operation == 'set_roles':
+            self._set_roles(user_id, *arguments)
+        elif operation == 'remove':
+            self._remove_user(user_id)
+        elif operation == 'purge':
+            self._purge_user(user_id)
+        else:
+            raise AppxfUserDatabaseException(f'Unknown change operation {operation}')
+        self._log_version = log_version
+
+    def get_shared_state(self) -> object:
+        '''State for other users (without unpublished changes)'''
+        return self.get_state(
+            attributes=[
+                attribute for attribute in self.attributes if attribute != '_changes'
+            ]
+        )
 
     # Adding logging to store/load
     def store(self, **kwargs):
@@ -0,0 +1,81 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''User information distributed per role
+
+Admins know the user information (USER section from the registration request)
+of all users. Other users obtain the information of users sharing a role with
+them from one file per role (see Registry). UserInfo keeps the information
+together with the versions of the role files to skip unchanged files.
+'''
+
+from __future__ import annotations
+
+from copy import deepcopy
+
+from appxf import logging
+from appxf.storage import Storable, Storage
+
+
+class UserInfo(Storable):
+    log = logging.getLogger(__name__ + '.UserInfo')
+
+    def __init__(self, storage_method: Storage, **kwargs):
+        super().__init__(storage_method, **kwargs)
+        self._version = 1
+        # The information per user ID:
+        self._info: dict[int, dict] = {}
+        # The user IDs per received role file (not used by admins):
+        self._role_users: dict[str, list[int]] = {}
+        # The version per role file which is the digest of the published
+        # content for admins and the UUID of the received file for users:
+        self._role_versions: dict[str, bytes] = {}
+
+    attributes = ['_version', '_info', '_role_users', '_role_versions']
+
+    def get(self, user_id: int) -> dict:
+        '''Get information of user ID (KeyError if unknown)'''
+        return deepcopy(self._info[user_id])
+
+    def set(self, user_id: int, info: dict):
+        self._info[user_id] = deepcopy(info)
+
+    def remove(self, user_id: int):
+        self._info.pop(user_id, None)
+
+    def get_role_content(self, user_ids: set[int]) -> dict[int, dict]:
+        '''Get information of the users for a role file'''
+        return {
+            user_id: self._info[user_id]
+            for user_id in sorted(user_ids)
+            if user_id in self._info
+        }
+
+    def get_role_version(self, role: str) -> bytes | None:
+        return self._role_versions.get(role)
+
+    def set_role_version(self, role: str, version: bytes):
+        self._role_versions[role] = version
+
+    def set_role_content(self, role: str, content: dict[int, dict]):
+        '''Apply the content of a received role file'''
+        for user_id in self._role_users.get(role, []):
+            if not any(
+                user_id in users
+                for other_role, users in self._role_users.items()
+                if other_role != role
+            ):
+                self._info.pop(user_id, None)
+        self._info.update(content)
+        self._role_users[role] = list(content)
+
+    def retain_roles(self, roles: list[str]) -> bool:
+        '''Forget role files and user information for other roles
+
+        Returns: True if any role was removed
+        '''
+        removed = [role for role in self._role_users if role not in roles]
+        for role in removed:
+            self.set_role_content(role, {})
+            del self._role_users[role]
+            self._role_versions.pop(role, None)
+        return bool(removed)
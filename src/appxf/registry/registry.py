@@ -4,17 +4,30 @@
 # allow class name being used before being fully defined (like in same class):
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
 from appxf import logging
 from appxf.config import Config
-from appxf.security import SecurePrivateStorage, Security
+from appxf.security import Envelope, SecurePrivateStorage, Security
 from appxf.setting import SettingDict
-from appxf.storage import CompactSerializer, LocalStorage, StorageToBytes, sync
-
+from appxf.storage import (
+    CompactSerializer,
+    LocalStorage,
+    Storage,
+    StorageToBytes,
+    freeze,
+)
+
+from ._config_versions import ConfigVersions
 from ._registration_request import RegistrationRequest
 from ._registration_response import RegistrationResponse
 from ._registry_base import RegistryBase
 from ._user_db import UserDatabase
 from ._user_id import UserId
+from ._user_info import UserInfo
 from .shared_storage import SecureSharedStorage
 
 
@@ -81,10 +94,26 @@ class Registry(RegistryBase):
 
     Default storage is consistent with the Security object and the files
     user_db, user_id are stored in ./data/security.
+
+    The USER_DB is replicated via the remote storage as a change log of
+    admin changes (USER_DB_LOG_<segment>, each entry signed by the admin)
+    with a snapshot of the full USER_DB (USER_DB) written once per log
+    segment. Users only load the log entries they did not apply, yet, such
+    that a sync does not scale with the number of users.
+
+    User information (the USER section from the registration request) is
+    distributed with one file per role in user_info_roles (USER_INFO_<role>,
+    encrypted for the role members). A role file is only re-encrypted when
+    the role members or their information changed.
     '''
 
     log = logging.getLogger(__name__ + '.Registry')
 
+    # number of change log entries per remote file (and per snapshot):
+    user_db_log_segment_size = 64
+    # number of cached signature verification results:
+    signature_cache_size = 4096
+
     def __init__(
         self,
         security: Security,
@@ -94,6 +123,7 @@ class Registry(RegistryBase):
         default_roles: list[str] | None = None,
         local_storage_factory: StorageToBytes.Factory | None = None,
         remote_storage_factory: StorageToBytes.Factory | None = None,
+        user_info_roles: list[str] | None = None,
         **kwargs,
     ):
         '''Create Registry Handler
@@ -119,6 +149,9 @@ class Registry(RegistryBase):
                 user database is stored for all users to sync with. A typical
                 use case is FtpStorage while also LocalStorage may be used.
                 Registry employs a SecureSharedStorage on top for stored files.
+            user_info_roles -- Roles for which the user information of the
+                role members is shared with the role members via the remote
+                storage. Admins always know the information of all users.
         '''
         super().__init__(**kwargs)
         self._loaded = False
@@ -144,7 +177,31 @@ class Registry(RegistryBase):
             base_storage=local_storage_factory('USER_DB'), security=security
         )
         self._user_db = UserDatabase(self._local_user_db_storage)
-        # Matching remote storage
+        self._user_info = UserInfo(
+            SecurePrivateStorage(
+                base_storage=local_storage_factory('USER_INFO'), security=security
+            )
+        )
+        self._config_versions = ConfigVersions(
+            SecurePrivateStorage(
+                base_storage=local_storage_factory('CONFIG_VERSIONS'),
+                security=security,
+            )
+        )
+        if user_info_roles is None:
+            user_info_roles = []
+        self._user_info_roles = [role.lower() for role in user_info_roles]
+        # see _get_recipient_key_dict():
+        self._recipient_cache: dict[frozenset[str], dict[int, bytes]] = {}
+        self._recipient_generation = -1
+        # see _verify_user_signature():
+        self._signature_cache: OrderedDict[tuple[int, bytes, bytes], bool] = (
+            OrderedDict()
+        )
+        self._signature_generation = -1
+        # Matching remote storage (USER_DB snapshot and change log segments
+        # which are created on demand, except the first one):
+        self._remote_user_db_logs: dict[int, Storage] = {}
         if self._remote_storage_factory is None:
             self._remote_user_db_storage = None
         else:
@@ -153,6 +210,17 @@ class Registry(RegistryBase):
                 security=security,
                 registry=self,
             )
+            self._get_remote_user_db_log(0)
+        # Remote user information per role (USER_INFO_<role>):
+        self._remote_user_info: dict[str, Storage] = {}
+        if self._remote_storage_factory is not None:
+            for role in self._user_info_roles:
+                self._remote_user_info[role] = SecureSharedStorage(
+                    base_storage=self._remote_storage_factory(f'USER_INFO_{role}'),
+                    security=security,
+                    registry=self,
+                    to_roles=role,
+                )
 
         # Note: USER_DB cannot be synced from __init__ since security module
         # may not yet be unlocked.
@@ -205,9 +273,31 @@ class Registry(RegistryBase):
             self._user_db.load()
             user_db_loaded = True
 
+        if self._user_info.exists():
+            self._user_info.load()
+        if self._config_versions.exists():
+            self._config_versions.load()
+
         self._loaded = user_id_loaded and user_db_loaded
         return self._loaded
 
+    def has_remote_user_db(self) -> bool:
+        '''Remote USER_DB (snapshot or change log) is available
+
+        Does not require unlocked security such that it can be checked while
+        unlocking (see appxf.startup).
+        '''
+        if self._remote_user_db_storage is None:
+            return False
+        # (SecureSharedStorage.exists() requires unlocked security)
+        return any(
+            storage.base_storage is not None and storage.base_storage.exists()
+            for storage in [
+                self._remote_user_db_storage,
+                self._get_remote_user_db_log(0),
+            ]
+        )
+
     # #########################/
     # Security Support
     # /
@@ -268,10 +358,7 @@ class Registry(RegistryBase):
                 return False
 
         # verify signature:
-        public_key = self._user_db.get_verification_key(user_id=signing_user)
-        if not self._security.verify_signature(
-            data=data, signature=signature, public_key_bytes=public_key
-        ):
+        if not self._verify_user_signature(data, signing_user, signature):
             self.log.warning(
                 'Signature from user %i could not be verified.', signing_user
             )
@@ -279,6 +366,46 @@ class Registry(RegistryBase):
 
         return True
 
+    def verify_key_signature(
+        self, data: bytes, signature: bytes, public_key: bytes
+    ) -> bool:
+        # Documentation in RegistryBase
+        user_id = None
+        if self._loaded:
+            user_id = self._user_db.get_user_by_validation_key(public_key)
+        if user_id is None:
+            return self._security.verify_signature(
+                data=data, signature=signature, public_key_bytes=public_key
+            )
+        return self._verify_user_signature(data, user_id, signature)
+
+    def _verify_user_signature(
+        self, data: bytes, user_id: int, signature: bytes
+    ) -> bool:
+        '''Verify signature with the key of a registered user
+
+        Results are cached by user, data digest and signature (least recently
+        used are dropped above signature_cache_size) until the USER_DB changes
+        (see UserDatabase.generation).
+        '''
+        if self._signature_generation != self._user_db.generation:
+            self._signature_cache = OrderedDict()
+            self._signature_generation = self._user_db.generation
+        cache_key = (user_id, hashlib.sha256(data).digest(), signature)
+        verified = self._signature_cache.get(cache_key)
+        if verified is not None:
+            self._signature_cache.move_to_end(cache_key)
+            return verified
+        verified = self._security.verify_signature(
+            data=data,
+            signature=signature,
+            public_key_bytes=self._user_db.get_verification_key(user_id=user_id),
+        )
+        self._signature_cache[cache_key] = verified
+        if len(self._signature_cache) > self.signature_cache_size:
+            self._signature_cache.popitem(last=False)
+        return verified
+
     # #########################/
     # USER DB basic interfaces
     # /
@@ -313,6 +440,8 @@ class Registry(RegistryBase):
         self._ensure_loaded()
         if purge:
             self._user_db.purge_user(user_id)
+            self._user_info.remove(user_id)
+            self._user_info.store()
         else:
             self._user_db.remove_user(user_id)
         self._user_db.store()
@@ -323,6 +452,28 @@ class Registry(RegistryBase):
         self._user_db.set_roles(user_id, roles)
         self._user_db.store()
 
+    def get_user_info(self, user_id: int) -> dict:
+        '''Get user information (USER section from registration)
+
+        Admins know the information of all users, other users the information
+        of users sharing a role in user_info_roles with them.
+        '''
+        self._ensure_loaded()
+        try:
+            return self._user_info.get(user_id)
+        except KeyError:
+            raise AppxfRegistryUnknownUser(
+                f'No user information for user ID {user_id}.'
+            ) from None
+
+    def set_user_info(self, user_id: int, info: dict):
+        '''Set user information (shared on next sync)'''
+        self._ensure_loaded()
+        if not self._user_db.is_registered(user_id):
+            raise AppxfRegistryUnknownUser(f'User ID {user_id} is not registered.')
+        self._user_info.set(user_id, info)
+        self._user_info.store()
+
     # #########################/
     # Admin Init OR Admin Keys
     # /
@@ -339,6 +490,11 @@ class Registry(RegistryBase):
         )
         self._user_db.store()
         self._loaded = True
+        if self._user_config_section in self._config.sections:
+            self._user_info.set(
+                self.user_id, dict(self._config.section(self._user_config_section))
+            )
+            self._user_info.store()
         # Note: writing into USER_ID and into USER_DB automatically stores
         # them.
 
@@ -411,12 +567,16 @@ class Registry(RegistryBase):
         else:
             user_data = {}
         request_object = RegistrationRequest.new(user_data, self._security)
+        self._ensure_loaded()
 
-        bytes_raw = request_object.get_request_bytes()
-        bytes_encrypted, key_blob_dict = self.hybrid_encrypt(bytes_raw, 'admin')
-        request = {'request': bytes_encrypted, 'key_blob_dict': key_blob_dict}
-
-        return CompactSerializer.serialize(request)
+        # signed with the included signing key (the user is not yet known)
+        # and encrypted for the admins:
+        return Envelope.seal(
+            self._security,
+            kind='registration_request',
+            sections=request_object.get_sections(),
+            public_keys=self._get_recipient_key_dict(frozenset({'admin'})),
+        )
 
     # TODO: registry should not expose raw data since it is not encrypted.
     # the idea was that registration is secure.. ..such that insecure
@@ -424,14 +584,19 @@ class Registry(RegistryBase):
     # function is only used in testing.
 
     def get_request_data(self, request: bytes) -> RegistrationRequest:
-        request_encrypted: dict = CompactSerializer.deserialize(request)
-
-        bytes_decrypted = self.hybrid_decrypt(
-            data=request_encrypted['request'],
-            key_blob_dict=request_encrypted['key_blob_dict'],
+        self._ensure_loaded()
+        envelope = Envelope.open(
+            self._security,
+            request,
+            blob_identifier=self.user_id,
+            kind='registration_request',
         )
-
-        return RegistrationRequest.from_request(bytes_decrypted)
+        request_data = RegistrationRequest.from_sections(envelope.sections)
+        if envelope.author != request_data.signing_key:
+            raise AppxfRegistryError(
+                'Request is not signed with the included signing key.'
+            )
+        return request_data
 
     def add_user_from_request(
         self, request: RegistrationRequest, roles: list[str] = ['user']
@@ -458,6 +623,9 @@ class Registry(RegistryBase):
             roles=roles,
         )
         self._user_db.store()
+        if user_id > 0:
+            self._user_info.set(user_id, request.user_data)
+            self._user_info.store()
 
         # Note: add_new automatically stored the new user DB and sync can be
         # skipped if add_new failed:
@@ -465,6 +633,94 @@ class Registry(RegistryBase):
             self.sync_with_remote(mode='sending')
         return user_id
 
+    def add_users_from_requests(
+        self,
+        requests: list[bytes],
+        roles: list[str] | str = ['user'],
+        max_workers: int | None = None,
+    ) -> list[tuple[int, bytes]]:
+        '''Register many users at once and get their responses
+
+        Batch variant of get_request_data(), add_user_from_request() and
+        get_response_bytes(). Requests are decrypted and responses are
+        encrypted and signed in parallel (max_workers threads). All users are
+        added with a single store of the USER_DB and a single remote sync.
+
+        Requests are validated before any user is added. If any request cannot
+        be decrypted or is incomplete, AppxfRegistryError is raised and no user
+        is added.
+
+        Returns:
+            list of (user ID, response bytes), in order of requests. Like for
+            add_user_from_request(), the user ID is negative if the request
+            conflicts with an existing user. Response bytes are empty in this
+            case.
+        '''
+        if not self._loaded:
+            raise AppxfRegistryUnitialized(
+                'registry is not yet loaded, cannot add users'
+            )
+        if not requests:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            request_list = list(executor.map(self._get_valid_request_data, requests))
+            invalid = [
+                index
+                for index, request in enumerate(request_list)
+                if isinstance(request, Exception)
+            ]
+            if invalid:
+                raise AppxfRegistryError(
+                    f'Requests {invalid} are invalid, no user was added. First '
+                    f'error: {request_list[invalid[0]]}'
+                )
+
+            # see add_user_from_request() on skipping the receive:
+            if len(self._user_db.get_users()) > 1:
+                self.sync_with_remote(mode='receiving')
+            user_id_list = [
+                self._user_db.add_new(
+                    validation_key=request.signing_key,
+                    encryption_key=request.encryption_key,
+                    roles=roles,
+                )
+                for request in request_list
+            ]
+            self._user_db.store()
+            for user_id, request in zip(user_id_list, request_list):
+                if user_id > 0:
+                    self._user_info.set(user_id, request.user_data)
+            self._user_info.store()
+            if any(user_id > 0 for user_id in user_id_list):
+                self.sync_with_remote(mode='sending')
+
+            # responses share the USER_DB state and config sections:
+            user_db_state = self._user_db.get_shared_state()
+            config_sections = self._get_response_config_sections()
+            response_list = executor.map(
+                lambda user_id: (
+                    self._get_response_bytes(user_id, user_db_state, config_sections)
+                    if user_id > 0
+                    else b''
+                ),
+                user_id_list,
+            )
+            return list(zip(user_id_list, response_list))
+
+    def _get_valid_request_data(
+        self, request: bytes
+    ) -> RegistrationRequest | Exception:
+        '''Get request data or the exception on invalid requests'''
+        try:
+            request_data = self.get_request_data(request)
+            if not isinstance(request_data.signing_key, bytes) or not isinstance(
+                request_data.encryption_key, bytes
+            ):
+                raise AppxfRegistryError('Request does not include keys as bytes.')
+        except Exception as exc:
+            return exc
+        return request_data
+
     def get_response_bytes(
         self,
         user_id: int,
@@ -475,69 +731,54 @@ class Registry(RegistryBase):
         as file via Email. See: get_request_bytes().
         '''
         self._ensure_loaded()
+        return self._get_response_bytes(
+            user_id,
+            self._user_db.get_shared_state(),
+            self._get_response_config_sections(),
+        )
 
+    def _get_response_config_sections(self) -> dict[str, dict]:
         # check sections existing before applying
         for section in self._response_config_sections:
             if section not in self._config.sections:
                 raise AppxfRegistryUnknownConfigSection(
                     f'Section {section} does not exist.'
                 )
+        return {
+            section: dict(self._config.section(section))
+            for section in self._response_config_sections
+        }
+
+    def _get_response_bytes(
+        self, user_id: int, user_db_state: dict, config_sections: dict[str, dict]
+    ) -> bytes:
         response = RegistrationResponse.new(
             user_id=user_id,
-            user_db=self._user_db.get_state(),
-            config_sections={
-                section: dict(self._config.section(section))
-                for section in self._response_config_sections
-            },
+            user_db=user_db_state,
+            config_sections=config_sections,
         )
 
-        # The hybrid encryption interface from registry CANNOT be reused here
-        # because the response is encrypted ONLY for the corresponding
-        # registered user which only get's it's USER ID after consuming the
-        # response.
-        response_bytes = response.get_response_bytes()
-        # encryption
-        response_bytes_encrypted, key_blob_dict = self._security.hybrid_encrypt(
-            response_bytes,
-            public_keys={user_id: self._user_db.get_encryption_key(user_id)},
+        # The response is encrypted ONLY for the corresponding registered user
+        # which only get's it's USER ID after consuming the response. The key
+        # blob is, therefore, identified by the public key.
+        encryption_key = self._user_db.get_encryption_key(user_id)
+        return Envelope.seal(
+            self._security,
+            kind='registration_response',
+            sections=response.get_sections(),
+            public_keys={encryption_key: encryption_key},
         )
-        # signing
-        signature = self._security.sign(response_bytes_encrypted)
-
-        response_data = {
-            'response_encrypted': response_bytes_encrypted,
-            'key_blob': key_blob_dict[user_id],
-            'signing_user': self.user_id,
-            'signature': signature,
-        }
-
-        return CompactSerializer.serialize(response_data)
 
     def set_response_bytes(self, response_bytes: bytes):
         '''Set registration response'''
         if self.is_initialized():
             self.log.warning('User is already initialized with ID %i.', self.user_id)
 
-        response_data: dict = CompactSerializer.deserialize(response_bytes)
-
-        # check signature
-        response_encrypted: bytes = response_data['response_encrypted']
-        if not self.verify_signature(
-            data=response_encrypted,
-            signature=response_data['signature'],
-            signing_user=response_data['signing_user'],
-            roles=['admin'],
-        ):
-            raise AppxfRegistryError('Signature could not be verified')
-
-        response_bytes = self._security.hybrid_decrypt(
-            data=response_encrypted,
-            key_blob_dict={
-                self._security.get_encryption_public_key(): response_data['key_blob']
-            },
+        envelope = Envelope.open(
+            self._security, response_bytes, kind='registration_response'
         )
-
-        response = RegistrationResponse.from_response_bytes(response_bytes)
+        self._verify_admin_author(envelope.author, 'registration response')
+        response = RegistrationResponse.from_sections(envelope.sections)
 
         for section in response.config_sections:
             self._config.section(section).update(response.config_sections[section])
@@ -547,6 +788,8 @@ class Registry(RegistryBase):
         # application "uninitialized" until then
         self._user_id.id = response.user_id
         self._user_db.set_state(response.user_db_bytes)
+        # changes from setting the admin keys are included in the response:
+        self._user_db.discard_changes()
         # set_state does not automatically store the user_db, hence a manual
         # call:
         self._user_db.store()
@@ -586,16 +829,41 @@ class Registry(RegistryBase):
         if isinstance(roles, str):
             roles = [roles]
         # ensure admin can always read data:
-        if 'admin' not in roles:
-            roles.append('admin')
+        role_set = frozenset(roles) | {'admin'}
+
+        pub_key_dict = self._get_recipient_key_dict(role_set)
+        return self._security.hybrid_encrypt(data, pub_key_dict)
+
+    def _get_recipient_key_dict(self, role_set: frozenset[str]) -> dict[int, bytes]:
+        '''Encryption keys of role members and own key
 
-        pub_key_dict = self._user_db.get_encryption_key_dict(roles)
+        Results are reused until the USER_DB changes (see
+        UserDatabase.generation).
+        '''
+        if self._recipient_generation != self._user_db.generation:
+            self._recipient_cache = {}
+            self._recipient_generation = self._user_db.generation
+        pub_key_dict = self._recipient_cache.get(role_set)
+        if pub_key_dict is not None:
+            return pub_key_dict
+        pub_key_dict = self._user_db.get_encryption_key_dict(role_set)
         # always add own key (if registry is initialized.. ..hybrid_encrypt is
         # also used for the registration request):
-        if self.is_initialized() and self.user_id not in pub_key_dict:
-            pub_key_dict[self.user_id] = self._security.get_encryption_public_key()
-
-        return self._security.hybrid_encrypt(data, pub_key_dict)
+        if not self._loaded:
+            if self.is_initialized() and self.user_id not in pub_key_dict:
+                pub_key_dict = dict(pub_key_dict)
+                pub_key_dict[self.user_id] = self._security.get_encryption_public_key()
+            # the own key may be available without USER_DB change, no caching
+            return pub_key_dict
+        if self.user_id not in pub_key_dict:
+            pub_key_dict = freeze(
+                {
+                    **pub_key_dict,
+                    self.user_id: self._security.get_encryption_public_key(),
+                }
+            )
+        self._recipient_cache[role_set] = pub_key_dict
+        return pub_key_dict
 
     def hybrid_decrypt(self, data: bytes, key_blob_dict: dict[int, bytes]) -> bytes:
         # Documentation in RegistryBase
@@ -609,8 +877,18 @@ class Registry(RegistryBase):
     # Manual Configuration Updates
     # /
 
+    @property
+    def config_version(self) -> int:
+        '''Config version of the last created (admin) or applied update'''
+        self._ensure_loaded()
+        return self._config_versions.config_version
+
     def get_manual_config_update_bytes(
-        self, sections: list[str] | None = None, include_user_db: bool = True
+        self,
+        sections: list[str] | None = None,
+        include_user_db: bool = True,
+        since_version: int | None = None,
+        user_ids: Iterable[int] | None = None,
     ) -> bytes:
         '''get manual configuration update bytes
 
@@ -619,6 +897,13 @@ class Registry(RegistryBase):
         Sections that are included in the section list but are not existing any
         more in the config object are removed on the receiving side. However,
         FILES FOR CONFIG sections ARE NOT DELETED.
+
+        Each update with changed settings starts a new config_version. With
+        since_version, the update only includes settings changed after this
+        config version (delta update) and the receiving side must have applied
+        an update with at least this version. Unchanged sections are skipped.
+
+        The update is encrypted for all users or for user_ids, only.
         '''
         if sections is None:
             sections = self._response_config_sections
@@ -629,24 +914,66 @@ class Registry(RegistryBase):
                 'Only admin users can generate manual configuration updates.'
             )
 
-        data = {'config_sections': {}, 'obsolete_config_sections': []}
+        if since_version is not None and since_version > self.config_version:
+            raise AppxfRegistryError(
+                f'Cannot create update since config version {since_version}, '
+                f'latest version is {self.config_version}.'
+            )
+
+        config_sections = {}
+        obsolete_config_sections = []
         for section in sections:
             if section not in self._config.sections:
-                data['obsolete_config_sections'].append(section)
+                obsolete_config_sections.append(section)
+                self._config_versions.remove_section(section)
                 continue
-            data['config_sections'][section] = self._config.section(section).get_state(
+            config_sections[section] = self._config.section(section).get_state(
                 options=SettingDict.FullExport
             )
+        if self._config_versions.update(config_sections) or obsolete_config_sections:
+            self._config_versions.store()
+        removed_config_keys = {}
+        if since_version is not None:
+            for section in list(config_sections):
+                delta, removed = self._config_versions.get_delta(
+                    section, config_sections[section], since_version
+                )
+                if removed:
+                    removed_config_keys[section] = removed
+                if delta:
+                    config_sections[section] = delta
+                else:
+                    del config_sections[section]
+        envelope_sections = {
+            'config_version': CompactSerializer.serialize(
+                [since_version, self._config_versions.config_version]
+            ),
+            'config_sections': CompactSerializer.serialize(config_sections),
+            'removed_config_keys': CompactSerializer.serialize(removed_config_keys),
+            'obsolete_config_sections': CompactSerializer.serialize(
+                obsolete_config_sections
+            ),
+        }
         if include_user_db:
-            data['user_db'] = self._user_db.get_state()
-        data_bytes = CompactSerializer.serialize(data)
+            envelope_sections['user_db'] = CompactSerializer.serialize(
+                self._user_db.get_shared_state()
+            )
 
         # sign and encrypt:
-        return self._security.hybrid_signed_encrypt(
-            data=data_bytes,
-            public_keys=self._user_db.get_encryption_key_dict(
+        if user_ids is None:
+            public_keys = self._user_db.get_encryption_key_dict(
                 roles=self._user_db.get_roles()
-            ),
+            )
+        else:
+            public_keys = {
+                user_id: self._user_db.get_encryption_key(user_id)
+                for user_id in user_ids
+            }
+        return Envelope.seal(
+            self._security,
+            kind='config_update',
+            sections=envelope_sections,
+            public_keys=public_keys,
         )
 
     def set_manual_config_update_bytes(self, data: bytes):
@@ -657,40 +984,88 @@ class Registry(RegistryBase):
         self._ensure_loaded()
 
         # decrypt and verify signature:
-        data_bytes, author_key = self._security.hybrid_signed_decrypt(
-            data=data,
-            blob_identifier=self.user_id,
+        envelope = Envelope.open(
+            self._security, data, blob_identifier=self.user_id, kind='config_update'
         )
-
-        # TODO: check if author_key is KNOWN and an ADMIN
-        author_id = self._user_db.get_user_by_validation_key(author_key)
-        if author_id is None:
-            raise AppxfRegistryUnknownUser(
-                'Author of manual configuration update is unknown.'
-            )
-        if not self._user_db.has_role(author_id, 'admin'):
-            raise AppxfRegistryRoleError(
-                'Author of manual configuration update is not an admin.'
-            )
+        self._verify_admin_author(envelope.author, 'manual configuration update')
 
         # unpack data
-        data_dict: dict = CompactSerializer.deserialize(data_bytes)
-        # apply to config sections
-        for section in data_dict.get('obsolete_config_sections', []):
+        envelope_sections = envelope.sections
+        base_version, config_version = CompactSerializer.deserialize(
+            envelope_sections['config_version']
+        )  # type: ignore
+        if (
+            base_version is not None
+            and self._config_versions.config_version < base_version
+        ):
+            raise AppxfRegistryError(
+                f'Manual configuration update requires config version '
+                f'{base_version} but version '
+                f'{self._config_versions.config_version} is applied. '
+                f'A full update is required.'
+            )
+        obsolete_config_sections: list[str] = CompactSerializer.deserialize(
+            envelope_sections['obsolete_config_sections']
+        )  # type: ignore
+        config_sections: dict[str, dict] = CompactSerializer.deserialize(
+            envelope_sections['config_sections']
+        )  # type: ignore
+        removed_config_keys: dict[str, list[str]] = CompactSerializer.deserialize(
+            envelope_sections['removed_config_keys']
+        )  # type: ignore
+        # apply to config sections (only the changed ones for delta updates)
+        for section in obsolete_config_sections:
             if section in self._config.sections:
                 self._config.remove_section(section)
-        for section, section_state in data_dict.get('config_sections', {}).items():
+        for section in dict.fromkeys([*config_sections, *removed_config_keys]):
             if section not in self._config.sections:
                 self._config.add_section(section)
-            self._config.section(section).set_state(
-                section_state, options=SettingDict.FullExport
-            )
-            self._config.section(section).store()
+            setting_dict = self._config.section(section)
+            for key in removed_config_keys.get(section, []):
+                if key in setting_dict:
+                    del setting_dict[key]
+            if section in config_sections:
+                setting_dict.set_state(
+                    config_sections[section],
+                    options=(
+                        SettingDict.FullExport
+                        if base_version is None
+                        else self._delta_import
+                    ),
+                )
+            setting_dict.store()
+        if config_version > self._config_versions.config_version:
+            self._config_versions.config_version = config_version
+            self._config_versions.store()
         # update user db
-        if 'user_db' in data_dict:
-            self._user_db.set_state(data_dict['user_db'])
+        if 'user_db' in envelope_sections:
+            self._user_db.set_state(
+                CompactSerializer.deserialize(envelope_sections['user_db'])
+            )
             self._user_db.store()
 
+    # delta updates do not include unchanged settings:
+    _delta_import = SettingDict.ExportOptions(
+        name=True,
+        type=True,
+        value_options=True,
+        display_options=True,
+        control_options=True,
+        export_defaults=True,
+        exception_on_missing_key=False,
+        exception_on_new_key=False,
+        remove_missing_keys=False,
+        add_new_keys=True,
+    )
+
+    def _verify_admin_author(self, author_key: bytes, message: str):
+        '''Ensure the author of a message is a known admin'''
+        author_id = self._user_db.get_user_by_validation_key(author_key)
+        if author_id is None:
+            raise AppxfRegistryUnknownUser(f'Author of {message} is unknown.')
+        if not self._user_db.has_role(author_id, 'admin'):
+            raise AppxfRegistryRoleError(f'Author of {message} is not an admin.')
+
     # #########################/
     # Remote Sync Handling
     # /
@@ -735,25 +1110,148 @@ class Registry(RegistryBase):
             is_admin = self._user_db.has_role(self._user_id.id, 'admin')
             if mode == 'receiving':
                 print(' -- receiving')
-                # receiving is ALWAYS overwriting local USER_DB
-                sync(
-                    storage_a=self._remote_user_db_storage,
-                    storage_b=self._local_user_db_storage,
-                    only_a_to_b=True,
-                )
-                # reload after sync
-                self._user_db.load()
+                self._receive_user_db()
+                self._receive_user_info()
             elif mode == 'sending':
                 if is_admin:
                     print(' -- sending')
-                    sync(
-                        storage_a=self._local_user_db_storage,
-                        storage_b=self._remote_user_db_storage,
-                        only_a_to_b=True,
-                    )
+                    self._publish_user_db()
+                    self._publish_user_info()
             else:
                 raise AppxfRegistryError(f'Mode {mode} is unknown.')
 
+    def _get_remote_user_db_log(self, segment: int) -> Storage:
+        if segment not in self._remote_user_db_logs:
+            assert self._remote_storage_factory is not None
+            self._remote_user_db_logs[segment] = SecureSharedStorage(
+                base_storage=self._remote_storage_factory(f'USER_DB_LOG_{segment}'),
+                security=self._security,
+                registry=self,
+            )
+        return self._remote_user_db_logs[segment]
+
+    def _receive_user_db(self):
+        '''Apply new entries of the remote change log to the USER_DB'''
+        assert self._remote_user_db_storage is not None
+        version = self._user_db.log_version
+        if not version and self._remote_user_db_storage.exists():
+            # start from the snapshot rather than from the first log entry:
+            self._user_db.set_state(self._remote_user_db_storage.load())
+            version = self._user_db.log_version
+        segment = version // self.user_db_log_segment_size
+        while True:
+            log_storage = self._get_remote_user_db_log(segment)
+            if not log_storage.exists():
+                break
+            entries: list[dict] = log_storage.load()  # type: ignore
+            for entry in entries:
+                if entry['version'] <= version:
+                    continue
+                if entry['version'] != version + 1:
+                    raise AppxfRegistryError(
+                        f'USER_DB change log is missing version {version + 1}.'
+                    )
+                self._verify_user_db_change(entry)
+                self._user_db.apply_change(entry['change'], entry['version'])
+                version = entry['version']
+            if len(entries) < self.user_db_log_segment_size:
+                break
+            segment += 1
+        self._user_db.store()
+
+    def _publish_user_db(self):
+        '''Append local USER_DB changes to the remote change log'''
+        assert self._remote_user_db_storage is not None
+        changes = self._user_db.get_changes()
+        if not changes:
+            return
+        # changes from other admins come first:
+        self._receive_user_db()
+        segment_size = self.user_db_log_segment_size
+        first_version = self._user_db.log_version
+        version = first_version
+        segment = version // segment_size
+        log_storage = self._get_remote_user_db_log(segment)
+        entries: list[dict] = log_storage.load() if log_storage.exists() else []  # type: ignore
+        for change in changes:
+            version += 1
+            if (version - 1) // segment_size != segment:
+                log_storage.store(entries)
+                segment += 1
+                log_storage = self._get_remote_user_db_log(segment)
+                entries = []
+            entries.append(self._sign_user_db_change(version, change))
+        log_storage.store(entries)
+        self._user_db.mark_published(len(changes), version)
+        # snapshot for users starting without USER_DB:
+        if not first_version or segment != first_version // segment_size:
+            self._remote_user_db_storage.store(self._user_db.get_shared_state())
+        self._user_db.store()
+
+    def _sign_user_db_change(self, version: int, change: list) -> dict:
+        return {
+            'version': version,
+            'change': change,
+            'author': self.user_id,
+            'signature': self._security.sign(
+                CompactSerializer.serialize([version, change])
+            ),
+        }
+
+    def _verify_user_db_change(self, entry: dict):
+        if not self.verify_signature(
+            data=CompactSerializer.serialize([entry['version'], entry['change']]),
+            signing_user=entry['author'],
+            signature=entry['signature'],
+            roles=['admin'],
+        ):
+            raise AppxfRegistryError(
+                f'USER_DB change log entry {entry["version"]} is not signed by '
+                f'an admin.'
+            )
+
+    def _publish_user_info(self):
+        '''Write role files with changed members or information'''
+        admins = self._user_db.get_users('admin')
+        changed = False
+        for role, storage in self._remote_user_info.items():
+            members = self._user_db.get_users(role)
+            content = self._user_info.get_role_content(members)
+            # recipients are the role members and the admins (see
+            # hybrid_encrypt()):
+            digest = hashlib.sha256(
+                CompactSerializer.serialize([content, sorted(members), sorted(admins)])
+            ).digest()
+            if digest == self._user_info.get_role_version(role):
+                continue
+            storage.store(content)
+            self._user_info.set_role_version(role, digest)
+            changed = True
+        if changed:
+            self._user_info.store()
+
+    def _receive_user_info(self):
+        '''Load role files of own roles that changed'''
+        if self._user_db.has_role(self.user_id, 'admin'):
+            # admins know all user information
+            return
+        own_roles = [
+            role
+            for role in self._remote_user_info
+            if self._user_db.has_role(self.user_id, role)
+        ]
+        changed = False
+        for role in own_roles:
+            storage = self._remote_user_info[role]
+            meta = storage.get_meta_data()
+            if meta is None or meta.uuid == self._user_info.get_role_version(role):
+                continue
+            self._user_info.set_role_content(role, storage.load())  # type: ignore
+            self._user_info.set_role_version(role, meta.uuid)
+            changed = True
+        if self._user_info.retain_roles(own_roles) or changed:
+            self._user_info.store()
+
 
 # TODO: can we register the same user twice? How would we know? We
 # would need to double-check the keys (which we did not want to use as
@@ -761,8 +1259,9 @@ class Registry(RegistryBase):
 # there is currently no tool supported feedback on a registration
 # success (when the user has applied the registration response).
 
-# TODO: add user information to some DB? Users may distribute to admins and
-# admins re-distribute to users.
+# User information is distributed by admins as outlined below (see
+# user_info_roles of Registry). The size projection is verified by
+# tests_features/registration/test_user_info_scale.py.
 #
 # We do not want to write different USER_DB versions for each user.
 # Likewise, we do not want to write an information file for each user that
@@ -40,9 +40,10 @@ class SecureSharedStorage(StorageToBytes):
         security: Security,
         registry: RegistryBase,
         serializer: type[Serializer] = CompactSerializer,
+        to_roles: str | list[str] = 'user',
     ):
-        # TODO: "to roles" is missing input. Alternatively "to users" should be
-        # supported. Likewise "allowed roles"/"allowed users" is required to
+        # TODO: "to users" should be supported as alternative to "to roles".
+        # Likewise "allowed roles"/"allowed users" is required to
         # ensure (1) only allowed roles are writing the data and (2) receivers
         # can verify authenticity. BEWARE the FACTORY interface: each name in a
         # predefined path may hold files with different permissions.
@@ -67,7 +68,7 @@ class SecureSharedStorage(StorageToBytes):
             storage=base_storage.get_meta('signature'), security=security
         )
         self._public_encryption = PublicEncryption(
-            storage=base_storage.get_meta('keys'), registry=registry
+            storage=base_storage.get_meta('keys'), registry=registry, to_roles=to_roles
         )
 
     # TODO: update documentation below. Put elsewhere??
@@ -188,7 +189,9 @@ class SecureSharedStorage(StorageToBytes):
         if data_bytes == b'':
             return b''
         self._signature.load()
-        if not self._signature.verify(data_bytes):
+        if not self._registry.verify_key_signature(
+            data_bytes, self._signature.signature, self._signature.public_key
+        ):
             # TODO: test case for failing signature
             # TODO: AppxfException
             # TODO: extend error message with infos like file
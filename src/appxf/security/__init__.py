@@ -2,5 +2,24 @@
 # SPDX-License-Identifier: Apache-2.0
 '''Facade for APPXF security module'''
 
-from .private_storage import SecurePrivateStorage
-from .security import AppxfSecurityException, Security
+from typing import TYPE_CHECKING
+
+from appxf._lazy import lazy_attributes
+
+# Loaded on first access (see appxf._lazy) to not load cryptography before
+# security is used:
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        'SecurePrivateStorage': '.private_storage',
+        'AppxfSecurityException': '.security',
+        'AppxfSecuritySignatureError': '.security',
+        'Security': '.security',
+        'AppxfEnvelopeError': '.envelope',
+        'Envelope': '.envelope',
+    },
+)
+if TYPE_CHECKING:
+    from .envelope import AppxfEnvelopeError, Envelope
+    from .private_storage import SecurePrivateStorage
+    from .security import AppxfSecurityException, AppxfSecuritySignatureError, Security
@@ -0,0 +1,239 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Versioned binary envelope for signed and encrypted messages
+
+An Envelope carries named byte sections from an author to a set of recipients
+(registration request/response and manual configuration updates). The layout
+is (integers are little endian):
+
+    magic b'AXFE' | version (u8) | kind (u8 length + ASCII)
+    number of key blobs (u32), per key blob:
+        recipient (u8 type 0 + i64 for int or type 1 + u32 length + bytes)
+        key blob (u32 length + bytes)
+    nonce (12 bytes)
+    body, encrypted with AES-GCM using all of the above as associated data
+
+    body:
+        author signing key (u32 length + bytes)
+        signature (u32 length + bytes)
+        number of sections (u32), per section:
+            name (u8 length + ASCII) | content (u32 length + bytes)
+
+The signature covers the SHA256 digest over magic, version, kind and the
+sections which is computed while writing or reading the sections. Key blobs
+are not signed to allow adding recipients but they are authenticated by
+AES-GCM. Content is not base64 encoded and opened sections are slices of the
+decrypted body, not copies.
+'''
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+from typing import Any
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from .security import AppxfSecurityException, AppxfSecuritySignatureError, Security
+
+
+class AppxfEnvelopeError(AppxfSecurityException):
+    '''Bytes are not a valid envelope'''
+
+
+_MAGIC = b'AXFE'
+_NONCE_SIZE = 12
+_RECIPIENT_INT = 0
+_RECIPIENT_BYTES = 1
+_u8 = struct.Struct('<B')
+_u32 = struct.Struct('<I')
+_i64 = struct.Struct('<q')
+
+
+def _pack_text(text: str) -> bytes:
+    text_bytes = text.encode('ascii')
+    return _u8.pack(len(text_bytes)) + text_bytes
+
+
+def _pack_recipient(recipient: Any) -> bytes:
+    if isinstance(recipient, int):
+        return _u8.pack(_RECIPIENT_INT) + _i64.pack(recipient)
+    if isinstance(recipient, bytes):
+        return _u8.pack(_RECIPIENT_BYTES) + _u32.pack(len(recipient)) + recipient
+    raise TypeError(
+        f'Envelope recipients must be int or bytes, not {recipient.__class__.__name__}.'
+    )
+
+
+class _Reader:
+    '''Read fields from a memoryview without copying'''
+
+    def __init__(self, data: memoryview):
+        self.data = data
+        self.pos = 0
+
+    def take(self, size: int) -> memoryview:
+        end = self.pos + size
+        if end > len(self.data):
+            raise AppxfEnvelopeError('Envelope is truncated.')
+        view = self.data[self.pos : end]
+        self.pos = end
+        return view
+
+    def u8(self) -> int:
+        return self.take(1)[0]
+
+    def u32(self) -> int:
+        return _u32.unpack(self.take(4))[0]
+
+    def field(self) -> memoryview:
+        return self.take(self.u32())
+
+    def text(self) -> str:
+        try:
+            return bytes(self.take(self.u8())).decode('ascii')
+        except UnicodeDecodeError as exc:
+            raise AppxfEnvelopeError('Envelope includes invalid names.') from exc
+
+    def recipient(self) -> Any:
+        recipient_type = self.u8()
+        if recipient_type == _RECIPIENT_INT:
+            return _i64.unpack(self.take(8))[0]
+        if recipient_type == _RECIPIENT_BYTES:
+            return bytes(self.field())
+        raise AppxfEnvelopeError(f'Unknown recipient type {recipient_type}.')
+
+
+class Envelope:
+    '''Signed and encrypted message with named sections
+
+    Use seal() to get the bytes for sending and open() on the receiving side.
+    After open(), author is the signing key of the author. Like for
+    Security.hybrid_signed_decrypt(), the CALLER HAS TO VERIFY that the author
+    is authorized to provide the data.
+    '''
+
+    version = 1
+
+    def __init__(
+        self, kind: str, sections: dict[str, memoryview], author: bytes, **kwargs
+    ):
+        '''DO NOT USE directly, use open()'''
+        super().__init__(**kwargs)
+        self.kind = kind
+        self.sections = sections
+        self.author = author
+
+    @classmethod
+    def is_envelope(cls, data: bytes) -> bool:
+        return data[: len(_MAGIC)] == _MAGIC
+
+    @classmethod
+    def seal(
+        cls,
+        security: Security,
+        kind: str,
+        sections: dict[str, bytes],
+        public_keys: dict[Any, bytes],
+    ) -> bytes:
+        '''Sign and encrypt sections for the recipients
+
+        Keyword arguments:
+            security -- unlocked Security of the author
+            kind -- message type which is checked by open()
+            sections -- the content, by section name
+            public_keys -- public encryption keys of the recipients, indexed
+                by an int (like the user ID) or bytes (like the public key)
+        '''
+        prefix = _MAGIC + _u8.pack(cls.version) + _pack_text(kind)
+        digest = hashlib.sha256(prefix)
+        body: list[bytes] = [b'', b'', _u32.pack(len(sections))]
+        for name, content in sections.items():
+            section_header = _pack_text(name) + _u32.pack(len(content))
+            digest.update(section_header)
+            digest.update(content)
+            body += [section_header, content]
+        author = security.get_signing_public_key()
+        signature = security.sign_digest(digest.digest())
+        body[0] = _u32.pack(len(author)) + author
+        body[1] = _u32.pack(len(signature)) + signature
+
+        key = AESGCM.generate_key(bit_length=256)
+        header: list[bytes] = [prefix, _u32.pack(len(public_keys))]
+        for recipient, public_key in public_keys.items():
+            key_blob = Security.encrypt_key_blob(key, public_key)
+            header += [_pack_recipient(recipient), _u32.pack(len(key_blob)), key_blob]
+        nonce = os.urandom(_NONCE_SIZE)
+        header.append(nonce)
+        header_bytes = b''.join(header)
+        return header_bytes + AESGCM(key).encrypt(nonce, b''.join(body), header_bytes)
+
+    @classmethod
+    def open(
+        cls,
+        security: Security,
+        data: bytes,
+        blob_identifier: Any = None,
+        kind: str | None = None,
+    ) -> Envelope:
+        '''Decrypt envelope and verify the signature
+
+        Keyword arguments:
+            security -- unlocked Security of the recipient
+            data -- bytes from seal()
+            blob_identifier -- recipient index used for seal(), the own public
+                encryption key if None
+            kind -- expected kind of the message
+
+        Raises AppxfEnvelopeError for malformed or modified data and
+        AppxfSecuritySignatureError if signature verification fails.
+        '''
+        if blob_identifier is None:
+            blob_identifier = security.get_encryption_public_key()
+        reader = _Reader(memoryview(data))
+        if reader.take(len(_MAGIC)) != _MAGIC:
+            raise AppxfEnvelopeError('Bytes are not an envelope.')
+        version = reader.u8()
+        if version != cls.version:
+            raise AppxfEnvelopeError(f'Envelope version {version} is not supported.')
+        envelope_kind = reader.text()
+        if kind is not None and envelope_kind != kind:
+            raise AppxfEnvelopeError(
+                f'Expected envelope with {kind} but got {envelope_kind}.'
+            )
+        prefix = reader.data[: reader.pos]
+        key_blob = None
+        for _ in range(reader.u32()):
+            recipient = reader.recipient()
+            recipient_key_blob = reader.field()
+            if recipient == blob_identifier:
+                key_blob = bytes(recipient_key_blob)
+        nonce = reader.take(_NONCE_SIZE)
+        if key_blob is None:
+            raise AppxfSecurityException(
+                f'Envelope does not include a key blob for identity: {blob_identifier}.'
+            )
+        try:
+            body = AESGCM(security.decrypt_key_blob(key_blob)).decrypt(
+                nonce, reader.data[reader.pos :], reader.data[: reader.pos]
+            )
+        except InvalidTag as exc:
+            raise AppxfEnvelopeError('Envelope was modified.') from exc
+
+        reader = _Reader(memoryview(body))
+        author = bytes(reader.field())
+        signature = bytes(reader.field())
+        digest = hashlib.sha256(prefix)
+        sections: dict[str, memoryview] = {}
+        for _ in range(reader.u32()):
+            start = reader.pos
+            name = reader.text()
+            sections[name] = reader.field()
+            digest.update(reader.data[start : reader.pos])
+        if reader.pos != len(body):
+            raise AppxfEnvelopeError('Envelope includes unexpected data.')
+        if not Security.verify_signature_digest(digest.digest(), signature, author):
+            raise AppxfSecuritySignatureError()
+        return cls(envelope_kind, sections, author)
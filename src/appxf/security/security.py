@@ -17,7 +17,7 @@ from cryptography.fernet import Fernet
 
 # asynchronous encryption:
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from cryptography.hazmat.primitives.asymmetric import padding, rsa, utils
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from appxf.storage import CompactSerializer, LocalStorage, Storage
@@ -74,6 +74,9 @@ class Security:
         self._storage = storage
         self._derived_key = b''
         self._key_dict = _get_default_key_dict()
+        # parsed private keys with their bytes by key name (see
+        # _get_private_key()), replaced whenever the keys change:
+        self._private_keys: dict[str, tuple[bytes, rsa.RSAPrivateKey]] = {}
 
     def _write_keys(self):
         '''Write key_dict to encrypted file
@@ -108,6 +111,7 @@ class Security:
         data_encrypted = self._storage.load_raw()
         data = self._decrypt_from_bytes(self._derived_key, data_encrypted)
         self._key_dict = pickle.loads(data)
+        self._private_keys.clear()
         self._verify_version()
 
     def is_user_initialized(self):
@@ -257,6 +261,7 @@ class Security:
         public_key = Security._serialize_public_key(key.public_key())
         self._key_dict['signing_pub_key'] = public_key
         self._key_dict['signing_priv_key'] = private_key
+        self._private_keys['signing_priv_key'] = (private_key, key)
         self._write_keys()
 
     def _generate_encryption_keys(self):
@@ -267,6 +272,7 @@ class Security:
         public_key = Security._serialize_public_key(key.public_key())
         self._key_dict['encryption_pub_key'] = public_key
         self._key_dict['encryption_priv_key'] = private_key
+        self._private_keys['encryption_priv_key'] = (private_key, key)
         self._write_keys()
 
     @classmethod
@@ -307,6 +313,20 @@ class Security:
             )
         return key
 
+    def _get_private_key(self, key_name: str) -> rsa.RSAPrivateKey:
+        '''Get parsed private key from key_dict
+
+        Parsing the PEM bytes dominates signing and decryption of small data.
+        The parsed key is kept while the key bytes do not change.
+        '''
+        key_bytes = self._key_dict[key_name]
+        cached = self._private_keys.get(key_name)
+        if cached is not None and cached[0] == key_bytes:
+            return cached[1]
+        private_key = self._deserialize_private_key(key_bytes)
+        self._private_keys[key_name] = (key_bytes, private_key)
+        return private_key
+
     def sign(self, data: bytes) -> bytes:
         '''Sign data bytes
 
@@ -317,9 +337,7 @@ class Security:
         data -- the to be signed data
         '''
         self._ensure_signing_keys_exist()
-        private_key = Security._deserialize_private_key(
-            self._key_dict['signing_priv_key']
-        )
+        private_key = self._get_private_key('signing_priv_key')
 
         return private_key.sign(
             data,
@@ -357,6 +375,51 @@ class Security:
         except InvalidSignature:
             return False
 
+    def sign_digest(self, digest: bytes) -> bytes:
+        '''Sign a SHA256 digest
+
+        The signature equals the one from sign() on the hashed data. Use this
+        function when the data is hashed in parts (see hashlib.sha256()).
+        '''
+        self._ensure_signing_keys_exist()
+        private_key = self._get_private_key('signing_priv_key')
+        return private_key.sign(
+            digest,
+            padding.PSS(
+                mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH
+            ),
+            utils.Prehashed(hashes.SHA256()),
+        )
+
+    @classmethod
+    def verify_signature_digest(
+        cls, digest: bytes, signature: bytes, public_key_bytes: bytes
+    ) -> bool:
+        '''Verify signature of a SHA256 digest, see sign_digest()'''
+        public_key = Security._deserialize_public_key(public_key_bytes)
+        try:
+            public_key.verify(
+                signature,
+                digest,
+                padding.PSS(
+                    mgf=padding.MGF1(hashes.SHA256()),
+                    salt_length=padding.PSS.MAX_LENGTH,
+                ),
+                utils.Prehashed(hashes.SHA256()),
+            )
+            return True
+        except InvalidSignature:
+            return False
+
+    @classmethod
+    def encrypt_key_blob(cls, key: bytes, public_key_bytes: bytes) -> bytes:
+        '''Encrypt a symmetric key with a public encryption key'''
+        return cls._encrypt_with_public_key_to_bytes(key, public_key_bytes)
+
+    def decrypt_key_blob(self, key_blob: bytes) -> bytes:
+        '''Decrypt a symmetric key from encrypt_key_blob()'''
+        return self._decrypt_with_private_key_from_byes(key_blob)
+
     @classmethod
     def _encrypt_with_public_key_to_bytes(cls, data: bytes, key_bytes: bytes):
         public_key = cls._deserialize_public_key(key_bytes)
@@ -370,9 +433,7 @@ class Security:
         )
 
     def _decrypt_with_private_key_from_byes(self, data: bytes):
-        private_key = self._deserialize_private_key(
-            self._key_dict['encryption_priv_key']
-        )
+        private_key = self._get_private_key('encryption_priv_key')
         return private_key.decrypt(
             data,
             padding.OAEP(
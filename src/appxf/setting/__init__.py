@@ -39,7 +39,12 @@ from .base_types import (
     SettingText,
     validated_conversion_configparser,
 )
-from .setting import AppxfSettingConversionError, AppxfSettingError, Setting
+from .setting import (
+    AppxfSettingConversionError,
+    AppxfSettingError,
+    Setting,
+    SettingChange,
+)
 from .setting_dict import AppxfSettingWarning, SettingDict
 from .setting_extension import SettingExtension
 from .setting_select import SettingSelect
@@ -7,14 +7,26 @@ from __future__ import annotations
 import base64
 import binascii
 import configparser
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any, Type
 
-from email_validator import EmailNotValidError, validate_email
-
 from .setting import Setting, _BaseTypeT
 
 
+def _numeric_array_to_list(values: Iterable[Any], kinds: str) -> list | None:
+    '''Python builtin values from a NumPy array or pandas Series
+
+    Returns None if values is not such an array with a dtype.kind from kinds.
+    This avoids a dependency to NumPy while still supporting convert_many()
+    with numeric arrays.
+    '''
+    kind = getattr(getattr(values, 'dtype', None), 'kind', None)
+    if kind is None or kind not in kinds or not hasattr(values, 'tolist'):
+        return None
+    return values.tolist()  # type: ignore
+
+
 class SettingString(Setting[str]):
     '''Setting for basic strings
 
@@ -22,6 +34,8 @@ class SettingString(Setting[str]):
     line entry field. If required, use 'text' instead.
     '''
 
+    __slots__ = ()
+
     @classmethod
     def get_supported_types(cls) -> list[type | str]:
         return ['string', str, 'str']
@@ -37,6 +51,19 @@ class SettingString(Setting[str]):
             return False, self.get_default()
         return True, value
 
+    def _validated_conversion_many(
+        self, values: list[Any]
+    ) -> tuple[list[bool], list[str]]:
+        default = self.get_default()
+        valid = [
+            isinstance(value, str) and '\r' not in value and '\n' not in value
+            for value in values
+        ]
+        return valid, [
+            value if value_valid else default
+            for value, value_valid in zip(values, valid)
+        ]
+
 
 class SettingText(SettingString):
     '''Setting for long texts
@@ -45,6 +72,8 @@ class SettingText(SettingString):
     characters.
     '''
 
+    __slots__ = ()
+
     @dataclass
     class Options(Setting.Options):
         '''Options for SettingText'''
@@ -63,10 +92,22 @@ class SettingText(SettingString):
             return False, self.get_default()
         return True, value
 
+    def _validated_conversion_many(
+        self, values: list[Any]
+    ) -> tuple[list[bool], list[str]]:
+        default = self.get_default()
+        valid = [isinstance(value, str) for value in values]
+        return valid, [
+            value if value_valid else default
+            for value, value_valid in zip(values, valid)
+        ]
+
 
 class SettingEmail(SettingString):
     '''Setting for Emails'''
 
+    __slots__ = ()
+
     # get_default() and to_string() are derived from SettingString
 
     @classmethod
@@ -76,13 +117,43 @@ class SettingEmail(SettingString):
     def _validated_conversion(self, value: Any) -> tuple[bool, str]:
         if not super()._validated_conversion(value)[0]:
             return False, self.get_default()
-        # use email-validator package
+        # use email-validator package (imported on first use since it is
+        # expensive to import):
+        from email_validator import EmailNotValidError, validate_email
+
         try:
             validate_email(value, check_deliverability=False)
             return True, value
         except EmailNotValidError:
             return False, self.get_default()
 
+    def _validated_conversion_many(
+        self, values: list[Any]
+    ) -> tuple[list[bool], list[str]]:
+        valid, converted = super()._validated_conversion_many(values)
+        default = self.get_default()
+        from email_validator import EmailNotValidError, validate_email
+
+        # validate_email() is expensive, each distinct value is validated only
+        # once and values without any @ are rejected upfront:
+        email_valid: dict[str, bool] = {}
+        for index, value in enumerate(values):
+            if not valid[index]:
+                continue
+            if value not in email_valid:
+                if '@' not in value:
+                    email_valid[value] = False
+                else:
+                    try:
+                        validate_email(value, check_deliverability=False)
+                        email_valid[value] = True
+                    except EmailNotValidError:
+                        email_valid[value] = False
+            if not email_valid[value]:
+                valid[index] = False
+                converted[index] = default
+        return valid, converted
+
 
 class SettingPassword(SettingString):
     '''Setting for passwords
@@ -90,6 +161,8 @@ class SettingPassword(SettingString):
     Default minimum password length is 6.
     '''
 
+    __slots__ = ()
+
     @dataclass
     class Options(Setting.Options):
         '''Options for SettingText'''
@@ -101,6 +174,7 @@ class SettingPassword(SettingString):
         display_options = Setting.Options.display_options + ['display_masked']
 
     options: Options
+    _options: Options
 
     @classmethod
     def get_supported_types(cls) -> list[type | str]:
@@ -110,12 +184,25 @@ class SettingPassword(SettingString):
         if not super()._validated_conversion(value)[0]:
             return False, self.get_default()
         # only length check:
-        if self.options.min_length > 0 and len(value) < self.options.min_length:
+        if self._options.min_length > 0 and len(value) < self._options.min_length:
             return False, self.get_default()
             # TODO: Error message handling should be better. The specific
             # validate should tell what exactly failed.
         return True, value
 
+    def _validated_conversion_many(
+        self, values: list[Any]
+    ) -> tuple[list[bool], list[str]]:
+        valid, converted = super()._validated_conversion_many(values)
+        min_length = self._options.min_length
+        if min_length > 0:
+            default = self.get_default()
+            for index, value in enumerate(converted):
+                if valid[index] and len(value) < min_length:
+                    valid[index] = False
+                    converted[index] = default
+        return valid, converted
+
 
 def validated_conversion_configparser(
     string: str, res_type: Type[_BaseTypeT], default: _BaseTypeT
@@ -158,6 +245,8 @@ def validated_conversion_configparser(
 class SettingBool(Setting[bool]):
     '''Setting for booleans'''
 
+    __slots__ = ()
+
     @classmethod
     def get_supported_types(cls) -> list[type | str]:
         return ['boolean', bool, 'bool']
@@ -177,6 +266,27 @@ class SettingBool(Setting[bool]):
             return validated_conversion_configparser(value, bool, self.get_default())
         return False, self.get_default()
 
+    def _validated_conversion_many(
+        self, values: list[Any]
+    ) -> tuple[list[bool], list[bool]]:
+        # Strings are converted like validated_conversion_configparser() but
+        # without constructing a ConfigParser for each value:
+        states = configparser.ConfigParser.BOOLEAN_STATES
+        default = self.get_default()
+        valid = []
+        converted = []
+        for value in values:
+            if isinstance(value, (int, float)):
+                valid.append(True)
+                converted.append(bool(value))
+                continue
+            state = None
+            if isinstance(value, str) and '\n' not in value:
+                state = states.get(value.strip().lower())
+            valid.append(state is not None)
+            converted.append(default if state is None else state)
+        return valid, converted
+
     def to_string(self) -> str:
         return '1' if self._value else '0'
 
@@ -184,6 +294,8 @@ class SettingBool(Setting[bool]):
 class SettingInt(Setting[int]):
     '''Setting for Integers'''
 
+    __slots__ = ()
+
     @classmethod
     def get_supported_types(cls) -> list[type | str]:
         return ['integer', int, 'int']
@@ -199,10 +311,43 @@ class SettingInt(Setting[int]):
             return validated_conversion_configparser(value, int, self.get_default())
         return False, self.get_default()
 
+    def convert_many(self, values: Iterable[Any]) -> tuple[list[bool], list[int]]:
+        # integer arrays do not need any per value check:
+        numeric = _numeric_array_to_list(values, 'iu')
+        if numeric is not None:
+            return [True] * len(numeric), numeric
+        return super().convert_many(values)
+
+    def _validated_conversion_many(
+        self, values: list[Any]
+    ) -> tuple[list[bool], list[int]]:
+        # Strings are converted like validated_conversion_configparser() but
+        # without constructing a ConfigParser for each value:
+        default = self.get_default()
+        valid = []
+        converted = []
+        for value in values:
+            if isinstance(value, int):
+                valid.append(True)
+                converted.append(int(value))
+                continue
+            if isinstance(value, str) and '\n' not in value:
+                try:
+                    converted.append(int(value))
+                    valid.append(True)
+                    continue
+                except ValueError:
+                    pass
+            valid.append(False)
+            converted.append(default)
+        return valid, converted
+
 
 class SettingFloat(Setting[float]):
     '''Setting for Float'''
 
+    __slots__ = ()
+
     @classmethod
     def get_supported_types(cls) -> list[type | str]:
         return ['float', float]
@@ -218,6 +363,37 @@ class SettingFloat(Setting[float]):
             return validated_conversion_configparser(value, float, self.get_default())
         return False, self.get_default()
 
+    def convert_many(self, values: Iterable[Any]) -> tuple[list[bool], list[float]]:
+        # numeric arrays do not need any per value check:
+        numeric = _numeric_array_to_list(values, 'iuf')
+        if numeric is not None:
+            return [True] * len(numeric), [float(value) for value in numeric]
+        return super().convert_many(values)
+
+    def _validated_conversion_many(
+        self, values: list[Any]
+    ) -> tuple[list[bool], list[float]]:
+        # Strings are converted like validated_conversion_configparser() but
+        # without constructing a ConfigParser for each value:
+        default = self.get_default()
+        valid = []
+        converted = []
+        for value in values:
+            if isinstance(value, (float, int)):
+                valid.append(True)
+                converted.append(float(value))
+                continue
+            if isinstance(value, str) and '\n' not in value:
+                try:
+                    converted.append(float(value))
+                    valid.append(True)
+                    continue
+                except ValueError:
+                    pass
+            valid.append(False)
+            converted.append(default)
+        return valid, converted
+
 
 # TODO: add a SettingBase64 which is deriving from Setting[byte]. Default
 # should be b''. Supported types are 'base64' and 'Base64' but NOT byte. The
@@ -236,6 +412,8 @@ class SettingBase64(Setting[bytes]):
         length. Default is 0 which disables size checking.
     '''
 
+    __slots__ = ()
+
     @dataclass
     class Options(Setting.Options):
         '''Options for SettingBase64'''
@@ -244,6 +422,7 @@ class SettingBase64(Setting[bytes]):
         value_options = Setting.Options.value_options + ['size']
 
     options: Options
+    _options: Options
 
     @classmethod
     def get_supported_types(cls) -> list[type | str]:
@@ -257,7 +436,7 @@ class SettingBase64(Setting[bytes]):
         # Accept raw bytes/bytearray directly
         if isinstance(value, (bytes, bytearray)):
             data = bytes(value)
-            if self.options.size > 0 and len(data) != self.options.size:
+            if self._options.size > 0 and len(data) != self._options.size:
                 return False, self.get_default()
             return True, data
 
@@ -269,13 +448,39 @@ class SettingBase64(Setting[bytes]):
                 decoded = base64.b64decode(cleaned, validate=True)
             except (binascii.Error, ValueError):
                 return False, self.get_default()
-            if self.options.size > 0 and len(decoded) != self.options.size:
+            if self._options.size > 0 and len(decoded) != self._options.size:
                 return False, self.get_default()
             return True, decoded
 
         # Not acceptable
         return False, self.get_default()
 
+    def _validated_conversion_many(
+        self, values: list[Any]
+    ) -> tuple[list[bool], list[bytes]]:
+        default = self.get_default()
+        size = self._options.size
+        b64decode = base64.b64decode
+        valid = []
+        converted = []
+        for value in values:
+            if isinstance(value, (bytes, bytearray)):
+                data = bytes(value)
+            elif isinstance(value, str):
+                try:
+                    data = b64decode(''.join(value.split()), validate=True)
+                except (binascii.Error, ValueError):
+                    data = None
+            else:
+                data = None
+            if data is None or (size > 0 and len(data) != size):
+                valid.append(False)
+                converted.append(default)
+            else:
+                valid.append(True)
+                converted.append(data)
+        return valid, converted
+
     def to_string(self) -> str:
         # Return base64 representation of stored bytes
         return base64.b64encode(self._value).decode('ascii')
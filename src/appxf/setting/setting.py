@@ -14,7 +14,9 @@ from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
 from typing import Any, Generic, TypeVar
 
 from appxf import Options, Stateful
@@ -241,8 +243,11 @@ class _SettingMeta(type):
         )
 
         if base_setting_type is None:
-            # this is a normal setting
-            return setting_type(value=value, name=name, **kwargs)
+            # this is a normal setting - an empty name is the default and not
+            # passed to keep the shared default options (see Setting.options):
+            if name:
+                kwargs['name'] = name
+            return setting_type(value=value, **kwargs)
         else:
             # this is a setting extension and we need to prepare the kwarg
             # options for extended settings and the settings.
@@ -382,10 +387,83 @@ class SettingOptions(Options):
         )
 
 
+@dataclass(eq=False)
+class SettingChange:
+    '''Change notification for subscribers (see Setting.subscribe())
+
+    Changes of a single Setting only provide the setting. For SettingDict, the
+    keys are reported that changed (value or replaced setting), were added or
+    were removed. A SettingDict change without any keys is a change of the
+    SettingDict as a whole (like sorting).
+    '''
+
+    setting: Setting
+    changed: set[str] = field(default_factory=set)
+    added: set[str] = field(default_factory=set)
+    removed: set[str] = field(default_factory=set)
+
+    def merge(self, other: SettingChange):
+        '''Coalesce a subsequent change into this change'''
+        for key in other.added:
+            if key in self.removed:
+                # removed and added again is a replacement:
+                self.removed.discard(key)
+                self.changed.add(key)
+            else:
+                self.added.add(key)
+        for key in other.removed:
+            self.changed.discard(key)
+            if key in self.added:
+                # added and removed again is no change at all:
+                self.added.discard(key)
+            else:
+                self.removed.add(key)
+        self.changed.update(other.changed - self.added)
+
+
+class _Subscription:
+    '''Subscribers of a Setting including the batch_changes() state'''
+
+    __slots__ = ('callbacks', 'batch_depth', 'pending')
+
+    def __init__(self):
+        self.callbacks: list[Callable[[SettingChange], None]] = []
+        self.batch_depth = 0
+        self.pending: SettingChange | None = None
+
+
 # Setting uses the ValueType below in it's implementation to allow appropriate
 # type hints for get_default() and value.
 _BaseTypeT = TypeVar('_BaseTypeT', bound=object)
 
+# Settings constructed without any option share one default Options object per
+# Options class (see Setting.options). The mapping also caches the option field
+# names to detect option arguments in kwargs.
+_shared_default_options: dict[type, tuple[SettingOptions, frozenset[str]]] = {}
+
+
+class _InputIsValue:
+    '''Singleton type for _INPUT_IS_VALUE that survives copy and pickle'''
+
+    def __repr__(self) -> str:
+        return '_INPUT_IS_VALUE'
+
+    def __reduce__(self) -> str:
+        # pickle the module level instance by its name
+        return '_INPUT_IS_VALUE'
+
+    def __copy__(self) -> _InputIsValue:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> _InputIsValue:
+        return self
+
+
+# Marker for Setting._input if the input is the value object itself. This
+# avoids maintaining two references for the (typical) case that no conversion
+# was necessary.
+_INPUT_IS_VALUE = _InputIsValue()
+
 
 class Setting(Generic[_BaseTypeT], Stateful, metaclass=_SettingMetaMerged):
     '''Abstract base class for settings
@@ -409,8 +487,15 @@ class Setting(Generic[_BaseTypeT], Stateful, metaclass=_SettingMetaMerged):
         str(self._value) which may not be the expected behavior.
 
     You do not need to provide anything else, including __init__.
+
+    Settings are commonly held in large numbers (like entries of a
+    SettingDict). The per-instance footprint is therefore kept small by
+    __slots__. Deriving classes that do not define __slots__ will fall back to
+    a __dict__ as usual.
     '''
 
+    __slots__ = ('_options', '_input', '_value', '_subscription')
+
     # Bring ExportOptions and Options directly in scope of the Setting class
     # such that they are always available with the Setting class (no extra
     # import).
@@ -419,9 +504,11 @@ class Setting(Generic[_BaseTypeT], Stateful, metaclass=_SettingMetaMerged):
 
     def __init__(self, value: _BaseTypeT | None = None, **kwargs):
         super().__init__(**kwargs)
+        # subscriptions are only maintained when used (see subscribe()):
+        self._subscription: _Subscription | None = None
         # consume kwargs into options/gui_options - must apply before applying
         # the value since options typically affect the validation:
-        self.options = self.Options.new_from_kwarg(kwargs)
+        self._options = self._new_options_from_kwarg(kwargs)
         # throw error for anything that is left over - cannot do this anymore
         # after SettingDict now also being a Setting: MRO cooperative
         # inheritance may have kwargs that are meant for another class in the
@@ -431,10 +518,10 @@ class Setting(Generic[_BaseTypeT], Stateful, metaclass=_SettingMetaMerged):
         # TODO #28: reactivate the kwarg checking.
 
         if value is None:
-            self._input = self.get_default()
+            self._input = _INPUT_IS_VALUE
             self._value = self.get_default()
         else:
-            if self.options.mutable:
+            if self._options.mutable:
                 self.value = value
             else:
                 # bypass mutable being False during initialization:
@@ -447,14 +534,61 @@ class Setting(Generic[_BaseTypeT], Stateful, metaclass=_SettingMetaMerged):
             # classes may overwrite only the toplevel property setter (example:
             # SettingDict)
 
+    @classmethod
+    def _new_options_from_kwarg(cls, kwargs: dict[str, Any]) -> SettingOptions:
+        '''Consume options from kwargs like Options.new_from_kwarg()
+
+        If kwargs do not contain any option, the shared default Options object
+        of the Options class is returned.
+        '''
+        shared = _shared_default_options.get(cls.Options)
+        if shared is None:
+            shared = (
+                cls.Options(),
+                frozenset(field.name for field in fields(cls.Options)),
+            )
+            _shared_default_options[cls.Options] = shared
+        if 'options' in kwargs or not shared[1].isdisjoint(kwargs):
+            return cls.Options.new_from_kwarg(kwargs)
+        return shared[0]
+
+    @property
+    def options(self) -> SettingOptions:
+        '''Options of the Setting
+
+        Settings that were constructed without options share a default Options
+        object. Since Options are mutable, the setting obtains an own Options
+        object on first access (copy-on-write).
+        '''
+        options = self._options
+        shared = _shared_default_options.get(type(options))
+        if shared is not None and options is shared[0]:
+            # The shared object is never altered and equals a default
+            # constructed one:
+            options = type(options)()
+            self._options = options
+        return options
+
+    @options.setter
+    def options(self, options: SettingOptions):
+        self._options = options
+
     # ##################
     # Stateful Related
     # /
     def get_state(self, **kwarg) -> dict:
         export_options = self.ExportOptions.new_from_kwarg(kwarg)
         self.ExportOptions.raise_error_on_non_empty_kwarg(kwarg)
+        return self._get_state_resolved(export_options)
 
-        options: OrderedDict = self.options.get_state(options=export_options)
+    def _get_state_resolved(self, export_options: SettingExportOptions) -> dict:
+        '''get_state() with already resolved export options
+
+        SettingDict exports nested settings by this function to resolve the
+        export options only once for the whole tree. Deriving classes that
+        need to adapt get_state() should overload this function.
+        '''
+        options: OrderedDict = self._options.get_state(options=export_options)
         out = OrderedDict()
         # 1) type should come before anything else
         if export_options.type:
@@ -522,6 +656,8 @@ class Setting(Generic[_BaseTypeT], Stateful, metaclass=_SettingMetaMerged):
     @property
     def input(self) -> _BaseTypeT | str:
         '''Original input when storing a value'''
+        if self._input is _INPUT_IS_VALUE:
+            return self._value
         return self._input
 
     @property
@@ -531,8 +667,8 @@ class Setting(Generic[_BaseTypeT], Stateful, metaclass=_SettingMetaMerged):
 
     @value.setter
     def value(self, value: Any):
-        if not self.options.mutable:
-            name = '(' + self.options.name + ')' if self.options.name else '(no name)'
+        if not self._options.mutable:
+            name = '(' + self._options.name + ')' if self._options.name else '(no name)'
             raise AppxfSettingError(
                 f'{self.__class__.__name__}{name} is set to be not mutable.'
             )
@@ -548,8 +684,83 @@ class Setting(Generic[_BaseTypeT], Stateful, metaclass=_SettingMetaMerged):
             valid, _value = self._validated_conversion(value)
             if not valid:
                 raise AppxfSettingConversionError(type(self), value)
-        self._input = value
+        # subscribers are only notified if something actually changed:
+        changed = self._subscription is not None and (
+            self.input != value or self._value != _value
+        )
+        self._input = _INPUT_IS_VALUE if value is _value else value
         self._value = _value
+        if changed:
+            self._notify(SettingChange(self))
+
+    # ######################/
+    #  Change Notification
+    # /
+    def subscribe(self, callback: Callable[[SettingChange], None]):
+        '''Subscribe to changes of this Setting
+
+        The callback is called with a SettingChange after the value changed.
+        For SettingDict, this includes added, removed or replaced settings as
+        well as value changes of maintained settings. Changes within
+        batch_changes() are coalesced into one notification.
+        '''
+        if self._subscription is None:
+            self._subscription = _Subscription()
+        self._subscription.callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[SettingChange], None]):
+        '''Remove a callback added by subscribe()'''
+        subscription = self._subscription
+        if subscription is None or callback not in subscription.callbacks:
+            raise AppxfSettingError(
+                f'{self.__class__.__name__}({self._options.name}) does not '
+                f'have the callback {callback} subscribed.'
+            )
+        subscription.callbacks.remove(callback)
+        if not subscription.callbacks and not subscription.batch_depth:
+            self._subscription = None
+
+    def has_subscribers(self) -> bool:
+        '''Any callback is subscribed to changes of this Setting'''
+        return self._subscription is not None and bool(self._subscription.callbacks)
+
+    @contextmanager
+    def batch_changes(self) -> Iterator[None]:
+        '''Coalesce change notifications
+
+        Changes within the context are collected and subscribers are notified
+        once with the aggregated change when leaving the outermost context.
+        Without subscribers, the context does not do anything.
+        '''
+        subscription = self._subscription
+        if subscription is None:
+            yield
+            return
+        subscription.batch_depth += 1
+        try:
+            yield
+        finally:
+            subscription.batch_depth -= 1
+            if not subscription.batch_depth:
+                change, subscription.pending = subscription.pending, None
+                if not subscription.callbacks:
+                    self._subscription = None
+                elif change is not None:
+                    self._notify(change)
+
+    def _notify(self, change: SettingChange):
+        '''Notify subscribers or collect change within batch_changes()'''
+        subscription = self._subscription
+        if subscription is None:
+            return
+        if subscription.batch_depth:
+            if subscription.pending is None:
+                subscription.pending = change
+            else:
+                subscription.pending.merge(change)
+            return
+        for callback in list(subscription.callbacks):
+            callback(change)
 
     def validate(self, value: Any) -> bool:
         '''Validate a string to match the Setting type'''
@@ -558,10 +769,51 @@ class Setting(Generic[_BaseTypeT], Stateful, metaclass=_SettingMetaMerged):
         # rely on the _validated_convertion.
         return self._validated_conversion(value)[0]
 
+    def validate_many(self, values: Iterable[Any]) -> list[bool]:
+        '''Validate many values at once
+
+        Result is like validate() for each value. See convert_many().
+        '''
+        return self.convert_many(values)[0]
+
+    def convert_many(
+        self, values: Iterable[Any]
+    ) -> tuple[list[bool], list[_BaseTypeT]]:
+        '''Validate and convert many values at once
+
+        The validation and conversion is the same as for validate() but
+        Setting implementations reduce the per value overhead. It is intended
+        for importing larger data sets (like a column of a spreadsheet) into
+        settings of the same type and options. NumPy arrays or pandas Series
+        are handled by their python builtin values (tolist()).
+
+        Returns:
+            1) List of check results (success mask)
+            2) List of converted values, the default value for failed checks
+        '''
+        if hasattr(values, 'dtype') and hasattr(values, 'tolist'):
+            values = values.tolist()  # type: ignore
+        elif not isinstance(values, list):
+            values = list(values)
+        return self._validated_conversion_many(values)
+
     # Note: neither validate nor _validated_conversion can be class methods.
     # They may rely on instance specific configurations (like in select
     # settings)
 
+    def _validated_conversion_many(
+        self, values: list[Any]
+    ) -> tuple[list[bool], list[_BaseTypeT]]:
+        '''Validate and convert a list of values
+
+        Implementation behind convert_many(). The default applies
+        _validated_conversion() for each value. Setting implementations may
+        overload for efficiency but must provide the same results.
+        '''
+        conversion = self._validated_conversion
+        results = [conversion(value) for value in values]
+        return [result[0] for result in results], [result[1] for result in results]
+
     def _validated_conversion(self, value: Any) -> tuple[bool, _BaseTypeT]:
         '''Validate a string to match the Setting's expectations
 
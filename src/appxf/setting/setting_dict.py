@@ -16,7 +16,12 @@ from typing import Any, Callable
 
 from appxf.storage import RamStorage, Storable, Storage
 
-from .setting import AppxfSettingConversionError, AppxfSettingError, Setting
+from .setting import (
+    AppxfSettingConversionError,
+    AppxfSettingError,
+    Setting,
+    SettingChange,
+)
 
 
 class AppxfSettingWarning(Warning):
@@ -142,6 +147,9 @@ class SettingDict(Setting[dict], Storable, MutableMapping[str, Setting]):
         # rely on it. Since SettingDict is also a Setting, it must be stored as
         # _value:
         self._value: OrderedDict[Any, Setting] = OrderedDict()
+        # callbacks subscribed to maintained settings while this SettingDict
+        # has subscribers (see subscribe()):
+        self._setting_callbacks: dict[str, Callable[[SettingChange], None]] = {}
         # initialize parents
         super().__init__(storage=storage, **kwargs)
 
@@ -244,6 +252,7 @@ class SettingDict(Setting[dict], Storable, MutableMapping[str, Setting]):
     # key {key} with following error message from the Setting class. "
 
     def __setitem__(self, key, value) -> None:
+        previous = self._value.get(key) if isinstance(key, str) else None
         try:
             self._set_item(key, value)
         except (AppxfSettingError, AppxfSettingConversionError) as err:
@@ -251,10 +260,12 @@ class SettingDict(Setting[dict], Storable, MutableMapping[str, Setting]):
                 f'Cannot set {key} in SettingDict({self.options.name}). '
                 f'You provided value {value} of type {value.__class__}.'
             ) from err
+        self._setting_replaced(key, previous)
 
     def __delitem__(self, key):
         if self.options.mutable:
-            del self._value[key]
+            previous = self._value.pop(key)
+            self._setting_replaced(key, previous)
         else:
             raise AppxfSettingError(
                 f'SettingDict({self.options.name}) '
@@ -272,6 +283,50 @@ class SettingDict(Setting[dict], Storable, MutableMapping[str, Setting]):
         self._value = OrderedDict(
             sorted(self._value.items(), key=lambda item: item[0], reverse=reverse)
         )
+        self._notify(SettingChange(self))
+
+    # ## Change Notification
+
+    def subscribe(self, callback: Callable[[SettingChange], None]):
+        # Value changes of maintained settings are only observed while this
+        # SettingDict has subscribers:
+        if not self.has_subscribers():
+            for key in self._value:
+                self._subscribe_setting(key)
+        super().subscribe(callback)
+
+    def unsubscribe(self, callback: Callable[[SettingChange], None]):
+        super().unsubscribe(callback)
+        if not self.has_subscribers():
+            for key, setting_callback in self._setting_callbacks.items():
+                self._value[key].unsubscribe(setting_callback)
+            self._setting_callbacks = {}
+
+    def _subscribe_setting(self, key: str):
+        def setting_callback(change: SettingChange):
+            self._notify(SettingChange(self, changed={key}))
+
+        self._value[key].subscribe(setting_callback)
+        self._setting_callbacks[key] = setting_callback
+
+    def _setting_replaced(self, key: str, previous: Setting | None):
+        '''Handle subscriptions and notify after adding, removing or replacing
+        the setting for key'''
+        if self._subscription is None:
+            return
+        current = self._value.get(key)
+        if current is previous:
+            return
+        if key in self._setting_callbacks:
+            previous.unsubscribe(self._setting_callbacks.pop(key))  # type: ignore
+        if current is not None and self.has_subscribers():
+            self._subscribe_setting(key)
+        if previous is None:
+            self._notify(SettingChange(self, added={key}))
+        elif current is None:
+            self._notify(SettingChange(self, removed={key}))
+        else:
+            self._notify(SettingChange(self, changed={key}))
 
     # ## Storage Behavior
 
@@ -291,22 +346,31 @@ class SettingDict(Setting[dict], Storable, MutableMapping[str, Setting]):
             kwargs['options'] = options
             export_options = self.ExportOptions.new_from_kwarg(kwarg_dict=kwargs)
         Setting.ExportOptions.raise_error_on_non_empty_kwarg(kwargs)
+        return self._get_state_resolved(export_options)
+
+    def _get_state_resolved(self, export_options: Setting.ExportOptions) -> object:
+        # The export options are resolved only once in get_state() and reused
+        # for all nested settings. Settings that are exported with their value
+        # only are written directly without intermediate get_state() output.
+        values_only = not (
+            export_options.name
+            or export_options.type
+            or export_options.value_options
+            or export_options.display_options
+            or export_options.control_options
+        )
 
         # build up the settings part (value field in normal settings):
         settings = OrderedDict()
         for key, setting in self._value.items():
-            this_data = setting.get_state(options=export_options)
-            # strip name if name is key - to avoid cluttering output by
-            # maintaining the name twice.
-            if (
-                isinstance(this_data, OrderedDict)
-                and 'name' in this_data
-                and this_data['name'] == key
-            ):
-                this_data.pop('name')
             # there are some specialties for dictionary handling (value field
             # is a dict):
             if isinstance(setting, SettingDict):
+                this_data = setting._get_state_resolved(export_options)
+                # strip name if name is key - to avoid cluttering output by
+                # maintaining the name twice.
+                if 'name' in this_data and this_data['name'] == key:
+                    this_data.pop('name')
                 # top-level SettingDict get_state() must have '_version' field
                 # but dict of dict shall not have it. If must be removed in
                 # this loop:
@@ -322,7 +386,21 @@ class SettingDict(Setting[dict], Storable, MutableMapping[str, Setting]):
                         this_data = OrderedDict(
                             {'type': self.get_type(), '_settings': this_data}
                         )
+            elif (
+                values_only
+                and type(setting)._get_state_resolved is Setting._get_state_resolved
+            ):
+                # simplified JSON export (see below) of the value field:
+                this_data = setting.input
             else:
+                this_data = setting._get_state_resolved(export_options)
+                # strip name if name is key (see above):
+                if (
+                    isinstance(this_data, OrderedDict)
+                    and 'name' in this_data
+                    and this_data['name'] == key
+                ):
+                    this_data.pop('name')
                 # only if value is not a dict, the value field is stripped
                 # (simplified JSON export) if it's the only field:
                 if list(this_data.keys()) == ['value']:
@@ -332,13 +410,11 @@ class SettingDict(Setting[dict], Storable, MutableMapping[str, Setting]):
         # settings are not yet put into data - this will depend on the point
         # whether the dictionary to export does have further options..
         #
-        # ..and for options, we rely on get_state() from Setting implementation
-        option_data = super().get_state(options=export_options)
-        # the value included in there must be removed again (already handled
-        # above):
-        option_data.pop('value', None)
-        # type shall not be exported on the top-level:
-        option_data.pop('type', None)
+        # ..and for options, we rely on the options get_state() like the
+        # Setting implementation. Value and type are not needed: the value is
+        # already handled above and type shall not be exported on the
+        # top-level.
+        option_data = self._options.get_state(options=export_options)
 
         if not option_data:
             # simple output:
@@ -353,6 +429,13 @@ class SettingDict(Setting[dict], Storable, MutableMapping[str, Setting]):
 
     def set_state(
         self, data: Mapping, options: SettingDict.ExportOptions | None = None, **kwargs
+    ):
+        # subscribers are notified once for the whole state:
+        with self.batch_changes():
+            self._set_state(data, options=options, **kwargs)
+
+    def _set_state(
+        self, data: Mapping, options: SettingDict.ExportOptions | None = None, **kwargs
     ):
         # handle export options:
         if options is None:
@@ -414,7 +497,7 @@ class SettingDict(Setting[dict], Storable, MutableMapping[str, Setting]):
 
             if export_options.remove_missing_keys:
                 for key in missing_keys:
-                    del self._value[key]
+                    self._setting_replaced(key, self._value.pop(key))
             # in either case, the key list to handle stuff must not include
             # those missing keys:
             key_list = key_list - missing_keys
@@ -463,6 +546,7 @@ class SettingDict(Setting[dict], Storable, MutableMapping[str, Setting]):
                         self._value[key] = Setting.new(settings[key]['type'])
                     # also restore setting name:
                     self._value[key].options.name = key
+                    self._setting_replaced(key, None)
             else:
                 # strip new keys from keys to be updated
                 key_list = key_list - new_keys
@@ -562,8 +646,9 @@ class SettingDict(Setting[dict], Storable, MutableMapping[str, Setting]):
                     )
 
         # validation already confirmed the input being a mapping
-        for key, setting in value.items():
-            self[key] = setting
+        with self.batch_changes():
+            for key, setting in value.items():
+                self[key] = setting
 
     # Input returns the same as value. Rationale: the actual input is in the
     # Setting objects and there is no apparent benefit to maintain anything on
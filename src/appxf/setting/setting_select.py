@@ -152,9 +152,9 @@ class SettingSelect(SettingExtension[_BaseSettingT, _BaseTypeT]):
             return True, self.select_map[value]
         return False, self.base_setting.get_default()
 
-    def get_state(self, **kwarg) -> dict:
+    def _get_state_resolved(self, export_options: Setting.ExportOptions) -> dict:
         # we export as defined in setting
-        out = super().get_state(**kwarg)
+        out = super()._get_state_resolved(export_options)
         # we have to export the select_map if either mutable_list or
         # mutable_items is True. Those options make the select_map part of the
         # user controlled values.
@@ -168,11 +168,15 @@ class SettingSelect(SettingExtension[_BaseSettingT, _BaseTypeT]):
         # SettingSelect, allowing no more fine grained control.
         if self.options.custom_value:
             if isinstance(out, dict):
-                out['base_setting'] = self.base_setting.get_state(**kwarg)
+                out['base_setting'] = self.base_setting._get_state_resolved(
+                    export_options
+                )
             else:
                 out = {
                     'value': out,
-                    'base_setting': self.base_setting.get_state(**kwarg),
+                    'base_setting': self.base_setting._get_state_resolved(
+                        export_options
+                    ),
                 }
         return out
 
@@ -0,0 +1,183 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Verified application startup
+
+Startup unlocks the Security object, loads the configuration and the Registry
+and receives the remote USER_DB. Steps that do not depend on each other run
+in parallel threads:
+
+    unlock ----------+--> registry --------+--> sync
+    config_plain     +--> config_secure    |
+    remote ---------------------------------+
+
+  * unlock: Security.unlock_user() (key derivation from the password)
+  * config_plain: config sections that are not stored via
+    SecurePrivateStorage, each section in it's own thread
+  * remote: check for the remote USER_DB (Registry.has_remote_user_db())
+  * registry: Registry.try_load() (USER_ID and USER_DB)
+  * config_secure: config sections stored via SecurePrivateStorage, each
+    section in it's own thread
+  * sync: Registry.sync_with_remote('receiving') if the registry is loaded and
+    the remote USER_DB exists
+
+The duration of each phase (from start of the phase until all of it's steps
+completed) is reported in seconds by run() and logged. Only failures of
+unlock are raised by run(). Failures of other steps (like an unavailable
+remote location) are logged and collected in Startup.errors such that the
+application can continue offline.
+'''
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from appxf import logging
+from appxf.config import Config
+from appxf.registry import Registry
+from appxf.security import SecurePrivateStorage, Security
+from appxf.setting import SettingDict
+from appxf.storage import Storage
+
+
+class Startup:
+    '''Unlock and load application objects with overlapping steps'''
+
+    log = logging.getLogger(__name__ + '.Startup')
+
+    def __init__(
+        self,
+        security: Security,
+        config: Config | None = None,
+        registry: Registry | None = None,
+        sync: bool = True,
+        max_workers: int | None = None,
+    ):
+        '''Create startup for the provided objects
+
+        Keyword Arguments:
+            security -- Security object to unlock
+            config -- Config with sections to load (existing ones)
+            registry -- Registry to load
+            sync -- receive the remote USER_DB after loading the registry
+            max_workers -- maximum number of threads
+        '''
+        self._security = security
+        self._config = config
+        self._registry = registry
+        self._sync = sync
+        self._max_workers = max_workers
+        self.timings: dict[str, float] = {}
+        # first exception per phase, except for unlock:
+        self.errors: dict[str, Exception] = {}
+
+    def run(self, password: str | None = None) -> dict[str, float]:
+        '''Run startup and return the timings per phase
+
+        The password is only required if security is not yet unlocked.
+        Exceptions from unlocking (like a wrong password) are raised after the
+        parallel steps completed. Encrypted data is not loaded in this case.
+        Exceptions of other steps are not raised, see errors.
+        '''
+        self.timings = {}
+        self.errors = {}
+        start = time.perf_counter()
+        plain_sections, secure_sections = self._split_sections()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            unlock = executor.submit(self._unlock, password)
+            plain = [
+                executor.submit(self._load_section, section)
+                for section in plain_sections
+            ]
+            remote = None
+            if self._registry is not None and self._sync:
+                remote = executor.submit(self._check_remote)
+
+            unlock_end = unlock.result()
+            self.timings['unlock'] = unlock_end - start
+            registry = None
+            if self._registry is not None:
+                registry = executor.submit(self._load_registry)
+            secure = [
+                executor.submit(self._load_section, section)
+                for section in secure_sections
+            ]
+
+            self._set_timing('config_plain', start, plain)
+            remote_available = False
+            if remote is not None:
+                remote_result = self._get_result('remote', remote)
+                if remote_result is not None:
+                    remote_available, remote_end = remote_result
+                    self.timings['remote'] = remote_end - start
+            loaded = False
+            if registry is not None:
+                loaded = bool(self._get_result('registry', registry))
+                self.timings['registry'] = time.perf_counter() - unlock_end
+            self._set_timing('config_secure', unlock_end, secure)
+
+        if loaded and remote_available:
+            sync_start = time.perf_counter()
+            try:
+                self._registry.sync_with_remote(mode='receiving')  # type: ignore
+                self.timings['sync'] = time.perf_counter() - sync_start
+            except Exception as e:
+                self._add_error('sync', e)
+        self.timings['total'] = time.perf_counter() - start
+        self.log.info(
+            'Startup timings: %s',
+            ', '.join(f'{phase}={value:.3f}s' for phase, value in self.timings.items()),
+        )
+        return self.timings
+
+    def _set_timing(self, phase: str, start: float, futures: list[Future]):
+        # (waits for the steps)
+        ends = [self._get_result(phase, future) for future in futures]
+        ends = [end for end in ends if end is not None]
+        if ends:
+            self.timings[phase] = max(ends) - start
+
+    def _get_result(self, phase: str, future: Future):
+        '''Result of a step, None if the step failed (see errors)'''
+        try:
+            return future.result()
+        except Exception as e:
+            self._add_error(phase, e)
+            return None
+
+    def _add_error(self, phase: str, error: Exception):
+        self.log.warning(f'Startup step {phase} failed: {error}', exc_info=error)
+        self.errors.setdefault(phase, error)
+
+    def _unlock(self, password: str | None) -> float:
+        if not self._security.is_user_unlocked():
+            self._security.unlock_user(password)
+        return time.perf_counter()
+
+    def _check_remote(self) -> tuple[bool, float]:
+        assert self._registry is not None
+        return self._registry.has_remote_user_db(), time.perf_counter()
+
+    def _load_registry(self) -> bool:
+        assert self._registry is not None
+        return self._registry.try_load()
+
+    @staticmethod
+    def _load_section(section: SettingDict) -> float:
+        if section.exists():
+            section.load()
+        return time.perf_counter()
+
+    def _split_sections(self) -> tuple[list[SettingDict], list[SettingDict]]:
+        '''Split config sections by requiring the security keys'''
+        plain: list[SettingDict] = []
+        secure: list[SettingDict] = []
+        if self._config is None:
+            return plain, secure
+        for name in self._config.sections:
+            section = self._config.section(name)
+            storage: Storage | None = section._storage
+            while storage is not None and not isinstance(storage, SecurePrivateStorage):
+                storage = storage.base_storage
+            (plain if storage is None else secure).append(section)
+        return plain, secure
@@ -22,6 +22,10 @@ class Stateful:
         attribute_mask: attributes that should not be exported or imported
     '''
 
+    # Stateful does not add any instance attributes. The empty __slots__ allow
+    # deriving classes to define __slots__ (see Setting).
+    __slots__ = ()
+
     # init with kwargs is required to allow coorperative inheritance via
     # super().__init__(**kwargs).
     def __init__(self, **kwargs):
@@ -2,6 +2,10 @@
 # SPDX-License-Identifier: Apache-2.0
 '''Facade for APPXF storage module'''
 
+from typing import TYPE_CHECKING
+
+from appxf._lazy import lazy_attributes
+
 # Abstract/General Classes
 from .serializer import Serializer
 from .storable import Storable, AppxfStorableError
@@ -15,16 +19,29 @@ from .serializer_json import JsonSerializer
 from .storage_to_bytes import StorageToBytes
 
 # Storage Implementations
-from .local import LocalStorage
-
-# from .ftp import FtpStorage
 from .ram import RamStorage
-
-# Buffer
-from .buffer import Buffer, buffered
+from .frozen import AppxfFrozenError, CopyOnWrite, freeze
+from .locking import AppxfStorageLockTimeout
 
 # Helpers
 from .meta_data import MetaData
 
-# Synchronization
-from .sync import sync
+# Synchronization (not loaded lazily since the sync module would shadow the
+# sync() function when imported directly)
+from .sync import async_sync, sync
+
+# Loaded on first access (see appxf._lazy):
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        'LocalStorage': '.local',
+        # 'FtpStorage': '.ftp',
+        'Buffer': '.buffer',
+        'buffered': '.buffer',
+        'BufferStats': '.buffer',
+        'register_key_hook': '.buffer',
+    },
+)
+if TYPE_CHECKING:
+    from .buffer import Buffer, BufferStats, buffered, register_key_hook
+    from .local import LocalStorage
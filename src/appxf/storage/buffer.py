@@ -1,12 +1,20 @@
 # Copyright 2023-2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 import functools
+import hashlib
+import inspect
 import pickle
+import sys
+import threading
+import time
 import typing
+from collections import OrderedDict
 from copy import deepcopy
+from dataclasses import dataclass
 
 from appxf import logging
-from appxf.storage import RamStorage, Storable, Storage
+from appxf.storage import AppxfStorableError, RamStorage, Storable, Storage
 
 log = logging.getLogger(__name__)
 
@@ -17,6 +25,38 @@ log = logging.getLogger(__name__)
 # usable, this buffer remains undocumented.
 
 
+@dataclass
+class BufferStats:
+    '''Statistics of a Buffer (see Buffer.stats)'''
+
+    hits: int = 0
+    misses: int = 0
+    # entries removed to stay within max_entries/max_bytes:
+    evictions: int = 0
+    # entries removed since their TTL passed:
+    expirations: int = 0
+
+
+class _BufferEntry:
+    '''Book keeping for a single buffered value'''
+
+    __slots__ = ('timestamp', 'count', 'size', 'slot')
+
+    def __init__(self, timestamp: float, size: int = 0, slot: int = -1):
+        # time.time() of setting the value, used for TTL
+        self.timestamp = timestamp
+        # number of accesses, used for LFU eviction
+        self.count = 0
+        # estimated size in bytes, used for max_bytes
+        self.size = size
+        # storage_factory layout: number of the storage holding the value
+        self.slot = slot
+
+
+# storage_factory layout: value of an entry that is not yet loaded
+_NOT_LOADED = object()
+
+
 class Buffer(Storable):
     '''Helper to organize data buffering.
 
@@ -28,123 +68,559 @@ class Buffer(Storable):
 
     Implementation ensures that the data passed into and retrieved from the
     buffer is independent. Changes you do in the code does not affect the
-    buffered data.
+    buffered data. If you only buffer immutable values (or never change them),
+    set immutable_values=True to skip the copies.
+
+    By default, the whole buffer is stored into storage_handler. With a
+    storage_factory, each value is stored into it's own storage while the
+    storage 'index' only holds the keys. Values are then loaded on first
+    access and a change only stores the changed value and the index. Storages
+    of removed values are reused for new values and are emptied by compact()
+    which is also called on store() if most of them are unused.
+
+    Keyword Arguments:
+        storage_factory -- use per value storages instead of storage_handler
+        max_entries -- maximum number of buffered values (default: unbounded)
+        max_bytes -- maximum estimated size of all buffered values. The size
+            of a value is estimated by it's pickled size. (default: unbounded)
+        eviction -- 'lru' removes the least recently used, 'lfu' the least
+            frequently used values when a bound is exceeded (default: 'lru')
+        ttl -- time to live in seconds per what. Values older than the TTL are
+            not returned anymore. (default: no TTL)
+        flush_interval -- seconds between storing the buffer on changes. With
+            0, each change is stored immediately. With None, the buffer is only
+            stored on flush(). Changes that are not yet stored are lost if the
+            application ends without flush(). (default: 0)
+        immutable_values -- skip copies of values on set() and get()
+
+    Buffers are thread safe. Each buffer has it's own lock which is not held
+    while storing or while loading values of the storage_factory layout.
     '''
 
     log = logging.getLogger(f'{__name__}.Buffer')
 
-    def __init__(self, storage_handler: Storage = RamStorage(), **kwargs):
-
+    # compact() is applied on store() when more storages are unused than used
+    # and at least the following number of storages is unused:
+    compaction_min_unused = 16
+
+    def __init__(
+        self,
+        storage_handler: Storage = RamStorage(),
+        storage_factory: Storage.Factory | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        eviction: str = 'lru',
+        ttl: dict[str, float] | None = None,
+        flush_interval: float | None = 0,
+        immutable_values: bool = False,
+        **kwargs,
+    ):
+        if storage_factory is not None:
+            storage_handler = storage_factory('index')
         super().__init__(storage_handler, **kwargs)
-        self.buffer = dict()
+        if eviction not in ('lru', 'lfu'):
+            raise AppxfStorableError(
+                f'Eviction must be "lru" or "lfu", not "{eviction}"'
+            )
+        self.buffer: dict[str, dict[str, object]] = dict()
         self.initially_loaded = False
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.eviction = eviction
+        self.ttl: dict[str, float] = ttl if ttl is not None else {}
+        self.flush_interval = flush_interval
+        self.immutable_values = immutable_values
+        self.stats = BufferStats()
+        # entries in order of usage (least recently used first):
+        self._entries: OrderedDict[tuple[str, str], _BufferEntry] = OrderedDict()
+        self._bytes = 0
+        self._dirty = False
+        self._last_store = time.monotonic()
+        # storage_factory layout:
+        self._storage_factory = storage_factory
+        self._slot_storages: dict[int, Storage] = {}
+        self._unused_slots: list[int] = []
+        self._slot_count = 0
+        # entries with values not yet stored:
+        self._dirty_entries: set[tuple[str, str]] = set()
+        # guards the state above, store() snapshots the state under this lock
+        # and serializes the I/O with _store_lock:
+        self._lock = threading.RLock()
+        self._store_lock = threading.Lock()
+        # computations in progress by buffered(), guarded by _lock:
+        self._flights: dict[tuple[str, str], _Flight] = {}
+        self._async_flights: dict[tuple[int, str, str], asyncio.Future] = {}
 
     def ensure_loaded(self):
-        if not self.initially_loaded and self.exists():
+        if self.initially_loaded:
+            return
+        # set before loading since a later store() would otherwise cause a
+        # reload of the own state on next access:
+        self.initially_loaded = True
+        if self.exists():
             self.load()
-            self.initially_loaded = True
+
+    def _lookup(self, what: str, input: str) -> _BufferEntry | None:
+        '''Get book keeping entry of a valid (not expired) value'''
+        self.ensure_loaded()
+        entry = self._entries.get((what, input))
+        if entry is None:
+            return None
+        if what in self.ttl and time.time() - entry.timestamp > self.ttl[what]:
+            self._remove(what, input)
+            self.stats.expirations += 1
+            self._dirty = True
+            return None
+        return entry
 
     def isbuffered(self, what: str, input: str):
         '''Check if what/input is buffered'''
-        self.ensure_loaded()
-        if what in self.buffer.keys():
-            if input in self.buffer[what].keys():
-                return True
-        return False
+        with self._lock:
+            buffered = self._lookup(what, input) is not None
+        self._store_if_due()
+        return buffered
 
     def get(self, what, input=''):
         '''Get data from buffer for what(input).'''
-        self.ensure_loaded()
-        if not self.isbuffered(what, input):
+        with self._lock:
+            entry = self._lookup(what, input)
+            data = _NOT_LOADED if entry is None else self.buffer[what][input]
+            loading = entry is not None and data is _NOT_LOADED
+            if not loading:
+                self._count_access(what, input, entry, data)
+            slot = entry.slot if loading else -1
+        if loading:
+            # values of the storage_factory layout are loaded without holding
+            # the lock and applied if the entry did not change meanwhile:
+            record = self._load_record(slot)
+            with self._lock:
+                if self._entries.get((what, input)) is not entry:
+                    data = _NOT_LOADED
+                elif entry.slot == slot:
+                    data = self._get_value(what, input, entry, record)
+                else:
+                    data = self._get_value(what, input, entry)
+                self._count_access(what, input, entry, data)
+        self._store_if_due()
+        if data is _NOT_LOADED:
             return None
         self.log.debug(f'Retrieved buffer {what}({input})')
-        return deepcopy(self.buffer[what][input])
+        return self._copy_value(data)
+
+    def _count_access(
+        self, what: str, input: str, entry: _BufferEntry | None, data: object
+    ):
+        '''Update stats and usage order (call while holding the lock)'''
+        if data is _NOT_LOADED:
+            self.stats.misses += 1
+            return
+        self.stats.hits += 1
+        entry.count += 1
+        self._entries.move_to_end((what, input))
+
+    def _copy_value(self, data: object) -> object:
+        '''Copy of a value to be handed out, unless values are immutable'''
+        return data if self.immutable_values else deepcopy(data)
 
     def set(self, data, what, input=''):
         '''Set data to buffer for what(input).
 
         This will overwrite existing data.
         '''
+        data = self._copy_value(data)
+        size = self._estimate_size(data) if self.max_bytes is not None else 0
+        with self._lock:
+            self._set(data, what, input, size)
+        self._store_if_due()
+
+    def _set(self, data, what: str, input: str, size: int):
         self.ensure_loaded()
-        if what not in self.buffer.keys():
+        if (what, input) in self._entries:
+            self._remove(what, input)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.log.debug(f'Not buffering {what}({input}), exceeding max_bytes')
+            self._dirty = True
+            return
+        if what not in self.buffer:
             self.buffer[what] = dict()
-        self.buffer[what][input] = deepcopy(data)
-        self.store()
+        self.buffer[what][input] = data
+        entry = _BufferEntry(time.time(), size)
+        if self._storage_factory is not None:
+            entry.slot = self._get_unused_slot()
+            self._dirty_entries.add((what, input))
+        self._entries[(what, input)] = entry
+        self._bytes += size
+        self._evict(keep=(what, input))
+        self._dirty = True
         self.log.info(f'Buffered {what}({input})')
 
     def clear(self, what=''):
-        self.ensure_loaded()
-        if what and what in self.buffer:
-            self.buffer[what] = dict()
-        elif not what:
-            self.buffer = dict()
+        with self._lock:
+            self.ensure_loaded()
+            if what and what in self.buffer:
+                for input in list(self.buffer[what]):
+                    self._remove(what, input)
+                self.buffer[what] = dict()
+            elif not what:
+                for key in list(self._entries):
+                    self._remove(*key)
+                self.buffer = dict()
+            self._dirty = True
+        self._store_if_due()
+
+    def flush(self):
+        '''Store buffer if there are changes not yet stored'''
+        if self._dirty:
+            self.store()
+
+    def store(self, **kwargs):
+        with self._store_lock:
+            with self._lock:
+                dirty_entries = set(self._dirty_entries)
+                records = [
+                    (
+                        self._get_slot_storage(self._entries[key].slot),
+                        (*key, self.buffer[key[0]][key[1]]),
+                    )
+                    for key in dirty_entries
+                ]
+                state = self.get_state(**self.get_state_kwargs)
+                self._dirty_entries.clear()
+                self._dirty = False
+                self._last_store = time.monotonic()
+            try:
+                # values are stored before the index referring to them:
+                for storage, record in records:
+                    storage.store(record)
+                self._storage.store(state)
+            except BaseException:
+                with self._lock:
+                    self._dirty_entries.update(
+                        key for key in dirty_entries if key in self._entries
+                    )
+                    self._dirty = True
+                raise
+        with self._lock:
+            unused_count = len(self._unused_slots)
+            compact = unused_count >= self.compaction_min_unused and (
+                unused_count > len(self._entries)
+            )
+        if compact:
+            self.compact()
+
+    def compact(self):
+        '''Empty unused storages of the storage_factory layout
+
+        Values are moved to the storages with the lowest numbers such that
+        all other storages can be emptied.
+        '''
+        if self._storage_factory is None:
+            return
+        # Compaction is a rare maintenance task, loading the moved values is
+        # done while holding the lock:
+        with self._lock:
+            self.ensure_loaded()
+            # values to be moved must be loaded, values that cannot be loaded
+            # are removed which changes the number of required storages:
+            while True:
+                target_count = len(self._entries)
+                moving = [
+                    key
+                    for key, entry in self._entries.items()
+                    if entry.slot >= target_count
+                ]
+                if all(
+                    self._get_value(*key, self._entries[key]) is not _NOT_LOADED
+                    for key in moving
+                ):
+                    break
+            used_slots = {entry.slot for entry in self._entries.values()}
+            free_slots = [
+                slot for slot in range(target_count) if slot not in used_slots
+            ]
+            for key in moving:
+                self._entries[key].slot = free_slots.pop()
+                self._dirty_entries.add(key)
+            previous_count = self._slot_count
+            self._slot_count = target_count
+            self._unused_slots = []
+            emptied = [
+                self._slot_storages.pop(slot, None)
+                or self._storage_factory(f'entry{slot}')
+                for slot in range(target_count, previous_count)
+            ]
         self.store()
+        # emptied only after the index is updated:
+        for storage in emptied:
+            storage.store(None)
 
-    def _get_bytestream(self) -> bytes:
-        return pickle.dumps(self.buffer)
+    def _store_if_due(self):
+        '''Store changes according to flush_interval
 
-    def _set_bytestream(self, data: bytes):
-        if data:
-            self.buffer = pickle.loads(data)
+        Must be called without holding the lock.
+        '''
+        if not self._dirty or self.flush_interval is None:
+            return
+        if time.monotonic() - self._last_store >= self.flush_interval:
+            self.store()
+
+    def _remove(self, what: str, input: str):
+        entry = self._entries.pop((what, input))
+        self._bytes -= entry.size
+        del self.buffer[what][input]
+        if self._storage_factory is not None:
+            self._unused_slots.append(entry.slot)
+            self._dirty_entries.discard((what, input))
+
+    def _evict(self, keep: tuple[str, str] | None = None):
+        '''Remove values until bounds are met, except for keep'''
+        while (
+            self.max_entries is not None and len(self._entries) > self.max_entries
+        ) or (self.max_bytes is not None and self._bytes > self.max_bytes):
+            candidates = (key for key in self._entries if key != keep)
+            if self.eviction == 'lfu':
+                # on equal counts, the least recently used is taken:
+                key = min(
+                    candidates, key=lambda key: self._entries[key].count, default=None
+                )
+            else:
+                key = next(candidates, None)
+            if key is None:
+                break
+            self._remove(*key)
+            self.stats.evictions += 1
+
+    def _estimate_size(self, data: object) -> int:
+        try:
+            return len(pickle.dumps(data))
+        except Exception:
+            return sys.getsizeof(data)
+
+    def _load_record(self, slot: int) -> object:
+        '''Load the record (what, input, value) of a storage_factory slot'''
+        with self._lock:
+            storage = self._get_slot_storage(slot)
+        return storage.load() if storage.exists() else None
+
+    def _get_value(
+        self,
+        what: str,
+        input: str,
+        entry: _BufferEntry,
+        record: object = _NOT_LOADED,
+    ) -> object:
+        '''Get value, loading it from it's storage if required
+
+        A record (see _load_record()) of the entry's slot can be provided if
+        it was loaded already. Returns _NOT_LOADED and removes the entry if
+        the storage does not hold the value (anymore).
+        '''
+        data = self.buffer[what][input]
+        if data is not _NOT_LOADED:
+            return data
+        if record is _NOT_LOADED:
+            record = self._load_record(entry.slot)
+        # the storage may have been reused for another value if the index
+        # could not be stored:
+        if isinstance(record, tuple) and record[:2] == (what, input):
+            self.buffer[what][input] = record[2]
+            return record[2]
+        self.log.warning(f'Buffered value for {what}({input}) is not available')
+        self._remove(what, input)
+        # stored with the next change, storing right away could also apply
+        # compact() which is calling this function:
+        self._dirty = True
+        return _NOT_LOADED
+
+    def _get_slot_storage(self, slot: int) -> Storage:
+        if slot not in self._slot_storages:
+            assert self._storage_factory is not None
+            self._slot_storages[slot] = self._storage_factory(f'entry{slot}')
+        return self._slot_storages[slot]
+
+    def _get_unused_slot(self) -> int:
+        if self._unused_slots:
+            return self._unused_slots.pop()
+        self._slot_count += 1
+        return self._slot_count - 1
+
+    # Only the buffered values and their timestamps are stored. Access
+    # statistics start fresh when loading. For the storage_factory layout,
+    # the state is the index without values.
+    def get_state(self, **kwargs) -> dict:
+        if self._storage_factory is not None:
+            return {
+                'version': 2,
+                'index': {
+                    what: {
+                        input: (entry.slot, entry.timestamp, entry.size)
+                        for input in inputs
+                        for entry in [self._entries[(what, input)]]
+                    }
+                    for what, inputs in self.buffer.items()
+                },
+                'unused': list(self._unused_slots),
+                'count': self._slot_count,
+            }
+        return {
+            'version': 2,
+            'buffer': {what: dict(inputs) for what, inputs in self.buffer.items()},
+            'timestamps': {
+                what: {
+                    input: self._entries[(what, input)].timestamp for input in inputs
+                }
+                for what, inputs in self.buffer.items()
+            },
+        }
+
+    def set_state(self, data: object, **kwargs):
+        if not isinstance(data, dict):
+            raise TypeError(f'Buffer state must be a dict, got {type(data)}')
+        self._entries.clear()
+        self._bytes = 0
+        if self._storage_factory is not None:
+            self._set_state_index(data)
+            return
+        self.buffer = data['buffer']
+        # version 1 (default Stateful state) did not include timestamps:
+        timestamps = data.get('timestamps', {})
+        now = time.time()
+        for what, inputs in self.buffer.items():
+            for input, value in inputs.items():
+                size = self._estimate_size(value) if self.max_bytes is not None else 0
+                self._entries[(what, input)] = _BufferEntry(
+                    timestamps.get(what, {}).get(input, now), size
+                )
+                self._bytes += size
+        self._evict()
 
+    def _set_state_index(self, data: dict):
+        self.buffer = dict()
+        self._dirty_entries.clear()
+        self._unused_slots = list(data['unused'])
+        self._slot_count = data['count']
+        for what, inputs in data['index'].items():
+            self.buffer[what] = dict()
+            for input, (slot, timestamp, size) in inputs.items():
+                self.buffer[what][input] = _NOT_LOADED
+                self._entries[(what, input)] = _BufferEntry(timestamp, size, slot)
+                self._bytes += size
+        self._evict()
 
-def get_positional_arguments(func, *args, **kwargs):
-    '''Resolve kwargs for default values.
 
-    Note generic args or kwargs not being supported.
+# Hooks per type to obtain buffered() keys for arguments, see
+# register_key_hook():
+_key_hooks: dict[type, typing.Callable[[typing.Any], typing.Any]] = {}
+
+# keys of arguments longer than this are replaced by their hash:
+MAX_KEY_LENGTH = 64
+
+
+def register_key_hook(cls: type, hook: typing.Callable[[typing.Any], typing.Any]):
+    '''Define how arguments of a type contribute to buffered() keys.
+
+    The hook gets the argument and returns a representation of it that is
+    composed of basic types (like a tuple of the relevant attributes). The
+    hook applies to derived types as well. Arguments of types without hook
+    are represented by repr() if their type defines it and by their attributes
+    otherwise (the default repr() contains the object's id).
     '''
-    argumentlist = func.__code__.co_varnames[0 : (func.__code__.co_argcount)]
-    default_value_list = func.__defaults__
-
-    def getvalue(iarg, argname):
-        '''Get value for single argument.'''
-        # First, take the positional arguments by order:
-        if iarg < len(args):
-            return args[iarg]
-        # Second, take remaining args either from the kwargs:
-        if argname in kwargs:
-            return kwargs[argname]
-        # .. or from the corresponding default value
-        else:
-            nodefault_count = len(argumentlist) - len(default_value_list)
-            # it is possible that the default value does not exist
-            if iarg < nodefault_count:
-                raise Exception(
-                    f'Function {func.__qualname__} must use '
-                    f'{nodefault_count} parameters, '
-                    f' only {len(args)} provided.'
+    _key_hooks[cls] = hook
+
+
+def _key_part(value: typing.Any) -> str:
+    '''Stable string representation of a single argument'''
+    # types are compared exactly since derived types may have their own repr():
+    value_type = type(value)
+    if value_type in (str, int, float, bool, bytes) or value is None:
+        return repr(value)
+    if value_type is tuple:
+        return '(' + ','.join(_key_part(item) for item in value) + ')'
+    if value_type is list:
+        return '[' + ','.join(_key_part(item) for item in value) + ']'
+    if value_type is dict:
+        return (
+            '{'
+            + ','.join(
+                sorted(
+                    _key_part(key) + ':' + _key_part(item)
+                    for key, item in value.items()
                 )
-            else:
-                return default_value_list[iarg - nodefault_count]
+            )
+            + '}'
+        )
+    if value_type in (set, frozenset):
+        return 'set(' + ','.join(sorted(_key_part(item) for item in value)) + ')'
+    for cls in value_type.__mro__:
+        if cls in _key_hooks:
+            return value_type.__qualname__ + _key_part(_key_hooks[cls](value))
+    if value_type.__repr__ is not object.__repr__:
+        return repr(value)
+    attributes = dict(getattr(value, '__dict__', {}))
+    for cls in value_type.__mro__:
+        slots = getattr(cls, '__slots__', ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ('__dict__', '__weakref__') and hasattr(value, name):
+                attributes[name] = getattr(value, name)
+    return value_type.__qualname__ + _key_part(attributes)
+
+
+def get_key(signature: inspect.Signature, *args, **kwargs) -> str:
+    '''Get buffer key from function arguments.
+
+    Default values are applied such that equivalent calls result in the same
+    key. Keyword-only arguments are included with their names. Keys exceeding
+    MAX_KEY_LENGTH are replaced by their sha256.
+    '''
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    parts = []
+    for name, value in bound.arguments.items():
+        kind = signature.parameters[name].kind
+        if kind == inspect.Parameter.KEYWORD_ONLY:
+            parts.append(f'{name}={_key_part(value)}')
+        elif kind == inspect.Parameter.VAR_POSITIONAL:
+            parts.extend(_key_part(item) for item in value)
+        elif kind == inspect.Parameter.VAR_KEYWORD:
+            parts.extend(f'{key}={_key_part(value[key])}' for key in sorted(value))
+        else:
+            parts.append(_key_part(value))
+    key = ','.join(parts)
+    if len(key) > MAX_KEY_LENGTH:
+        key = 'sha256:' + hashlib.sha256(key.encode()).hexdigest()
+    return key
+
 
-    return tuple(getvalue(iarg, argname) for iarg, argname in enumerate(argumentlist))
+class _Flight:
+    '''Computation of a buffered value others may wait for'''
+
+    __slots__ = ('done', 'result', 'exception')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: typing.Any = None
+        self.exception: BaseException | None = None
 
 
 def buffered(buffer: Buffer | typing.Callable[..., Buffer]):
     '''Get decorator for buffering into user defined buffer.
 
-    This function, taking the buffer as variable, returns the decorator.
+    This function, taking the buffer as variable, returns the decorator. The
+    buffer key is built from the arguments, see get_key() and
+    register_key_hook(). Concurrent calls with the same key wait for the
+    first call to compute the value (also for coroutine functions within the
+    same event loop).
     '''
 
     def _buffered(func):
         '''The decorator which will use buffer to wrap the function.'''
-        if func.__kwdefaults__:
-            raise Exception(
-                'appxf cannot deal with default arguments for '
-                'kwargs. Check if you can use Buffer class '
-                'directly'
-            )
-
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            arglist = get_positional_arguments(func, *args, **kwargs)
-            argstring = ','.join([str(arg) for arg in arglist])
+        signature = inspect.signature(func)
 
+        def get_buffer(*args, **kwargs) -> Buffer:
             try:
                 if isinstance(buffer, Buffer):
-                    this_buffer = buffer
-                elif callable(buffer):
-                    this_buffer = buffer(*args, **kwargs)
+                    return buffer
+                return buffer(*args, **kwargs)
             except Exception as e:
                 log.exception(
                     'Buffer decorator must have either a buffer or a '
@@ -154,12 +630,75 @@ def buffered(buffer: Buffer | typing.Callable[..., Buffer]):
                 )
                 raise e
 
-            val = this_buffer.get(func.__name__, argstring)
-            if val is None:
-                val = func(*args, **kwargs)
-                this_buffer.set(val, func.__name__, argstring)
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = get_key(signature, *args, **kwargs)
+                this_buffer = get_buffer(*args, **kwargs)
+                flight_key = (id(asyncio.get_running_loop()), func.__name__, key)
+                val = this_buffer.get(func.__name__, key)
+                if val is not None:
+                    return val
+                # flights of an event loop are only accessed from it's thread:
+                flights = this_buffer._async_flights
+                if flight_key in flights:
+                    # each caller gets it's own copy (like from get()):
+                    return this_buffer._copy_value(
+                        await asyncio.shield(flights[flight_key])
+                    )
+                future = asyncio.get_running_loop().create_future()
+                flights[flight_key] = future
+                try:
+                    val = await func(*args, **kwargs)
+                    this_buffer.set(val, func.__name__, key)
+                    future.set_result(val)
+                except BaseException as e:
+                    future.set_exception(e)
+                    # avoid "exception was never retrieved" without waiters:
+                    future.exception()
+                    raise
+                finally:
+                    del flights[flight_key]
+                return this_buffer._copy_value(val)
+
+            return async_wrapper
 
-            return val
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = get_key(signature, *args, **kwargs)
+            this_buffer = get_buffer(*args, **kwargs)
+            flight_key = (func.__name__, key)
+            val = this_buffer.get(func.__name__, key)
+            if val is not None:
+                return val
+            with this_buffer._lock:
+                flight = this_buffer._flights.get(flight_key)
+                leading = flight is None
+                if leading and this_buffer._lookup(func.__name__, key) is not None:
+                    # buffered by a flight that completed since get() above:
+                    leading = False
+                elif leading:
+                    flight = this_buffer._flights[flight_key] = _Flight()
+            if flight is None:
+                return this_buffer.get(func.__name__, key)
+            if not leading:
+                flight.done.wait()
+                if flight.exception is not None:
+                    raise flight.exception
+                # each caller gets it's own copy (like from get()):
+                return this_buffer._copy_value(flight.result)
+            try:
+                flight.result = func(*args, **kwargs)
+                this_buffer.set(flight.result, func.__name__, key)
+            except BaseException as e:
+                flight.exception = e
+                raise
+            finally:
+                with this_buffer._lock:
+                    del this_buffer._flights[flight_key]
+                flight.done.set()
+            return this_buffer._copy_value(flight.result)
 
         return wrapper
 
@@ -0,0 +1,151 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Immutable snapshots of python data
+
+freeze() converts dicts, lists and sets into immutable variants that still
+pass isinstance() checks for dict, list and set. Such snapshots can be shared
+without copying them. A copy (copy or deepcopy) or pickling results in the
+normal, mutable types again. CopyOnWrite gives access to a snapshot that is
+only copied when a mutable version is requested.
+'''
+
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Any, NoReturn
+
+
+class AppxfFrozenError(TypeError):
+    '''Attempt to change a frozen snapshot'''
+
+
+def _frozen(self, *args, **kwargs) -> NoReturn:
+    raise AppxfFrozenError(
+        f'{self.__class__.__name__} is a frozen snapshot and cannot be changed. '
+        f'Use copy.deepcopy() to get a mutable copy.'
+    )
+
+
+class FrozenDict(dict):
+    '''Immutable dict, see freeze()'''
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _frozen
+    clear = pop = popitem = setdefault = update = _frozen
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return {
+            deepcopy(key, memo): deepcopy(value, memo) for key, value in self.items()
+        }
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    '''Immutable list, see freeze()'''
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _frozen
+    append = extend = insert = pop = remove = clear = sort = reverse = _frozen
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return [deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+class FrozenSet(set):
+    '''Immutable set, see freeze()'''
+
+    __slots__ = ()
+
+    add = discard = remove = pop = clear = update = _frozen
+    intersection_update = difference_update = symmetric_difference_update = _frozen
+    __ior__ = __iand__ = __isub__ = __ixor__ = _frozen
+
+    def __copy__(self) -> set:
+        return set(self)
+
+    def __deepcopy__(self, memo: dict) -> set:
+        return {deepcopy(value, memo) for value in self}
+
+    def __reduce__(self):
+        return (set, (set(self),))
+
+
+# types that are returned as they are by freeze():
+_frozen_types = (
+    str,
+    int,
+    float,
+    bool,
+    bytes,
+    complex,
+    type(None),
+    frozenset,
+    FrozenDict,
+    FrozenList,
+    FrozenSet,
+)
+
+
+def freeze(data: Any) -> Any:
+    '''Get immutable snapshot of data
+
+    Immutable values are not copied. Dicts, lists and sets are converted to
+    FrozenDict, FrozenList and FrozenSet and tuples are traversed for their
+    content. Any other object is deep copied (it cannot be frozen).
+    '''
+    data_type = type(data)
+    if data_type in _frozen_types:
+        return data
+    if isinstance(data, dict):
+        return FrozenDict((key, freeze(value)) for key, value in data.items())
+    if isinstance(data, list):
+        return FrozenList(freeze(value) for value in data)
+    if isinstance(data, set):
+        return FrozenSet(data)
+    if data_type is tuple:
+        return tuple(freeze(value) for value in data)
+    return deepcopy(data)
+
+
+class CopyOnWrite:
+    '''Access to a frozen snapshot that is copied on first change
+
+    Read via value, which is the snapshot until mutable() was called. The
+    first call to mutable() creates a mutable deep copy which is then returned
+    by value and further calls to mutable().
+    '''
+
+    __slots__ = ('_snapshot', '_copy', '_copied')
+
+    def __init__(self, snapshot: Any):
+        self._snapshot = snapshot
+        self._copy: Any = None
+        self._copied = False
+
+    @property
+    def value(self) -> Any:
+        return self._copy if self._copied else self._snapshot
+
+    @property
+    def copied(self) -> bool:
+        '''A mutable copy was created by mutable()'''
+        return self._copied
+
+    def mutable(self) -> Any:
+        if not self._copied:
+            self._copy = deepcopy(self._snapshot)
+            self._copied = True
+        return self._copy
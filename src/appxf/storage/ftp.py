@@ -3,8 +3,6 @@
 # Enable to test for key indexable (object[]) behavior:
 import os.path
 
-from ftputil import FTPHost
-
 from appxf import logging
 
 from .storage_to_bytes import StorageToBytes
@@ -21,6 +19,10 @@ from .storage_to_bytes import StorageToBytes
 # handy. Like: cloud storage.
 
 # TODO UPGRADE: review when starting to use this
+#
+# Asynchronous access (aload()/astore()/aexists()) uses the worker thread
+# default of Storage. A non-blocking FTP client (like aioftp) should be
+# considered when upgrading, overwriting the asynchronous methods.
 
 
 def retry_method_with_reconnect(method):
@@ -98,7 +100,9 @@ class FtpLocation(StorageToBytes):
         except Exception:
             # nothing to do if above fails
             pass
-        # try connecting
+        # try connecting (ftputil is only imported when FTP is used)
+        from ftputil import FTPHost
+
         try:
             self.connection = FTPHost(self.host, self.user, self.password)
         except Exception as e:
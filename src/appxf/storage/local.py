@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import os.path
+import uuid
 
+from .locking import FileLock, get_file_lock
 from .storage_to_bytes import CompactSerializer, Serializer, Storage, StorageToBytes
 
 
 class LocalStorage(StorageToBytes):
-    '''Maintain files in a local path.'''
+    '''Maintain files in a local path.
+
+    The path may be shared between processes (like on a network drive).
+    Files are replaced atomically by store() and process_lock() is an
+    advisory file lock, see appxf.storage.locking.
+    '''
+
+    # seconds to wait for the file lock of another process:
+    lock_timeout = 10.0
 
     def __init__(
         self,
@@ -65,9 +75,57 @@ class LocalStorage(StorageToBytes):
     def exists(self) -> bool:
         return os.path.exists(self._get_file_path(create_dir=False))
 
+    def process_lock(self) -> FileLock:
+        return get_file_lock(
+            os.path.join(self._path, '.meta', self._name + '.lock'),
+            timeout=self.lock_timeout,
+        )
+
+    @classmethod
+    def commit(cls, items: set[str]):
+        '''Synchronize written files and their directories to disk
+
+        Files are recorded by store_raw() within a Storage.transaction().
+        '''
+        for path in items:
+            try:
+                fd = os.open(path, os.O_RDWR)
+            except FileNotFoundError:
+                continue
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        # renaming a file is only durable when syncing the directory which is
+        # not supported on Windows:
+        if os.name != 'posix':  # pragma: no cover
+            return
+        for directory in {os.path.dirname(path) for path in items}:
+            try:
+                fd = os.open(directory, os.O_RDONLY)
+            except FileNotFoundError:
+                continue
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
     def store_raw(self, data: bytes):
-        with open(self._get_file_path(create_dir=True), 'wb') as f:
-            f.write(data)
+        # write to a temporary file and rename it such that readers never see
+        # a partially written file:
+        path = self._get_file_path(create_dir=True)
+        # (unique name instead of tempfile.mkstemp() to keep the permissions
+        # of normally created files)
+        temp_path = f'{path}.{uuid.uuid4().hex}.tmp'
+        try:
+            with open(temp_path, 'xb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+            self._record_write(path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
 
     def load_raw(self) -> bytes:
         path = self._get_file_path(create_dir=False)
@@ -0,0 +1,215 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Locks for concurrent storage access
+
+Concurrency model of the storage module:
+  * Registry: registration, unregistration and get() of storages are
+    serialized per storage class and location (Storage._location_lock()).
+    get() holds the lock while constructing such that concurrent get() calls
+    return the same object. Derived storages acquire the lock of their base
+    storage class while holding their own (never the other way around).
+  * Items: store() and load() acquire a ReadWriteLock of the physical item.
+    The item is identified by the root storage (base storage of derived
+    storages) and the meta, such that a derived storage and it's base storage
+    serialize. Concurrent load() calls run in parallel.
+  * Lock registries (item locks, file locks and the location locks of
+    Storage) only hold weak references. A lock is kept as long as it is
+    acquired or waited for and is recreated on next use otherwise.
+  * Processes: store() additionally acquires the process_lock() of the root
+    storage which is an advisory FileLock for LocalStorage. Files are
+    written to a temporary file and renamed such that load() does not need a
+    process lock. sync() holds the process locks of both items.
+  * reset() and switch_context() are meant for testing. They are serialized
+    among each other but must not run concurrently to other storage
+    operations.
+'''
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import weakref
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover (Windows)
+    fcntl = None
+    import msvcrt
+
+
+class AppxfStorageLockTimeout(TimeoutError):
+    '''Lock could not be acquired within the timeout'''
+
+
+class ReadWriteLock:
+    '''Lock allowing concurrent readers or a single writer
+
+    Waiting writers have precedence over new readers. The writing thread may
+    acquire read() and write() again. Acquiring write() while holding read()
+    is not supported and blocks forever.
+    '''
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: int | None = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                # writer reading is covered by the write lock:
+                self._writer_depth += 1
+            else:
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+                self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                if self._writer == me:
+                    self._writer_depth -= 1
+                else:
+                    self._readers -= 1
+                    if not self._readers:
+                        self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._writer_depth += 1
+            else:
+                self._waiting_writers += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._condition.wait()
+                finally:
+                    self._waiting_writers -= 1
+                self._writer = me
+                self._writer_depth = 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer_depth -= 1
+                if not self._writer_depth:
+                    self._writer = None
+                    self._condition.notify_all()
+
+
+_item_locks: weakref.WeakValueDictionary[Hashable, ReadWriteLock] = (
+    weakref.WeakValueDictionary()
+)
+_item_locks_lock = threading.Lock()
+
+
+def get_item_lock(key: Hashable) -> ReadWriteLock:
+    '''Get the ReadWriteLock for a physical storage item'''
+    lock = _item_locks.get(key)
+    if lock is None:
+        with _item_locks_lock:
+            lock = _item_locks.setdefault(key, ReadWriteLock())
+    return lock
+
+
+class FileLock:
+    '''Advisory lock between processes based on a lock file
+
+    Uses fcntl.flock() (msvcrt.locking() on Windows). The lock is reentrant
+    for the owning thread and serializes threads of the same process. Use
+    get_file_lock() to share one FileLock per lock file within the process.
+    Lock files are not removed since this would break locking for processes
+    that opened the file already.
+    '''
+
+    poll_interval = 0.01
+
+    def __init__(self, path: str, timeout: float = 10.0):
+        self.path = path
+        self.timeout = timeout
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    def acquire(self, timeout: float | None = None):
+        '''Acquire lock, raising AppxfStorageLockTimeout after timeout'''
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        if not self._thread_lock.acquire(timeout=timeout):
+            raise AppxfStorageLockTimeout(
+                f'Lock {self.path} is held by another thread for more than {timeout}s.'
+            )
+        if self._depth:
+            self._depth += 1
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            file = open(self.path, 'a+b')
+            while not self._try_lock(file):
+                if time.monotonic() >= deadline:
+                    file.close()
+                    raise AppxfStorageLockTimeout(
+                        f'Lock {self.path} is held by another process for '
+                        f'more than {timeout}s.'
+                    )
+                time.sleep(self.poll_interval)
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        self._file = file
+        self._depth = 1
+
+    def release(self):
+        self._depth -= 1
+        if not self._depth:
+            file, self._file = self._file, None
+            try:
+                if fcntl is not None:
+                    fcntl.flock(file, fcntl.LOCK_UN)
+                else:  # pragma: no cover (Windows)
+                    file.seek(0)
+                    msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+            finally:
+                file.close()
+        self._thread_lock.release()
+
+    @staticmethod
+    def _try_lock(file) -> bool:
+        try:
+            if fcntl is not None:
+                fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:  # pragma: no cover (Windows)
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def __enter__(self) -> FileLock:
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+
+_file_locks: weakref.WeakValueDictionary[str, FileLock] = weakref.WeakValueDictionary()
+
+
+def get_file_lock(path: str, timeout: float = 10.0) -> FileLock:
+    '''Get the FileLock for a lock file path'''
+    path = os.path.abspath(path)
+    lock = _file_locks.get(path)
+    if lock is None:
+        with _item_locks_lock:
+            lock = _file_locks.setdefault(path, FileLock(path, timeout=timeout))
+    return lock
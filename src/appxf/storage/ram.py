@@ -5,10 +5,25 @@ from __future__ import annotations
 import uuid
 from copy import deepcopy
 
-from .storage import AppxfStorageWarning, Storage
+from .frozen import CopyOnWrite, freeze
+from .storage import AppxfStorageError, AppxfStorageWarning, Storage
 
 
 class RamStorage(Storage):
+    '''Storage in RAM
+
+    By default (copy_mode 'copy'), stored and loaded data is deep copied such
+    that neither the caller's data nor the stored data can change afterwards.
+    Opt-in modes avoid the copy on load:
+      * 'snapshot' stores an immutable snapshot (see frozen.freeze()) and
+        load() returns this snapshot without copying. Changing it raises
+        AppxfFrozenError, use deepcopy() to get a mutable version.
+    In all modes, load() returns the stored data type. Use load_copy_on_write()
+    to obtain a CopyOnWrite wrapper that copies only on mutable().
+    '''
+
+    copy_modes = ('copy', 'snapshot')
+
     # store data and metadata in class data is accessed by _data[group][name]:
     _data: dict[str, dict[str, object]] = {}
     # meta is accessed by _meta[group][name][meta]. This order allows
@@ -16,7 +31,14 @@ class RamStorage(Storage):
     # know which meta will exist >> meta must be last.
     _meta_data: dict[str, dict[str, dict[str, object]]] = {}
 
-    def __init__(self, name: str | None = None, ram_area: str = ''):
+    def __init__(
+        self, name: str | None = None, ram_area: str = '', copy_mode: str = 'copy'
+    ):
+        if copy_mode not in self.copy_modes:
+            raise AppxfStorageError(
+                f'copy_mode must be one of {self.copy_modes}, not {copy_mode}'
+            )
+        self._copy_mode = copy_mode
         # It is possible to use RamStorage() as a functional dummy storage. In
         # this case, get() will never work.
         if name is None:
@@ -25,10 +47,10 @@ class RamStorage(Storage):
                 name = str(uuid.uuid4())
         super().__init__(name=name, location=ram_area)
 
-        # initialize the ram area:
-        if ram_area not in self._data:
-            self._data[ram_area] = {}
-            self._meta_data[ram_area] = {}
+        # initialize the ram area (setdefault() does not replace an area
+        # initialized concurrently):
+        self._data.setdefault(ram_area, {})
+        self._meta_data.setdefault(ram_area, {})
         # warning if constructing for the same memory
         if name in self._data[ram_area]:
             raise AppxfStorageWarning(
@@ -43,18 +65,25 @@ class RamStorage(Storage):
         cls,
         name: str,
         ram_area: str = '',
+        copy_mode: str = 'copy',
     ) -> Storage:
         return super().get(
             name=name,
             location=ram_area,
-            storage_init_fun=lambda: RamStorage(name=name, ram_area=ram_area),
+            storage_init_fun=lambda: RamStorage(
+                name=name, ram_area=ram_area, copy_mode=copy_mode
+            ),
         )
 
     @classmethod
-    def get_factory(cls, ram_area: str = '') -> Storage.Factory:
+    def get_factory(
+        cls, ram_area: str = '', copy_mode: str = 'copy'
+    ) -> Storage.Factory:
         return super().get_factory(
             location=ram_area,
-            storage_get_fun=lambda name: RamStorage.get(name=name, ram_area=ram_area),
+            storage_get_fun=lambda name: RamStorage.get(
+                name=name, ram_area=ram_area, copy_mode=copy_mode
+            ),
         )
 
     @classmethod
@@ -78,24 +107,43 @@ class RamStorage(Storage):
         return self._meta in self._meta_data[self._location][self._name]
 
     def store_raw(self, data: object):
+        data = deepcopy(data) if self._copy_mode == 'copy' else freeze(data)
+        # setdefault() does not replace dicts initialized concurrently by
+        # storing other items:
         if self._meta:
-            if self._location not in self._meta_data:
-                self._meta_data[self._location] = {}
-            meta_data_location = self._meta_data[self._location]
-            if self._name not in meta_data_location:
-                meta_data_location[self._name] = {}
-            meta_data_location[self._name][self._meta] = deepcopy(data)
+            meta_data_location = self._meta_data.setdefault(self._location, {})
+            meta_data_location.setdefault(self._name, {})[self._meta] = data
         else:
-            if self._location not in self._data:
-                self._data[self._location] = {}
-            if self._name not in self._data[self._location]:
-                self._data[self._location][self._name] = {}
-            self._data[self._location][self._name] = deepcopy(data)
+            self._data.setdefault(self._location, {})[self._name] = data
 
     def load_raw(self) -> object:
         if not self.exists():
             return None
         if self._meta:
-            return deepcopy(self._meta_data[self._location][self._name][self._meta])
-        # not meta:
-        return deepcopy(self._data[self._location][self._name])
+            data = self._meta_data[self._location][self._name][self._meta]
+        else:
+            data = self._data[self._location][self._name]
+        if self._copy_mode == 'snapshot':
+            return data
+        return deepcopy(data)
+
+    def load_copy_on_write(self) -> CopyOnWrite:
+        '''Load data wrapped for copy on first change
+
+        In 'snapshot' mode, loading does not copy and CopyOnWrite.mutable()
+        copies the snapshot only when needed. In 'copy' mode, the loaded data
+        is already a copy.
+        '''
+        return CopyOnWrite(self.load())
+
+    # RAM access does not wait for I/O, asynchronous access is executed
+    # directly instead of using a worker thread:
+
+    async def aexists(self) -> bool:
+        return self.exists()
+
+    async def aload(self) -> object:
+        return self.load()
+
+    async def astore(self, data: object):
+        self.store(data)
@@ -13,7 +13,9 @@ https://docs.python.org/3/library/pickle.html#restricting-globals.
 import io
 import pickle
 from collections import OrderedDict
+from copy import deepcopy
 
+from .frozen import FrozenDict, FrozenList, FrozenSet
 from .serializer import Serializer
 
 supported_types = {
@@ -46,8 +48,18 @@ class _RestrictedUnpickler(pickle.Unpickler):
         )
 
 
+# frozen snapshots (see frozen.freeze()) are serialized as their mutable types:
+_frozen_types = {FrozenDict, FrozenList, FrozenSet}
+
+
+class _FrozenDataError(TypeError):
+    '''Data contains frozen snapshots which require a mutable copy'''
+
+
 class _RestrictedPickler(pickle.Pickler):
     def persistent_id(self, obj):
+        if type(obj) in _frozen_types:
+            raise _FrozenDataError()
         # Catch types that are not supported
         if type(obj) not in supported_types:
             raise TypeError(f'Cannot serialize {obj} of type {type(obj)}')
@@ -68,6 +80,15 @@ class CompactSerializer(Serializer):
 
     @classmethod
     def serialize(cls, data: object) -> bytes:
+        try:
+            return cls._dump(data)
+        except _FrozenDataError:
+            # deepcopy() results in the mutable types, it is only applied when
+            # needed such that other data is not copied:
+            return cls._dump(deepcopy(data))
+
+    @classmethod
+    def _dump(cls, data: object) -> bytes:
         with io.BytesIO() as f:
             _RestrictedPickler(f).dump(data)
             return f.getvalue()
@@ -5,6 +5,7 @@ import json
 import re
 from collections import OrderedDict
 
+from .frozen import FrozenList, FrozenSet
 from .serializer import Serializer
 
 # Alternatives
@@ -89,9 +90,10 @@ class JsonSerializer(Serializer):
                 cls.encode_transform(element, log_tree + [str(element)])
                 for element in obj
             ]
-            if type(obj) is list:
+            # (including frozen snapshots, see frozen.freeze())
+            if type(obj) in (list, FrozenList):
                 return encoded_list
-            if type(obj) is set:
+            if type(obj) in (set, FrozenSet):
                 return {'__set__': encoded_list}
             if type(obj) is tuple:
                 return {'__tuple__': encoded_list}
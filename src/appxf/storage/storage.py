@@ -4,13 +4,26 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from copy import deepcopy
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from copy import copy
+import threading
+import weakref
 from inspect import isabstract
-from typing import Callable, Protocol, overload, runtime_checkable
+from typing import (
+    Callable,
+    Hashable,
+    Iterable,
+    Protocol,
+    overload,
+    runtime_checkable,
+)
 
 from appxf.logging import logging
 
+from .locking import ReadWriteLock, get_item_lock
 from .meta_data import MetaData
 
 # TODO: Collect an inventory. __init__ of this base class shall collect all
@@ -55,6 +68,23 @@ class AppxfStorageWarning(Warning):
     '''Warning on storage handling'''
 
 
+class StorageTransaction:
+    '''Writes to be committed together, see Storage.transaction()'''
+
+    def __init__(self):
+        # written items per storage class, as recorded by the storage class:
+        self._written: dict[type[Storage], set] = {}
+
+    def record(self, storage_class: type[Storage], item: Hashable):
+        self._written.setdefault(storage_class, set()).add(item)
+
+    def commit(self):
+        '''Commit the writes recorded since the last commit()'''
+        written, self._written = self._written, {}
+        for storage_class, items in written.items():
+            storage_class.commit(items)
+
+
 class Storage(ABC):
     '''Providing storage behavior
 
@@ -112,6 +142,14 @@ class Storage(ABC):
     # therefore a first level (the location) and a second level (the storage
     # item's name). Both are provided during construction:
     _storage_registry: dict[str, dict[str, Storage]] = {}
+    # Locks per (storage class, location) for registry changes and get(). See
+    # the locking module for the concurrency model. The registry lock guards
+    # the location locks, reset() and switch_context(). Location locks are
+    # only kept while in use:
+    _location_locks: weakref.WeakValueDictionary[
+        tuple[type[Storage], str], threading.RLock
+    ] = weakref.WeakValueDictionary()
+    _registry_lock = threading.RLock()
 
     # Context is a weirdo feature that should not be used in applications but
     # is required during testing. If two or more application instances need to
@@ -195,13 +233,17 @@ class Storage(ABC):
         def __call__(self, name: str) -> Storage: ...
 
         @overload
-        def __call__(self, name: Storage.FactoryBehavior) -> list[Storage]: ...
+        def __call__(self, name: Storage.FactoryBehavior) -> Iterable[Storage]: ...
 
         @abstractmethod
         def __call__(
             self, name: str | Storage.FactoryBehavior
-        ) -> Storage | list[Storage]:
-            '''Factory to construct Storage objects'''
+        ) -> Storage | Iterable[Storage]:
+            '''Factory to construct Storage objects
+
+            AllRegistered returns a lazy iterable over the registry. Do not
+            create storages for the same location while iterating.
+            '''
 
     # TODO: the interface is not very awesome. (1) The storage_get_fun would be
     # better to get removed. There is just a problem with getting the right
@@ -234,26 +276,30 @@ class Storage(ABC):
             )
         if base_storage is None:
 
-            def factory(name: str | Storage.FactoryBehavior) -> Storage | list[Storage]:
+            def factory(
+                name: str | Storage.FactoryBehavior,
+            ) -> Storage | Iterable[Storage]:
                 if isinstance(name, Storage.FactoryBehavior):
                     if name is Storage.AllRegistered:
-                        if location not in cls._storage_registry:
-                            return []
-                        return list(cls._storage_registry[location].values())
+                        return cls._storage_registry.get(location, {}).values()
                 return storage_get_fun(name)
         else:
 
-            def factory(name: str | Storage.FactoryBehavior) -> Storage | list[Storage]:
+            def factory(
+                name: str | Storage.FactoryBehavior,
+            ) -> Storage | Iterable[Storage]:
                 if isinstance(name, Storage.FactoryBehavior):
                     if name is Storage.AllRegistered:
                         # without a base_storage object, we cannot know the
                         # location. But we can access the factory of the base
-                        # storage with the same argument:
-                        return [
+                        # storage with the same argument. Derived storages
+                        # replace the base storage objects in the registry of
+                        # the base storage class:
+                        return (
                             storage
                             for storage in base_storage(Storage.AllRegistered)
                             if isinstance(storage, cls)
-                        ]
+                        )
                 # derived storage must use base_storage but this is already
                 # constructed as part of the calling get_storage_factory.
                 return storage_get_fun(name)
@@ -271,12 +317,21 @@ class Storage(ABC):
 
         If this is a storage derived from a base storage, the returned storage
         for meta files is of the base storage type.
+
+        The meta storage is created on first access and reused afterwards. It
+        is a shallow copy, sharing the configuration (like location,
+        serializer or connections) with the originating storage but having
+        it's own meta storages.
         '''
-        if self.base_storage is None:
-            meta_storage = deepcopy(self)
-        else:
-            meta_storage = deepcopy(self.base_storage)
-        meta_storage._meta = meta
+        meta_storage = self._meta_storages.get(meta)
+        if meta_storage is None:
+            if self.base_storage is None:
+                meta_storage = copy(self)
+            else:
+                meta_storage = copy(self.base_storage)
+            meta_storage._meta = meta
+            meta_storage._meta_storages = {}
+            self._meta_storages[meta] = meta_storage
         return meta_storage
 
     # #########################################################################
@@ -324,12 +379,15 @@ class Storage(ABC):
 
         Use get_meta() to obetain meta data storable from an existing storage.
         '''
-        # try using existing storage
-        storage = cls.get_existing_storage(name=name, location=location)
-        if storage is not None:
-            return storage
-        # use class constructor, but strip the typical cls and __class__:
-        return storage_init_fun()
+        # constructing while holding the lock ensures that concurrent calls
+        # get the same object:
+        with cls._location_lock(location):
+            # try using existing storage
+            storage = cls.get_existing_storage(name=name, location=location)
+            if storage is not None:
+                return storage
+            # use class constructor, but strip the typical cls and __class__:
+            return storage_init_fun()
 
     @classmethod
     def get_existing_storage(
@@ -347,9 +405,7 @@ class Storage(ABC):
                 'switch_context()'
             )
 
-        if cls.is_registered(name, location=location):
-            return cls._storage_registry[location][name]
-        return None
+        return cls._storage_registry.get(location, {}).get(name)
 
     @classmethod
     def switch_context(cls, context: str):
@@ -359,35 +415,38 @@ class Storage(ABC):
         Context is a feature added mainly for TESTING use cases involving
         multiple aplication instances.
         '''
-        # block context switching if current context is not set and there is
-        # stuff in the registry:
-        if not Storage._context:
+        with Storage._registry_lock:
+            # block context switching if current context is not set and there is
+            # stuff in the registry:
+            if not Storage._context:
+                for this_cls in Storage._storage_class_registry:
+                    if this_cls._storage_registry:
+                        raise AppxfStorageError(
+                            f'Context switch not allowed if storage was already '
+                            f'created without context. '
+                            f'Storages registered for: {this_cls.__name__}'
+                        )
+            # handle context change in all storage classes
             for this_cls in Storage._storage_class_registry:
-                if this_cls._storage_registry:
-                    raise AppxfStorageError(
-                        f'Context switch not allowed if storage was already '
-                        f'created without context. '
-                        f'Storages registered for: {this_cls.__name__}'
+                # create a backup
+                if Storage._context:
+                    this_cls._context_registry_backup[Storage._context] = (
+                        this_cls._storage_registry
                     )
-        # handle context change in all storage classes
-        for this_cls in Storage._storage_class_registry:
-            # create a backup
-            if Storage._context:
-                this_cls._context_registry_backup[Storage._context] = (
-                    this_cls._storage_registry
-                )
-            # load new context or replace registry for new context
-            if context in this_cls._context_registry_backup:
-                this_cls._storage_registry = this_cls._context_registry_backup[context]
-            else:
-                this_cls._storage_registry = {}
-        # Apply context lock if switching from valid to invalid context:
-        if Storage._context and not context:
-            Storage._context_locked = True
-        if context:
-            Storage._context_locked = False
-        # context switch succesful:
-        Storage._context = context
+                # load new context or replace registry for new context
+                if context in this_cls._context_registry_backup:
+                    this_cls._storage_registry = this_cls._context_registry_backup[
+                        context
+                    ]
+                else:
+                    this_cls._storage_registry = {}
+            # Apply context lock if switching from valid to invalid context:
+            if Storage._context and not context:
+                Storage._context_locked = True
+            if context:
+                Storage._context_locked = False
+            # context switch succesful:
+            Storage._context = context
 
     @classmethod
     def _register_storage(cls, name: str, location: str, instance: Storage):
@@ -397,21 +456,29 @@ class Storage(ABC):
         Storage.__init__() already ensures registration. This also includes the
         registration to the base class if necessary.
         '''
-        if location not in cls._storage_registry:
-            cls._storage_registry[location] = {}
-        cls._storage_registry[location][name] = instance
+        with cls._location_lock(location):
+            cls._storage_registry.setdefault(location, {})[name] = instance
 
     @classmethod
     def _unregister_storage(cls, location: str, name: str):
         '''Deregister current storage'''
-        if location not in cls._storage_registry:
-            return
-        if name not in cls._storage_registry[location]:
-            return
-        del cls._storage_registry[location][name]
-        # also purge location if it is empty:
-        if not cls._storage_registry[location]:
-            del cls._storage_registry[location]
+        with cls._location_lock(location):
+            if name not in cls._storage_registry.get(location, ()):
+                return
+            del cls._storage_registry[location][name]
+            # also purge location if it is empty:
+            if not cls._storage_registry[location]:
+                del cls._storage_registry[location]
+
+    @classmethod
+    def _location_lock(cls, location: str) -> threading.RLock:
+        '''Lock for registry changes of this class and location'''
+        key = (cls, location)
+        lock = Storage._location_locks.get(key)
+        if lock is None:
+            with Storage._registry_lock:
+                lock = Storage._location_locks.setdefault(key, threading.RLock())
+        return lock
 
     def register(self, override: Storage | None = None):
         '''Register this instance to this classes registry
@@ -458,6 +525,11 @@ class Storage(ABC):
         Should not be required in an applications but may be required during
         testing.
         '''
+        with Storage._registry_lock:
+            cls._reset()
+
+    @classmethod
+    def _reset(cls):
         # reset() on Storage will reset all known Storage classes:
         if cls == Storage:
             for this_cls in cls._storage_class_registry:
@@ -466,25 +538,21 @@ class Storage(ABC):
             Storage._context_registry_backup = {}
             Storage._context_locked = False
             return
-        while cls._storage_registry:
-            loc = next(iter(cls._storage_registry))
-            # end condition for the while below is loc being removed via
-            # unregister()->_unregister_storage()
-            while loc in cls._storage_registry:
-                name = next(iter(cls._storage_registry[loc]))
-                cls._storage_registry[loc][name].unregister()
-            # Note: if unregister() is called in the context of deriving
-            # storages via the base_storage argument to __init__(),
-            # unregister() will be called on the derived class and traverse
-            # down into the base storages accordingly.
+        # The registry is replaced as a whole. unregister() is still called
+        # per storage since derived storages are also registered in the
+        # registry of their base storage class (and storages of other classes
+        # may be registered in this one). Unregistering from the replaced
+        # registry is skipped.
+        registry = cls._storage_registry
+        cls._storage_registry = {}
+        for location_registry in registry.values():
+            for storage in location_registry.values():
+                storage.unregister()
 
     @classmethod
     def is_registered(cls, name: str, location: str = '') -> bool:
         '''Check if name in group is registered to storage class'''
-        if location in cls._storage_registry:
-            if name in cls._storage_registry[location]:
-                return True
-        return False
+        return name in cls._storage_registry.get(location, ())
 
     # #########################################################################
     # CORE OBJECT
@@ -530,29 +598,31 @@ class Storage(ABC):
                 'Either keep a valid context, or reconsider the usage of '
                 'switch_context()'
             )
-        # Cannot construct an already registered object:
-        if (
-            location in self._storage_registry
-            and name in self._storage_registry[location]
-        ):
-            raise AppxfStorageError(
-                f'{self.__class__.__name__} already knows a storage {location}::{name}'
-            )
+        # Cannot construct an already registered object (the lock covers
+        # until registration below):
+        with self._location_lock(location):
+            if self.is_registered(name, location=location):
+                raise AppxfStorageError(
+                    f'{self.__class__.__name__} already knows a storage '
+                    f'{location}::{name}'
+                )
 
-        # construction
-        super().__init__()
-        self._name = name
-        self._meta = ''
-        self._location = location
-        self._user = user
-        self._base_storage = base_storage
-        self._context = Storage._context
-
-        # register newly created storage
-        self._register_storage(name, location, self)
-        # register in base storage, if applicable:
-        if base_storage is not None:
-            base_storage._register_storage(name, location, self)
+            # construction
+            super().__init__()
+            self._name = name
+            self._meta = ''
+            self._location = location
+            self._user = user
+            self._base_storage = base_storage
+            self._context = Storage._context
+            # meta storages as returned by get_meta():
+            self._meta_storages: dict[str, Storage] = {}
+
+            # register newly created storage
+            self._register_storage(name, location, self)
+            # register in base storage, if applicable:
+            if base_storage is not None:
+                base_storage._register_storage(name, location, self)
 
     @property
     def name(self):
@@ -655,7 +725,8 @@ class Storage(ABC):
          3) _store()/_load() cover the interface to the actual storage. There
             is no default implementation.
         '''
-        return self.convert_from_raw(self.load_raw())
+        with self._item_lock().read():
+            return self.convert_from_raw(self.load_raw())
 
     def store(self, data: object):
         '''Store data
@@ -676,9 +747,69 @@ class Storage(ABC):
         # TODO: the hash or file content should be analyzed before generating a
         # new UUID - this may make this detail to a function that should be
         # executed on raw data?
-        if not self._meta:
-            self.set_meta_data(meta=MetaData(valid=True))
-        self.store_raw(self.convert_to_raw(data=data))
+        with self._item_lock().write(), self._root_storage().process_lock():
+            if not self._meta:
+                self.set_meta_data(meta=MetaData(valid=True))
+            self.store_raw(self.convert_to_raw(data=data))
+
+    def _root_storage(self) -> Storage:
+        '''Storage holding the physical item (base storage of derived ones)'''
+        root = self
+        while root._base_storage is not None:
+            root = root._base_storage
+        return root
+
+    def _item_lock(self) -> ReadWriteLock:
+        '''Lock of the physical item for store() and load()'''
+        root = self._root_storage()
+        return get_item_lock((type(root), root._location, root._name, self._meta))
+
+    # Transaction of the current thread, see transaction():
+    _transactions = threading.local()
+
+    @staticmethod
+    @contextmanager
+    def transaction() -> Iterator[StorageTransaction]:
+        '''Record writes of the current thread for a group commit
+
+        While the transaction is active, storages record written items via
+        _record_write() instead of making them durable right away. Writes are
+        made durable by StorageTransaction.commit() (like sync() does once
+        per step for many items). Writes of other threads and writes outside
+        of a transaction are not recorded.
+        '''
+        previous = getattr(Storage._transactions, 'current', None)
+        transaction = StorageTransaction()
+        Storage._transactions.current = transaction
+        try:
+            yield transaction
+        finally:
+            Storage._transactions.current = previous
+
+    @classmethod
+    def _record_write(cls, item: Hashable):
+        '''Record a written item for commit() if a transaction is active'''
+        transaction = getattr(Storage._transactions, 'current', None)
+        if transaction is not None:
+            transaction.record(cls, item)
+
+    @classmethod
+    def commit(cls, items: set):
+        '''Make items written by storages of this class durable
+
+        Data is expected to survive a crash of the process or the system after
+        commit() returned. The items are the ones recorded by _record_write()
+        within a transaction(). The default does nothing since the storage is
+        not persistent.
+        '''
+
+    def process_lock(self) -> AbstractContextManager:
+        '''Lock of the item (including all meta) against other processes
+
+        store() acquires the lock of the root storage. The default does not
+        lock since the storage is not shared between processes.
+        '''
+        return nullcontext()
 
     def convert_to_raw(self, data: object) -> object:
         '''Converting object to raw storage data type
@@ -756,6 +887,27 @@ class Storage(ABC):
             is no default implementation.
         '''
 
+    # ASYNCHRONOUS ACCESS
+    #
+    # aexists(), aload() and astore() are the asyncio counterparts to exists(),
+    # load() and store(). The default implementation executes the blocking
+    # method in the default executor of the event loop (asyncio.to_thread()),
+    # including locking and meta data handling. This is what async file
+    # libraries do as well, such that it is the native implementation for
+    # LocalStorage. Storages with a non-blocking client overwrite them.
+
+    async def aexists(self) -> bool:
+        '''Asynchronous exists()'''
+        return await asyncio.to_thread(self.exists)
+
+    async def aload(self) -> object:
+        '''Asynchronous load()'''
+        return await asyncio.to_thread(self.load)
+
+    async def astore(self, data: object):
+        '''Asynchronous store()'''
+        await asyncio.to_thread(self.store, data)
+
     # METADATA behavior
     #
     # Default behavior considers self._meta_data_enabled which could be
@@ -795,7 +947,7 @@ class Storage(ABC):
         meta_storage = self.get_meta('meta')
         if not meta_storage.exists():
             return None
-        meta_state = self.get_meta('meta').load()
+        meta_state = meta_storage.load()
         return MetaData(state=meta_state)
 
     def set_meta_data(self, meta: MetaData):
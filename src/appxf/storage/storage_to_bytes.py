@@ -8,6 +8,7 @@ This module merges serializers with Storage as a basis for any file storage.
 # allow class name being used before being fully defined (like in same class):
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
 
 from .serializer import Serializer
@@ -26,17 +27,19 @@ class StorageToBytes(Storage, ABC):
     # To allow meta files to specify the serialization type, the following
     # dictionary is used:
     _meta_serializer_dict: dict[str, type[Serializer]] = {}
+    _meta_serializer_lock = threading.Lock()
 
     # This dict will be the SAME even in derived classses. The following
     # interface will allow the setting:
     @classmethod
     def set_meta_serializer(cls, meta: str, serializer: type[Serializer]):
-        if meta in cls._meta_serializer_dict:
-            raise AppxfStorageError(
-                f'Serializer {cls._meta_serializer_dict[meta].__name__} is '
-                f'already defined as serializer for {meta}'
-            )
-        cls._meta_serializer_dict[meta] = serializer
+        with cls._meta_serializer_lock:
+            if meta in cls._meta_serializer_dict:
+                raise AppxfStorageError(
+                    f'Serializer {cls._meta_serializer_dict[meta].__name__} is '
+                    f'already defined as serializer for {meta}'
+                )
+            cls._meta_serializer_dict[meta] = serializer
 
     # overloading the converion functions to apply the serializer
     def convert_from_raw(self, data: bytes) -> object:
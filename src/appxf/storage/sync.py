@@ -5,6 +5,10 @@
 # allow class name being used before being fully defined (like in same class):
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+
 from appxf import logging
 
 from .meta_data import MetaData
@@ -26,6 +30,10 @@ class AppxfChangeOnBothSidesException(Exception):
 
 
 StorageToBytes.set_meta_serializer('sync', JsonSerializer)
+StorageToBytes.set_meta_serializer('journal', JsonSerializer)
+
+# Number of items synchronized within one group commit (see _execute_sync()):
+GROUP_COMMIT_SIZE = 64
 
 
 class SyncData(Storable):
@@ -98,8 +106,10 @@ class SyncData(Storable):
 
 # TODO: How does the sync consider removing files again??
 
-# TODO: storage has to resolve concurrent access problems (reading while
-# writing, writing while reading, two writing)
+# Concurrent access: _sync_storages() holds the item locks of both storages
+# such that neither other threads nor other processes (for storages with a
+# process_lock() like LocalStorage) interleave with the sync decision and
+# _execute_sync(). See appxf.storage.locking.
 
 
 def sync(
@@ -114,15 +124,19 @@ def sync(
     Storable will be ignored.
     '''
     if isinstance(storage_a, Storage) and isinstance(storage_b, Storage):
-        return _sync_storage(storage_a, storage_b, only_a_to_b)
+        return _sync_storages([(storage_a, storage_b)], only_a_to_b)
     if isinstance(storage_a, Storage.Factory) and isinstance(
         storage_b, Storage.Factory
     ):
         # TODO: this case is not "fair" it could also take all from B and then
         # constract in A.
         print(f'Syncing {storage_a} with {storage_b}')
-        for storage in storage_a(Storage.AllRegistered):
-            _sync_storage(storage, storage_b(storage.name), only_a_to_b)
+        pairs = [
+            (storage, storage_b(storage.name))
+            for storage in list(storage_a(Storage.AllRegistered))
+        ]
+        for start in range(0, len(pairs), GROUP_COMMIT_SIZE):
+            _sync_storages(pairs[start : start + GROUP_COMMIT_SIZE], only_a_to_b)
     else:
         # TODO: add support again for sync of storage masters
         raise AppxfStorageSyncException(
@@ -132,7 +146,88 @@ def sync(
         )
 
 
-def _sync_storage(storage_a: Storage, storage_b: Storage, only_a_to_b: bool):
+async def async_sync(
+    storage_a: Storage | list[Storage] | Storage.Factory,
+    storage_b: Storage | list[Storage] | Storage.Factory,
+    only_a_to_b: bool = False,
+    max_parallel: int = 8,
+):
+    '''Synchronize items from two storage factories on an event loop
+
+    Like sync() but the items are synchronized in up to max_parallel groups
+    concurrently. Each group is synchronized within one group commit (of at
+    most GROUP_COMMIT_SIZE items) in the default executor of the event loop
+    such that the transfers of different groups overlap without a thread per
+    transfer.
+    '''
+    if isinstance(storage_a, Storage) and isinstance(storage_b, Storage):
+        return await asyncio.to_thread(
+            _sync_storages, [(storage_a, storage_b)], only_a_to_b
+        )
+    if not (
+        isinstance(storage_a, Storage.Factory)
+        and isinstance(storage_b, Storage.Factory)
+    ):
+        raise AppxfStorageSyncException(
+            f'Sync between types {type(storage_a)} (A) and {type(storage_b)} '
+            f'(B) is not supported. Both must be either a Storage or a '
+            f'storage factory'
+        )
+    # list() since the registry may change while synchronizing:
+    pairs = [
+        (storage, storage_b(storage.name))
+        for storage in list(storage_a(Storage.AllRegistered))
+    ]
+    # groups as large as possible while still using max_parallel groups:
+    group_size = min(GROUP_COMMIT_SIZE, max(1, -(-len(pairs) // max_parallel)))
+    semaphore = asyncio.Semaphore(max_parallel)
+
+    async def sync_group(group: list[tuple[Storage, Storage]]):
+        async with semaphore:
+            await asyncio.to_thread(_sync_storages, group, only_a_to_b)
+
+    await asyncio.gather(
+        *(
+            sync_group(pairs[start : start + group_size])
+            for start in range(0, len(pairs), group_size)
+        )
+    )
+
+
+@contextmanager
+def _lock_items(*storages: Storage) -> Iterator[None]:
+    '''Lock items against other threads and processes during sync
+
+    Locks are acquired in the order of the storage id() such that concurrent
+    syncs of the same items cannot dead lock.
+    '''
+    with ExitStack() as stack:
+        for storage in sorted(storages, key=lambda storage: storage.id()):
+            stack.enter_context(storage._item_lock().write())
+            stack.enter_context(storage._root_storage().process_lock())
+        yield
+
+
+def _sync_storages(pairs: list[tuple[Storage, Storage]], only_a_to_b: bool):
+    '''Synchronize pairs of storages within one group commit'''
+    with _lock_items(*(storage for pair in pairs for storage in pair)):
+        transfers: list[tuple[Storage, Storage]] = []
+        try:
+            for storage_a, storage_b in pairs:
+                transfer = _get_interrupted_transfer(
+                    storage_a, storage_b
+                ) or _get_transfer(storage_a, storage_b, only_a_to_b)
+                if transfer is not None:
+                    transfers.append(transfer)
+        finally:
+            # also executed on errors for the pairs before the failing one:
+            _execute_sync(transfers)
+
+
+def _get_transfer(
+    storage_a: Storage, storage_b: Storage, only_a_to_b: bool
+) -> tuple[Storage, Storage] | None:
+    '''Decide on the transfer (source, target) to be executed, if any'''
     # TODO: theoretically, this one could sync storage of DIFFERENT names,
     # potentially causing confision.
     log.debug(f'Syncing:\nA={storage_a.id()}\nB={storage_b.id()}')
@@ -146,25 +241,23 @@ def _sync_storage(storage_a: Storage, storage_b: Storage, only_a_to_b: bool):
             f'Storage does not existing on both sides.'
             f'\nA: {storage_a.id()}\nB: {storage_b.id()}'
         )
-        return
+        return None
     if not exists_a and only_a_to_b:
         # nothing can be done is A does not exist
-        return
+        return None
     if not exists_a:
         # b exists and it is not only_a_to_b, so we try to sync:
         log.debug(
             f'Storage B does not existing on A'
             f'\nA: {storage_a.id()}\nB: {storage_b.id()}'
         )
-        _execute_sync(storage_b, storage_a)
-        return
+        return storage_b, storage_a
     if not exists_b:
         log.debug(
             f'Storage A does not existing on B'
             f'\nA: {storage_a.id()}\nB: {storage_b.id()}'
         )
-        _execute_sync(storage_a, storage_b)
-        return
+        return storage_a, storage_b
 
     # Both files exist. We continue normally.
 
@@ -184,8 +277,8 @@ def _sync_storage(storage_a: Storage, storage_b: Storage, only_a_to_b: bool):
     # initially has none.
     if only_a_to_b:
         if meta_a.uuid != last_uuid_a:
-            _execute_sync(storage_a, storage_b)
-        return
+            return storage_a, storage_b
+        return None
     if not last_uuid_a or not last_uuid_b:
         raise AppxfStorageSyncException(
             f'Storage exists on both locations but at least one SyncData did '
@@ -198,17 +291,67 @@ def _sync_storage(storage_a: Storage, storage_b: Storage, only_a_to_b: bool):
             f'Storage changed on both sides. Not yet supported.'
             f'\nA: {storage_a.id()}\nB: {storage_b.id()}'
         )
+    # (logging of transfers in _transfer())
     if meta_a.uuid != last_uuid_a:
-        _execute_sync(storage_a, storage_b)
-        # logging in _execute_sync
-    elif meta_b.uuid != last_uuid_b:
-        _execute_sync(storage_b, storage_a)
-        # logging in _execute_sync
-    else:
-        log.debug(f'Storages did not change.\nA: {storage_a.id()}\nB: {storage_b.id()}')
-
-
-def _execute_sync(source: Storage, target: Storage):
+        return storage_a, storage_b
+    if meta_b.uuid != last_uuid_b:
+        return storage_b, storage_a
+    log.debug(f'Storages did not change.\nA: {storage_a.id()}\nB: {storage_b.id()}')
+    return None
+
+
+def _get_interrupted_transfer(
+    storage_a: Storage, storage_b: Storage
+) -> tuple[Storage, Storage] | None:
+    '''Get transfer (source, target) that was journaled but not completed'''
+    for source, target in ((storage_a, storage_b), (storage_b, storage_a)):
+        journal = target.get_meta('journal')
+        entry = journal.load() if journal.exists() else None
+        if not entry or entry['source'] != source.location:
+            continue
+        target_meta = target.get_meta_data()
+        if (
+            target_meta is not None
+            and target_meta.uuid == entry['uuid']
+            and _get_sync_data(source).get_location_uuid(target) == entry['uuid']
+            and _get_sync_data(target).get_location_uuid(source) == entry['uuid']
+        ):
+            # transfer was completed, only the journal was not cleared:
+            journal.store(None)
+            continue
+        log.warning(f'Repeating interrupted sync from {source.id()} to {target.id()}')
+        return source, target
+    return None
+
+
+def _execute_sync(transfers: list[tuple[Storage, Storage]]):
+    '''Execute transfers (source, target) within one group commit
+
+    A transfer writes the target data and meta data and the sync data on both
+    sides. An interruption would leave inconsistent UUIDs. Therefore, the
+    planned transfers are journaled on the target (meta 'journal') before
+    and cleared after they are executed. An interrupted transfer is repeated
+    by the next sync of the item (see _get_interrupted_transfer()). Each of
+    the three steps is committed once for all files written by this call
+    (see Storage.transaction()) instead of once per written file.
+    '''
+    if not transfers:
+        return
+    with Storage.transaction() as transaction:
+        for source, target in transfers:
+            target.get_meta('journal').store(
+                {'source': source.location, 'uuid': source.get_meta_data().uuid}
+            )
+        transaction.commit()
+        for source, target in transfers:
+            _transfer(source, target)
+        transaction.commit()
+        for _, target in transfers:
+            target.get_meta('journal').store(None)
+        transaction.commit()
+
+
+def _transfer(source: Storage, target: Storage):
 
     log.info(f'Updating from {source.id()} to {target.id()}')
 
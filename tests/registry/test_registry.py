@@ -3,14 +3,18 @@
 import os
 import pytest
 
-from appxf.storage import Storage, CompactSerializer
+from appxf.storage import Storage, CompactSerializer, LocalStorage
 from appxf.registry import (
     Registry,
     AppxfRegistryError,
     AppxfRegistryUnknownUser,
     AppxfRegistryRoleError,
+    SecureSharedStorage,
 )
 
+from appxf.registry._registration_request import RegistrationRequest
+from appxf.security import AppxfSecurityException, Envelope, Security
+
 from tests._fixtures import appxf_objects
 import tests._fixtures.test_sandbox
 
@@ -338,6 +342,68 @@ def test_manual_config_update(admin_user_initialized_registry_pair, request):
     assert user_registry._config.section('fixed_section')['test'] == 'fixed'
 
 
+def test_manual_config_update_delta(admin_user_initialized_registry_pair):
+    admin_registry: Registry = admin_user_initialized_registry_pair[0]
+    user_registry: Registry = admin_user_initialized_registry_pair[1]
+    Storage.switch_context('admin')
+    admin_config = admin_registry._config
+    admin_config.add_section('delta')
+    admin_config.section('delta')['a'] = (str, 'A')
+    admin_config.section('delta')['b'] = (str, 'B')
+    admin_config.add_section('other')
+    admin_config.section('other')['c'] = (str, 'C')
+    section_list = ['delta', 'other']
+
+    full_bytes = admin_registry.get_manual_config_update_bytes(
+        sections=section_list, include_user_db=False
+    )
+    assert admin_registry.config_version == 1
+    user_registry.set_manual_config_update_bytes(full_bytes)
+    assert user_registry.config_version == 1
+    assert user_registry._config.section('delta')['b'] == 'B'
+
+    # no change does not start a new version:
+    admin_registry.get_manual_config_update_bytes(
+        sections=section_list, include_user_db=False, since_version=1
+    )
+    assert admin_registry.config_version == 1
+
+    # delta with a changed and a removed setting (only for the user):
+    admin_config.section('delta')['a'] = 'changed'
+    del admin_config.section('delta')['b']
+    delta_bytes = admin_registry.get_manual_config_update_bytes(
+        sections=section_list, include_user_db=False, since_version=1, user_ids=[2]
+    )
+    assert admin_registry.config_version == 2
+    assert len(delta_bytes) < len(full_bytes)
+    # unchanged sections are not touched:
+    user_registry._config.section('other')['c'] = 'local'
+    user_registry.set_manual_config_update_bytes(delta_bytes)
+    assert user_registry.config_version == 2
+    assert user_registry._config.section('delta')['a'] == 'changed'
+    assert 'b' not in user_registry._config.section('delta')
+    assert user_registry._config.section('other')['c'] == 'local'
+    with pytest.raises(AppxfSecurityException) as exc_info:
+        admin_registry.set_manual_config_update_bytes(delta_bytes)
+    assert 'does not include a key blob' in str(exc_info.value)
+
+    # user missed version 3:
+    admin_config.section('delta')['a'] = 'again'
+    admin_registry.get_manual_config_update_bytes(
+        sections=section_list, include_user_db=False
+    )
+    admin_config.section('other')['c'] = 'C2'
+    delta_bytes = admin_registry.get_manual_config_update_bytes(
+        sections=section_list, include_user_db=False, since_version=3
+    )
+    with pytest.raises(AppxfRegistryError) as exc_info:
+        user_registry.set_manual_config_update_bytes(delta_bytes)
+    assert 'A full update is required' in str(exc_info.value)
+    with pytest.raises(AppxfRegistryError) as exc_info:
+        admin_registry.get_manual_config_update_bytes(since_version=5)
+    assert 'latest version is 4' in str(exc_info.value)
+
+
 def test_manual_update_get_errors(admin_user_initialized_registry_pair):
     user_registry: Registry = admin_user_initialized_registry_pair[1]
 
@@ -388,3 +454,318 @@ def test_manual_update_set_error_unknown_user(
     with pytest.raises(AppxfRegistryRoleError) as exc_info:
         admin_registry.set_manual_config_update_bytes(update_bytes)
     assert 'is not an admin' in str(exc_info.value)
+
+
+@pytest.fixture
+def shared_remote_registry_pair(request):
+    '''Admin and user registry sharing the same remote storage'''
+    Storage.reset()
+    path = tests._fixtures.test_sandbox.init_test_sandbox_from_fixture(request)
+    remote_factory = {}
+    registries = {}
+    for name in ('admin', 'user'):
+        Storage.switch_context(name)
+        remote_factory[name] = LocalStorage.get_factory(
+            path=os.path.join(path, 'remote')
+        )
+        registries[name] = Registry(
+            local_storage_factory=LocalStorage.get_factory(
+                path=os.path.join(path, name)
+            ),
+            remote_storage_factory=remote_factory[name],
+            security=appxf_objects.get_security_unlocked(os.path.join(path, name)),
+            config=appxf_objects.get_dummy_user_config(),
+        )
+    Storage.switch_context('admin')
+    registries['admin'].initialize_as_admin()
+    appxf_objects.perform_registration(
+        registry=registries['user'], admin_registry=registries['admin']
+    )
+
+    yield registries['admin'], registries['user']
+
+    Storage.switch_context('')
+    Storage.reset()
+
+
+def test_user_db_change_log(shared_remote_registry_pair, monkeypatch):
+    admin_registry: Registry = shared_remote_registry_pair[0]
+    user_registry: Registry = shared_remote_registry_pair[1]
+    # adding admin and user was published:
+    assert admin_registry._user_db.log_version == 2
+    assert user_registry._user_db.log_version == 2
+
+    Storage.switch_context('admin')
+    admin_registry.set_roles(2, ['user', 'extra'])
+    admin_registry.sync_with_remote(mode='sending')
+    assert admin_registry._user_db.get_changes() == []
+    Storage.switch_context('user')
+    user_registry.sync_with_remote(mode='receiving')
+    assert user_registry.get_roles(2) == ['user', 'extra']
+    assert user_registry._user_db.log_version == 3
+
+    # changes spanning multiple log segments:
+    monkeypatch.setattr(Registry, 'user_db_log_segment_size', 4)
+    Storage.switch_context('admin')
+    for i in range(10):
+        admin_registry.set_roles(2, ['user', f'role{i}'])
+    admin_registry.sync_with_remote(mode='sending')
+    assert admin_registry._user_db.log_version == 13
+
+    # user only loads segments with new entries (versions 4 to 13):
+    loaded_segments = []
+    get_log = Registry._get_remote_user_db_log
+    monkeypatch.setattr(
+        Registry,
+        '_get_remote_user_db_log',
+        lambda self, segment: loaded_segments.append(segment) or get_log(self, segment),
+    )
+    Storage.switch_context('user')
+    user_registry.sync_with_remote(mode='receiving')
+    assert user_registry.get_roles(2) == ['user', 'role9']
+    assert user_registry._user_db.log_version == 13
+    assert loaded_segments == [0, 1, 2, 3]
+
+
+def test_user_db_change_log_requires_admin(shared_remote_registry_pair):
+    admin_registry: Registry = shared_remote_registry_pair[0]
+    user_registry: Registry = shared_remote_registry_pair[1]
+
+    # user appends a change to the log which was not signed by an admin:
+    Storage.switch_context('user')
+    log_storage = user_registry._get_remote_user_db_log(0)
+    entries = log_storage.load()
+    entries.append(user_registry._sign_user_db_change(3, ['set_roles', 2, ['admin']]))
+    log_storage.store(entries)
+
+    Storage.switch_context('admin')
+    with pytest.raises(AppxfRegistryError) as exc_info:
+        admin_registry.sync_with_remote(mode='receiving')
+    assert 'not signed by an admin' in str(exc_info.value)
+    assert admin_registry.get_roles(2) == ['user']
+
+
+@pytest.fixture
+def admin_and_fresh_user_registries(request):
+    '''Admin registry and three unregistered user registries'''
+    Storage.reset()
+    path = tests._fixtures.test_sandbox.init_test_sandbox_from_fixture(request)
+    registries = {}
+    for name in ('admin', 'user1', 'user2', 'user3'):
+        Storage.switch_context(name)
+        registries[name] = appxf_objects.get_fresh_registry(
+            path=os.path.join(path, name),
+            security=appxf_objects.get_security_unlocked(os.path.join(path, name)),
+            config=appxf_objects.get_dummy_user_config(),
+        )
+    Storage.switch_context('admin')
+    registries['admin'].initialize_as_admin()
+    admin_key_bytes = registries['admin'].get_admin_key_bytes()
+    for name in ('user1', 'user2', 'user3'):
+        Storage.switch_context(name)
+        registries[name].set_admin_key_bytes(admin_key_bytes)
+
+    yield registries
+
+    Storage.switch_context('')
+    Storage.reset()
+
+
+def test_add_users_from_requests(admin_and_fresh_user_registries):
+    registries = admin_and_fresh_user_registries
+    user_names = ['user1', 'user2', 'user3']
+    request_list = []
+    for name in user_names:
+        Storage.switch_context(name)
+        request_list.append(registries[name].get_request_bytes())
+    # a request with keys that conflict with user1:
+    Storage.switch_context('user1')
+    request = RegistrationRequest.new({}, registries['user1']._security)
+    request._data['encryption_key'] = request.encryption_key + b'.'
+    request_list.append(
+        Envelope.seal(
+            registries['user1']._security,
+            kind='registration_request',
+            sections=request.get_sections(),
+            public_keys=registries['admin']._user_db.get_encryption_key_dict(['admin']),
+        )
+    )
+
+    Storage.switch_context('admin')
+    admin_registry: Registry = registries['admin']
+    result = admin_registry.add_users_from_requests(request_list, roles=['user', 'new'])
+    assert [user_id for user_id, _ in result[:3]] == [2, 3, 4]
+    assert result[3][0] < 0
+    assert result[3][1] == b''
+    assert admin_registry.get_users('new') == {2, 3, 4}
+    assert admin_registry.get_roles(3) == ['user', 'new']
+
+    for name, (user_id, response_bytes) in zip(user_names, result):
+        Storage.switch_context(name)
+        registries[name].set_response_bytes(response_bytes)
+        assert registries[name].user_id == user_id
+        assert 'new' in registries[name].get_roles(user_id)
+
+
+def test_add_users_from_requests_invalid(admin_and_fresh_user_registries):
+    registries = admin_and_fresh_user_registries
+    Storage.switch_context('user1')
+    request_list = [registries['user1'].get_request_bytes(), b'invalid']
+
+    Storage.switch_context('admin')
+    admin_registry: Registry = registries['admin']
+    with pytest.raises(AppxfRegistryError) as exc_info:
+        admin_registry.add_users_from_requests(request_list)
+    assert 'Requests [1] are invalid' in str(exc_info.value)
+    # no user was added:
+    assert admin_registry.get_users() == {1}
+
+
+def test_hybrid_encrypt_recipients(admin_user_initialized_registry_pair):
+    admin_registry: Registry = admin_user_initialized_registry_pair[0]
+    user_registry: Registry = admin_user_initialized_registry_pair[1]
+    user_id = user_registry.user_id
+
+    roles = ['new']
+    data_encrypted, key_blob_dict = user_registry.hybrid_encrypt(b'data', roles)
+    # caller's roles are not changed while admin is added:
+    assert roles == ['new']
+    assert set(key_blob_dict) == {1, user_id}
+    assert user_registry.hybrid_decrypt(data_encrypted, key_blob_dict) == b'data'
+    # recipients are reused until the USER_DB changes:
+    recipients = user_registry._get_recipient_key_dict(frozenset(['new', 'admin']))
+    user_registry.hybrid_encrypt(b'data', roles)
+    assert user_registry._get_recipient_key_dict(frozenset(['new', 'admin'])) is (
+        recipients
+    )
+
+    admin_registry.set_roles(user_id, ['user'])
+    data_encrypted, key_blob_dict = admin_registry.hybrid_encrypt(b'data', 'new')
+    assert set(key_blob_dict) == {1}
+
+
+def test_verify_signature_cache(admin_user_initialized_registry_pair, monkeypatch):
+    admin_registry: Registry = admin_user_initialized_registry_pair[0]
+    user_registry: Registry = admin_user_initialized_registry_pair[1]
+    user_id = user_registry.user_id
+    verified_data = []
+    verify_signature = Security.verify_signature
+
+    def counting_verify_signature(data, signature, public_key_bytes):
+        verified_data.append(data)
+        return verify_signature(data, signature, public_key_bytes)
+
+    monkeypatch.setattr(
+        Security, 'verify_signature', staticmethod(counting_verify_signature)
+    )
+    monkeypatch.setattr(admin_registry, 'signature_cache_size', 2)
+    _, signature = user_registry.sign(b'data')
+    for _ in range(2):
+        assert admin_registry.verify_signature(b'data', user_id, signature)
+        assert not admin_registry.verify_signature(b'other', user_id, signature)
+    assert verified_data == [b'data', b'other']
+    # roles are always checked:
+    assert not admin_registry.verify_signature(b'data', user_id, signature, ['admin'])
+    # same for shared storage with signing key:
+    signing_key = user_registry._security.get_signing_public_key()
+    assert admin_registry.verify_key_signature(b'data', signature, signing_key)
+    assert verified_data == [b'data', b'other']
+
+    # least recently used result is dropped:
+    _, signature_3 = user_registry.sign(b'third')
+    assert admin_registry.verify_signature(b'third', user_id, signature_3)
+    assert admin_registry.verify_signature(b'data', user_id, signature)
+    assert not admin_registry.verify_signature(b'other', user_id, signature)
+    assert verified_data == [b'data', b'other', b'third', b'other']
+
+    # USER_DB changes invalidate the results:
+    admin_registry.set_roles(user_id, ['user', 'new'])
+    assert admin_registry.verify_signature(b'data', user_id, signature)
+    assert verified_data[-1] == b'data'
+
+
+@pytest.fixture
+def user_info_registries(request):
+    '''Admin and two users sharing user information for roles a and b'''
+    Storage.reset()
+    path = tests._fixtures.test_sandbox.init_test_sandbox_from_fixture(request)
+    registries = {}
+    for name in ('admin', 'user1', 'user2'):
+        Storage.switch_context(name)
+        config = appxf_objects.get_dummy_config()
+        config.add_section('USER', settings={'name': name})
+        registries[name] = Registry(
+            local_storage_factory=LocalStorage.get_factory(
+                path=os.path.join(path, name)
+            ),
+            remote_storage_factory=LocalStorage.get_factory(
+                path=os.path.join(path, 'remote')
+            ),
+            security=appxf_objects.get_security_unlocked(os.path.join(path, name)),
+            config=config,
+            user_info_roles=['a', 'b'],
+        )
+    Storage.switch_context('admin')
+    registries['admin'].initialize_as_admin()
+    appxf_objects.perform_registration(
+        registry=registries['user1'],
+        admin_registry=registries['admin'],
+        storage_scope='user1',
+        roles=['user', 'a'],
+    )
+    appxf_objects.perform_registration(
+        registry=registries['user2'],
+        admin_registry=registries['admin'],
+        storage_scope='user2',
+        roles=['user', 'b'],
+    )
+
+    yield registries
+
+    Storage.switch_context('')
+    Storage.reset()
+
+
+def test_user_info_per_role(user_info_registries, monkeypatch):
+    registries = user_info_registries
+    admin_registry: Registry = registries['admin']
+    Storage.switch_context('admin')
+    # admin knows all users from the registration:
+    assert admin_registry.get_user_info(1) == {'name': 'admin'}
+    assert admin_registry.get_user_info(3) == {'name': 'user2'}
+
+    Storage.switch_context('user1')
+    registries['user1'].sync_with_remote(mode='receiving')
+    assert registries['user1'].get_user_info(2) == {'name': 'user1'}
+    with pytest.raises(AppxfRegistryUnknownUser):
+        registries['user1'].get_user_info(3)
+
+    # only the role file of role a is written when user2 joins role a:
+    stored = []
+    store_raw = SecureSharedStorage.store_raw
+    monkeypatch.setattr(
+        SecureSharedStorage,
+        'store_raw',
+        lambda self, data: stored.append(self.name) or store_raw(self, data),
+    )
+    Storage.switch_context('admin')
+    admin_registry.set_roles(3, ['user', 'a', 'b'])
+    admin_registry.sync_with_remote(mode='sending')
+    assert 'USER_INFO_a' in stored
+    assert 'USER_INFO_b' not in stored
+    stored.clear()
+    admin_registry.sync_with_remote(mode='sending')
+    assert stored == []
+
+    Storage.switch_context('user1')
+    registries['user1'].sync_with_remote(mode='receiving')
+    assert registries['user1'].get_user_info(3) == {'name': 'user2'}
+
+    # user2 leaves role a:
+    Storage.switch_context('admin')
+    admin_registry.set_roles(3, ['user', 'b'])
+    admin_registry.sync_with_remote(mode='sending')
+    Storage.switch_context('user1')
+    registries['user1'].sync_with_remote(mode='receiving')
+    with pytest.raises(AppxfRegistryUnknownUser):
+        registries['user1'].get_user_info(3)
@@ -0,0 +1,175 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Testing UserDatabase'''
+
+import pytest
+
+from appxf.registry._user_db import UserDatabase
+from appxf.storage import AppxfFrozenError, CompactSerializer, RamStorage, Storage
+
+
+@pytest.fixture
+def user_db():
+    Storage.reset()
+    user_db = UserDatabase(RamStorage())
+    user_db.init_user_db(validation_key=b'val-admin', encryption_key=b'enc-admin')
+    return user_db
+
+
+def test_add_new_duplicates(user_db: UserDatabase):
+    user_id = user_db.add_new(b'val-user', b'enc-user')
+    assert user_id == 2
+    # same keys return existing user with updated roles:
+    assert user_db.add_new(b'val-user', b'enc-user', roles=['user', 'x']) == 2
+    assert user_db.get_roles(2) == ['user', 'x']
+    # one of the keys existing is inconsistent:
+    assert user_db.add_new(b'val-user', b'enc-other') == -2
+    assert user_db.add_new(b'val-other', b'enc-user') == -2
+    assert user_db.add_new(b'val-admin', b'enc-user') == -1
+    assert user_db.get_users() == {1, 2}
+
+
+def test_add_new_after_purge(user_db: UserDatabase):
+    user_db.add_new(b'val-user', b'enc-user')
+    # removed users keep their keys:
+    user_db.remove_user(2)
+    assert user_db.add_new(b'val-user', b'enc-other') == -2
+    # purged users do not:
+    user_db.purge_user(2)
+    assert user_db.get_user_by_validation_key(b'val-user') is None
+    assert user_db.add_new(b'val-user', b'enc-other') == 3
+
+
+def test_key_maps_after_set_state(user_db: UserDatabase):
+    user_db.add_new(b'val-user', b'enc-user')
+    state = user_db.get_state()
+    # the encryption key map is not part of the state:
+    assert '_encryption_key_map' not in state
+
+    restored = UserDatabase(RamStorage())
+    restored.set_state(state)
+    assert restored.get_user_by_validation_key(b'val-user') == 2
+    assert restored.add_new(b'val-other', b'enc-user') == -2
+    assert restored.add_new(b'val-user', b'enc-user') == 2
+
+
+def test_changes_applied_to_other_user_db(user_db: UserDatabase):
+    user_db.add_new(b'val-user', b'enc-user')
+    user_db.set_roles(2, ['user', 'extra'])
+    user_db.remove_user(2)
+    changes = user_db.get_changes()
+    assert [change[0] for change in changes] == ['add', 'add', 'set_roles', 'remove']
+
+    other = UserDatabase(RamStorage())
+    for version, change in enumerate(changes, start=1):
+        other.apply_change(change, version)
+    assert other.get_changes() == []
+    assert other.log_version == 4
+    assert other.get_users() == {1, 2}
+    assert other.get_users('user') == {1}
+    # next user ID is consistent to the applied changes:
+    assert other.add_new(b'val-new', b'enc-new') == 3
+
+    user_db.mark_published(len(changes), 4)
+    assert user_db.get_changes() == []
+    assert '_changes' not in user_db.get_shared_state()
+
+
+def test_encryption_key_dict_cache(user_db: UserDatabase):
+    user_db.add_new(b'val-user', b'enc-user', roles=['user', 'x'])
+    key_dict = user_db.get_encryption_key_dict(['x', 'admin'])
+    assert key_dict == {1: b'enc-admin', 2: b'enc-user'}
+    # same role combination returns the same (frozen) dict:
+    assert user_db.get_encryption_key_dict(['admin', 'X']) is key_dict
+    with pytest.raises(AppxfFrozenError):
+        key_dict[3] = b'enc-other'
+
+    # any change invalidates the cache:
+    for change in (
+        lambda: user_db.set_roles(2, ['user']),
+        lambda: user_db.add_new(b'val-other', b'enc-other', roles=['x']),
+        lambda: user_db.remove_user(3),
+        lambda: user_db.purge_user(3),
+        lambda: user_db.set_state(user_db.get_state()),
+    ):
+        generation = user_db.generation
+        change()
+        assert user_db.generation > generation
+        assert user_db.get_encryption_key_dict(['x', 'admin']) is not key_dict
+        key_dict = user_db.get_encryption_key_dict(['x', 'admin'])
+    assert key_dict == {1: b'enc-admin'}
+
+
+def test_state_layout(user_db: UserDatabase):
+    user_db.add_new(b'val-user', b'enc-user', roles=['user', 'x'])
+    user_db.add_new(b'val-other', b'enc-other')
+    # replaced and purged keys are not stored:
+    user_db.add(2, b'val-new', b'enc-new', ['user', 'x'])
+    user_db.purge_user(3)
+    state = user_db.get_state()
+    assert state['_roles'] == ['admin', 'user', 'x']
+    assert state['_key_data'] == b'val-adminenc-adminval-newenc-new'
+    # one byte per mask (slot 0 is not used):
+    assert state['_role_mask_data'] == bytes([1, 0xFF, 0b011, 0b110, 0xFF])
+
+    restored = UserDatabase(RamStorage())
+    restored.set_state(
+        CompactSerializer.deserialize(CompactSerializer.serialize(state))
+    )
+    assert restored.get_users() == {1, 2}
+    assert restored.get_users('x') == {2}
+    assert restored.get_roles(1) == ['admin', 'user']
+    assert restored.has_role(2, 'X')
+    assert not restored.has_role(3, 'user')
+    assert restored.get_verification_key(2) == b'val-new'
+    assert restored.get_encryption_key(1) == b'enc-admin'
+    assert restored.get_user_by_validation_key(b'val-user') is None
+
+
+def test_state_many_roles(user_db: UserDatabase):
+    roles = [f'role{i}' for i in range(100)]
+    user_db.add_new(b'val-user', b'enc-user', roles=roles)
+    user_db.set_roles(1, ['admin', 'role70'])
+    state = user_db.get_state()
+    # 102 roles and the sign bit need 13 bytes per mask:
+    assert state['_role_mask_data'][0] == 13
+
+    restored = UserDatabase(RamStorage())
+    restored.set_state(state)
+    assert restored.get_roles(2) == roles
+    assert restored.get_users('role70') == {1, 2}
+
+
+def test_state_version_1(user_db: UserDatabase):
+    # state as stored before the columnar layout:
+    state = {
+        '_version': 1,
+        '_next_id': 4,
+        '_unused_id_list': [2],
+        '_user_db': {
+            1: {
+                'id': 1,
+                'roles': ['user', 'admin'],
+                'validation_key': b'val-admin',
+                'encryption_key': b'enc-admin',
+            },
+            3: {
+                'id': 3,
+                'roles': ['user', 'x'],
+                'validation_key': b'val-user',
+                'encryption_key': b'enc-user',
+            },
+        },
+        '_role_map': {'admin': {1}, 'user': {1, 3}, 'x': {3}},
+        '_validation_key_map': {b'val-admin': 1, b'val-user': 3},
+        '_changes': [],
+        '_log_version': 2,
+    }
+    restored = UserDatabase(RamStorage())
+    restored.set_state(state)
+    assert restored.get_users() == {1, 3}
+    assert restored.get_users('x') == {3}
+    assert restored.get_encryption_key(3) == b'enc-user'
+    assert restored.log_version == 2
+    assert restored.add_new(b'val-new', b'enc-new') == 4
+    assert restored.get_state()['_version'] == 2
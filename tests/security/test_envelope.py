@@ -0,0 +1,100 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Tests for Envelope in security module'''
+
+import hashlib
+import os
+import pytest
+
+from appxf.security import (
+    AppxfEnvelopeError,
+    AppxfSecurityException,
+    AppxfSecuritySignatureError,
+    Envelope,
+    Security,
+)
+from appxf.storage import Storage
+
+from tests._fixtures import test_sandbox, appxf_objects
+
+SECTIONS = {'text': b'some text', 'empty': b'', 'binary': bytes(range(256)) * 10}
+
+
+@pytest.fixture
+def security_pair(request):
+    '''Provide unlocked Security objects for author and recipient'''
+    Storage.reset()
+    path = test_sandbox.init_test_sandbox_from_fixture(request, cleanup=True)
+    author = appxf_objects.get_security_unlocked(os.path.join(path, 'author'))
+    recipient = appxf_objects.get_security_unlocked(os.path.join(path, 'recipient'))
+    return author, recipient
+
+
+def test_envelope_cycle(security_pair):
+    author, recipient = security_pair
+    recipient_key = recipient.get_encryption_public_key()
+    data = Envelope.seal(
+        author,
+        kind='test',
+        sections=SECTIONS,
+        public_keys={1: author.get_encryption_public_key(), 2: recipient_key},
+    )
+    # payload is not expanded (no base64):
+    assert len(data) < sum(len(content) for content in SECTIONS.values()) + 2000
+    for security, identifier in [(author, 1), (recipient, 2)]:
+        envelope = Envelope.open(security, data, blob_identifier=identifier)
+        assert envelope.kind == 'test'
+        assert envelope.author == author.get_signing_public_key()
+        assert list(envelope.sections) == list(SECTIONS)
+        for name, content in SECTIONS.items():
+            assert envelope.sections[name] == content
+
+    # key blob identified by public key, default for open():
+    data = Envelope.seal(author, 'test', SECTIONS, {recipient_key: recipient_key})
+    envelope = Envelope.open(recipient, data, kind='test')
+    assert bytes(envelope.sections['text']) == b'some text'
+
+
+def test_envelope_signature_digest(security_pair):
+    author, _ = security_pair
+    data = b'signed in parts'
+    signature = author.sign_digest(hashlib.sha256(data).digest())
+    # equivalent to signing the data:
+    assert Security.verify_signature(data, signature, author.get_signing_public_key())
+
+
+def test_envelope_invalid(security_pair):
+    author, recipient = security_pair
+    recipient_key = recipient.get_encryption_public_key()
+    data = Envelope.seal(author, 'test', SECTIONS, {2: recipient_key})
+
+    with pytest.raises(AppxfEnvelopeError) as exc_info:
+        Envelope.open(recipient, data, blob_identifier=2, kind='other')
+    assert 'Expected envelope with other but got test' in str(exc_info.value)
+    with pytest.raises(AppxfSecurityException) as exc_info:
+        Envelope.open(recipient, data, blob_identifier=1)
+    assert 'does not include a key blob' in str(exc_info.value)
+    with pytest.raises(AppxfEnvelopeError) as exc_info:
+        Envelope.open(recipient, b'not an envelope', blob_identifier=2)
+    assert 'not an envelope' in str(exc_info.value)
+    with pytest.raises(AppxfEnvelopeError) as exc_info:
+        Envelope.open(recipient, data[:-1], blob_identifier=2)
+    assert 'modified' in str(exc_info.value)
+    modified = bytearray(data)
+    modified[-100] ^= 1
+    with pytest.raises(AppxfEnvelopeError):
+        Envelope.open(recipient, bytes(modified), blob_identifier=2)
+    with pytest.raises(AppxfEnvelopeError):
+        Envelope.open(recipient, data[:20], blob_identifier=2)
+
+
+def test_envelope_wrong_signature(security_pair, monkeypatch):
+    author, recipient = security_pair
+    # signature of other data:
+    signature = author.sign(b'other data')
+    monkeypatch.setattr(author, 'sign_digest', lambda digest: signature)
+    data = Envelope.seal(
+        author, 'test', SECTIONS, {2: recipient.get_encryption_public_key()}
+    )
+    with pytest.raises(AppxfSecuritySignatureError):
+        Envelope.open(recipient, data, blob_identifier=2)
@@ -140,6 +140,22 @@ def test_security_sign_verify(sandbox_path):
     assert not sec.verify_signature(data, signature, sec.get_encryption_public_key())
 
 
+def test_security_sign_after_key_change(sandbox_path):
+    sec = appxf_objects.get_security_unlocked(sandbox_path, TEST_PASSWORD)
+    data = b'To Be Signed'
+    sec.sign(data)
+    # regenerated keys are used for signing:
+    sec._generate_signing_keys()
+    assert sec.verify_signature(data, sec.sign(data), sec.get_signing_public_key())
+    # as well as keys changed by another instance when unlocking again:
+    Storage.reset()
+    other = appxf_objects.get_security_unlocked(sandbox_path, TEST_PASSWORD)
+    other._generate_signing_keys()
+    sec.unlock_user(TEST_PASSWORD)
+    assert sec.get_signing_public_key() == other.get_signing_public_key()
+    assert sec.verify_signature(data, sec.sign(data), other.get_signing_public_key())
+
+
 # Hybrid encrypt/decrypt cycle:
 def test_security_hybrid_encrypt_decrypt(sandbox_path):
     sec = appxf_objects.get_security_unlocked(sandbox_path, TEST_PASSWORD)
@@ -5,12 +5,16 @@
 Note that most functionality is covered with tests in test_setting_types.
 '''
 
+import copy
+import pickle
+
 import pytest
 
 from appxf.setting import Setting
 from appxf.setting import AppxfSettingError
 
 from appxf.setting import base_types as base_types_module
+from appxf.setting import setting as setting_module
 # pylint: disable=protected-access
 # pylint: disable=missing-function-docstring
 
@@ -114,3 +118,103 @@ def test_configparser_validation_wrong_type():
     )
     assert not validity
     assert value == 'default'
+
+
+#########################################
+# compact representation
+# /
+
+
+def test_setting_compact_no_instance_dict():
+    setting = Setting.new('int', 42)
+    assert not hasattr(setting, '__dict__')
+
+
+def test_setting_compact_shared_default_options():
+    setting_one = Setting.new('string', 'one')
+    setting_two = Setting.new('string', 'two')
+    # settings without options share the default options..
+    assert setting_one._options is setting_two._options
+    # ..until options are accessed:
+    setting_one.options.name = 'one'
+    assert setting_one._options is not setting_two._options
+    assert setting_two.options.name == ''
+    # construction with options never uses the shared options:
+    setting_three = Setting.new('string', 'three', name='three')
+    assert setting_three._options is not setting_two._options
+
+
+def test_setting_compact_input_stored_on_conversion_only():
+    setting = Setting.new('int', 42)
+    assert setting.input == 42
+    assert setting._input is setting_module._INPUT_IS_VALUE
+    setting.value = '43'
+    assert setting.input == '43'
+    assert setting.value == 43
+
+
+def test_setting_compact_input_marker_copy_and_pickle():
+    marker = setting_module._INPUT_IS_VALUE
+    assert copy.copy(marker) is marker
+    assert copy.deepcopy(marker) is marker
+    assert pickle.loads(pickle.dumps(marker)) is marker
+
+
+@pytest.mark.parametrize(
+    'duplicate',
+    [copy.deepcopy, lambda setting: pickle.loads(pickle.dumps(setting))],
+    ids=['deepcopy', 'pickle'],
+)
+def test_setting_compact_input_copy_and_pickle(duplicate):
+    setting = duplicate(Setting.new('int', 42))
+    assert setting._input is setting_module._INPUT_IS_VALUE
+    assert setting.input == 42
+    setting = duplicate(Setting.new('int', '43'))
+    assert setting.input == '43'
+    assert setting.value == 43
+
+
+#########################################
+# change notification
+# /
+
+
+def test_setting_subscribe_value_change():
+    setting = Setting.new('int', 42)
+    changes = []
+    setting.subscribe(changes.append)
+    setting.value = '43'
+    assert len(changes) == 1
+    assert changes[0].setting is setting
+    # no notification if value and input remain:
+    setting.value = '43'
+    assert len(changes) == 1
+    # input change only is a change:
+    setting.value = 43
+    assert len(changes) == 2
+
+    setting.unsubscribe(changes.append)
+    assert not setting.has_subscribers()
+    setting.value = 44
+    assert len(changes) == 2
+
+
+def test_setting_subscribe_batch_changes():
+    setting = Setting.new('int', 42)
+    changes = []
+    setting.subscribe(changes.append)
+    with setting.batch_changes():
+        setting.value = 1
+        with setting.batch_changes():
+            setting.value = 2
+        setting.value = 3
+        assert not changes
+    assert len(changes) == 1
+    assert setting.value == 3
+
+
+def test_setting_unsubscribe_unknown():
+    setting = Setting.new('int', 42, name='test')
+    with pytest.raises(AppxfSettingError) as exc_info:
+        setting.unsubscribe(print)
+    assert 'SettingInt(test) does not have the callback' in str(exc_info.value)
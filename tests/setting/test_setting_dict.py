@@ -556,6 +556,72 @@ def _verify_get_state_keys(
             )
 
 
+# REQ: Subscribers shall be notified about added, removed and changed settings.
+def test_setting_dict_subscribe():
+    setting_dict = SettingDict(settings={'a': 1, 'b': 2})
+    changes = []
+    setting_dict.subscribe(changes.append)
+    setting_dict['c'] = 3
+    setting_dict['a'] = 10
+    setting_dict.get_setting('b').value = 20
+    del setting_dict['c']
+    assert [change.added for change in changes] == [{'c'}, set(), set(), set()]
+    assert [change.changed for change in changes] == [set(), {'a'}, {'b'}, set()]
+    assert [change.removed for change in changes] == [set(), set(), set(), {'c'}]
+    # replacing a setting object
+    setting_int = SettingInt(5)
+    setting_dict['a'] = setting_int
+    assert changes[-1].changed == {'a'}
+    setting_int.value = 6
+    assert changes[-1].changed == {'a'}
+    assert len(changes) == 6
+
+    # after unsubscribing, no callbacks remain on maintained settings:
+    setting_dict.unsubscribe(changes.append)
+    assert not setting_int.has_subscribers()
+    setting_int.value = 7
+    assert len(changes) == 6
+
+
+# REQ: set_state() shall notify subscribers once with all changes.
+def test_setting_dict_subscribe_set_state_coalesced():
+    setting_dict = SettingDict(
+        settings={f'key{i}': (int, i) for i in range(1000)} | {'nested': {'x': 1}}
+    )
+    data = setting_dict.get_state()
+    for i in range(1000):
+        data[f'key{i}'] = i + 1
+    data['nested']['x'] = 2
+    changes = []
+    setting_dict.subscribe(changes.append)
+    setting_dict.set_state(data)
+    assert len(changes) == 1
+    assert changes[0].changed == {f'key{i}' for i in range(1000)} | {'nested'}
+
+
+# REQ: set_state() changes shall be coalesced to the net structural change.
+def test_setting_dict_subscribe_set_state_structure():
+    setting_dict = SettingDict(settings={'a': 1, 'b': 2})
+    changes = []
+    setting_dict.subscribe(changes.append)
+    setting_dict.set_state(
+        {
+            '_version': 2,
+            'b': {'type': 'int', 'value': 3},
+            'c': {'type': 'int', 'value': 4},
+        },
+        type=True,
+        add_new_keys=True,
+        remove_missing_keys=True,
+        exception_on_new_key=False,
+        exception_on_missing_key=False,
+    )
+    assert len(changes) == 1
+    assert changes[0].added == {'c'}
+    assert changes[0].removed == {'a'}
+    assert changes[0].changed == {'b'}
+
+
 # REQ: get_state() shall include only the INPUT values for all settings. This
 # applies to default options and export options.
 def test_setting_dict_get_state_content_default():
@@ -665,6 +731,18 @@ def test_setting_dict_get_state_nested_dict_with_options():
     assert data['_settings']['test']['_settings']['int']['value'] == '42'
 
 
+# REQ: get_state() of nested dicts with values only shall include the same
+# data as get_state() of the maintained settings.
+def test_setting_dict_get_state_nested_values_only():
+    setting_select = Setting.new('select::int', select_map={'one': 1}, value='one')
+    setting_dict = SettingDict(
+        settings={'test': {'int': (int, '42'), 'select': setting_select}}
+    )
+    data = setting_dict.get_state()
+    assert list(data.keys()) == ['_version', 'test']
+    assert data['test'] == {'int': '42', 'select': setting_select.get_state()}
+
+
 # REQ: set_state() shall restore a setting VALUE and INPUT if the setting is
 # already existing.
 def test_setting_dict_set_state_default():
@@ -186,6 +186,25 @@ class BaseSettingTest:
                 f'value as invalid: "{value}"'
             )
 
+    def test_convert_many(self):
+        setting = self.setting_class()
+        values = (
+            [case.input for case in self.valid_input]
+            + self.invalid_init
+            + [self.setting_class.get_default()]
+        )
+        valid, converted = setting.convert_many(values)
+        assert valid == setting.validate_many(values)
+        for index, value in enumerate(values):
+            expected_valid, expected_value = setting._validated_conversion(value)
+            assert valid[index] == expected_valid, (
+                f'{self.setting_class} convert_many() differs from '
+                f'_validated_conversion() for value: "{value}"'
+            )
+            # Note: SettingDict returns error details for invalid values
+            if expected_valid:
+                assert converted[index] == expected_value
+
     def test_setting_value_valid(self):
         for case in self.valid_input:
             setting = self.setting_class()
@@ -423,6 +442,22 @@ def test_base64_wrong_size():
     assert setting.validate('AAEA')
 
 
+def test_convert_many_numeric_array():
+    numpy = pytest.importorskip('numpy')
+    assert SettingInt().convert_many(numpy.array([1, 2])) == ([True, True], [1, 2])
+    assert SettingFloat().convert_many(numpy.array([1, 2])) == (
+        [True, True],
+        [1.0, 2.0],
+    )
+    # SettingInt does not accept floats - like for single values:
+    assert SettingInt().convert_many(numpy.array([1.5])) == ([False], [0])
+    # non numeric arrays are handled by their python values:
+    assert SettingInt().convert_many(numpy.array(['3', 'x'])) == (
+        [True, False],
+        [3, 0],
+    )
+
+
 def test_setting_completeness():
     # Get expected classes and type declarations:
     expected_classes = set(setting_module._SettingMeta.type_map.values())
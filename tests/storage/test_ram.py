@@ -5,9 +5,25 @@
 Utilizing BaseStorageTest for test cases. See test_storage_base.py
 '''
 
+import pickle
+from copy import deepcopy
+
 import pytest
-from appxf.storage import RamStorage, Storage
+from appxf.storage import (
+    AppxfFrozenError,
+    AppxfStorageError,
+    CompactSerializer,
+    JsonSerializer,
+    LocalStorage,
+    CopyOnWrite,
+    MetaData,
+    RamStorage,
+    Storage,
+    freeze,
+    sync,
+)
 
+from tests._fixtures import test_sandbox
 from tests.storage.test_storage_base import BaseStorageTest
 
 
@@ -27,3 +43,88 @@ class TestRamStorage(BaseStorageTest):
 
     def _get_storage(self) -> Storage:
         return RamStorage('test')
+
+
+class TestRamStorageSnapshot(BaseStorageTest):
+    '''run basic Storage tests for RamStorage in snapshot mode'''
+
+    def _get_storage(self) -> Storage:
+        return RamStorage('test', copy_mode='snapshot')
+
+
+def test_ram_snapshot_zero_copy():
+    storage = RamStorage('test', copy_mode='snapshot')
+    data = {'list': [1, 2], 'set': {3}, 'nested': ({'a': 1},)}
+    storage.store(data)
+    # stored data is independent from the caller's data:
+    data['list'].append(3)
+    loaded = storage.load()
+    assert loaded == {'list': [1, 2], 'set': {3}, 'nested': ({'a': 1},)}
+    assert isinstance(loaded, dict)
+    assert isinstance(loaded['list'], list)
+    # no copy on load:
+    assert storage.load() is loaded
+    with pytest.raises(AppxfFrozenError):
+        loaded['new'] = 1
+    with pytest.raises(AppxfFrozenError):
+        loaded['list'].append(3)
+    with pytest.raises(AppxfFrozenError):
+        loaded['nested'][0]['a'] = 2
+    # deepcopy results in a mutable version:
+    mutable = deepcopy(loaded)
+    mutable['list'].append(3)
+    assert type(mutable['list']) is list
+    assert loaded['list'] == [1, 2]
+
+
+def test_ram_copy_on_write():
+    storage = RamStorage('test', copy_mode='snapshot')
+    storage.store({'list': [1, 2]})
+    wrapper = storage.load_copy_on_write()
+    assert isinstance(wrapper, CopyOnWrite)
+    assert wrapper.value is storage.load()
+    assert not wrapper.copied
+    wrapper.mutable()['list'].append(3)
+    assert wrapper.value == {'list': [1, 2, 3]}
+    assert storage.load() == {'list': [1, 2]}
+
+
+@pytest.mark.parametrize('copy_mode', RamStorage.copy_modes)
+def test_ram_copy_mode_sync(copy_mode):
+    storage_a = RamStorage('test', ram_area='a', copy_mode=copy_mode)
+    storage_b = RamStorage('test', ram_area='b', copy_mode=copy_mode)
+    storage_a.store({'list': [1, 2]})
+    assert isinstance(storage_a.get_meta_data(), MetaData)
+    sync(storage_a, storage_b)
+    assert storage_b.load() == {'list': [1, 2]}
+    storage_b.store({'list': [3]})
+    sync(storage_a, storage_b)
+    assert storage_a.load() == {'list': [3]}
+
+
+@pytest.mark.parametrize('serializer', [CompactSerializer, JsonSerializer])
+def test_ram_snapshot_sync_to_local(request, serializer):
+    path = test_sandbox.init_test_sandbox_from_fixture(request)
+    storage_ram = RamStorage('test', copy_mode='snapshot')
+    storage_local = LocalStorage('test', path=path, serializer=serializer)
+    data = {'list': [1, {'set': {2}}], 'tuple': ([3],)}
+    storage_ram.store(data)
+    sync(storage_ram, storage_local)
+    assert storage_local.load() == data
+    # loaded snapshots can also be stored directly:
+    storage_local.store(storage_ram.load())
+    assert storage_local.load() == data
+
+
+def test_ram_invalid_copy_mode():
+    with pytest.raises(AppxfStorageError):
+        RamStorage('test', copy_mode='none')
+
+
+def test_frozen_pickle_to_mutable():
+    loaded = freeze({'list': [1], 'set': {2}})
+    restored = pickle.loads(pickle.dumps(loaded))
+    assert restored == {'list': [1], 'set': {2}}
+    assert type(restored) is dict
+    assert type(restored['list']) is list
+    assert type(restored['set']) is set
@@ -111,3 +111,74 @@ def test_storage_copmlex_derivative():
     assert DerivateOneAbstract.__abstractmethods__
     assert not DerivativeTwoRoot.__abstractmethods__
     assert not DerivativeThree.__abstractmethods__
+
+
+def test_storage_registry_all_registered_and_reset():
+    from appxf.storage import RamStorage, Storage
+
+    class Wrapper(Storage):
+        def __init__(self, base_storage: Storage):
+            super().__init__(
+                name=base_storage.name,
+                location=base_storage.location,
+                base_storage=base_storage,
+            )
+
+        @classmethod
+        def get(cls, base_storage: Storage) -> Storage:
+            return super().get(
+                name=base_storage.name,
+                location=base_storage.location,
+                storage_init_fun=lambda: Wrapper(base_storage),
+            )
+
+        @classmethod
+        def get_factory(cls, base_storage_factory: Storage.Factory) -> Storage.Factory:
+            return super().get_factory(
+                base_storage=base_storage_factory,
+                storage_get_fun=lambda name: Wrapper.get(base_storage_factory(name)),
+            )
+
+        def exists(self) -> bool:
+            return self.base_storage.exists()
+
+        def store_raw(self, data: object):
+            self.base_storage.store_raw(data)
+
+        def load_raw(self) -> object:
+            return self.base_storage.load_raw()
+
+    Storage.reset()
+    ram_factory = RamStorage.get_factory(ram_area='area')
+    wrapper_factory = Wrapper.get_factory(ram_factory)
+    for i in range(10):
+        ram_factory(f'ram{i}')
+    for i in range(5):
+        wrapper_factory(f'wrapped{i}')
+    # derived storages replace the base storage objects in the base registry:
+    assert len(list(ram_factory(Storage.AllRegistered))) == 15
+    assert sorted(
+        storage.name for storage in wrapper_factory(Storage.AllRegistered)
+    ) == [f'wrapped{i}' for i in range(5)]
+
+    # resetting the derived class also unregisters from the base class:
+    Wrapper.reset()
+    assert not list(wrapper_factory(Storage.AllRegistered))
+    assert len(list(ram_factory(Storage.AllRegistered))) == 10
+    Storage.reset()
+    assert not list(ram_factory(Storage.AllRegistered))
+
+
+def test_storage_get_meta_own_meta_storages():
+    from appxf.storage import RamStorage, Storage
+
+    Storage.reset()
+    storage = RamStorage('item', ram_area='meta_views')
+    meta = storage.get_meta('sync')
+    assert storage.get_meta('sync') is meta
+    # a meta storage has it's own meta storages:
+    meta_of_meta = meta.get_meta('journal')
+    assert 'journal' not in storage._meta_storages
+    assert meta_of_meta is not storage.get_meta('journal')
+    assert meta_of_meta.meta == 'journal'
+    assert meta.meta == 'sync'
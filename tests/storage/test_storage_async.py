@@ -0,0 +1,67 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Testing asynchronous storage access and async_sync()
+
+Basic aload()/astore() are covered by BaseStorageTest, see
+test_storage_base.py.
+'''
+
+import asyncio
+import os.path
+
+import pytest
+
+from appxf.storage import LocalStorage, RamStorage, Storage, async_sync, sync
+from appxf.storage.sync import AppxfStorageSyncException
+from tests._fixtures import test_sandbox
+
+
+@pytest.fixture(autouse=True)
+def setup_storage():
+    Storage.reset()
+
+
+def test_async_sync_factories(request):
+    path = test_sandbox.init_test_sandbox_from_fixture(request)
+    factory_a = LocalStorage.get_factory(path=os.path.join(path, 'a'))
+    factory_b = LocalStorage.get_factory(path=os.path.join(path, 'b'))
+    for i in range(20):
+        factory_a(f'item{i}').store({'index': i})
+
+    asyncio.run(async_sync(factory_a, factory_b, max_parallel=4))
+    for i in range(20):
+        assert factory_b(f'item{i}').load() == {'index': i}
+        assert (
+            factory_b(f'item{i}').get_meta_data().uuid
+            == factory_a(f'item{i}').get_meta_data().uuid
+        )
+
+    # change on B is synchronized back and result is consistent to sync():
+    factory_b('item3').store({'index': 'changed'})
+    asyncio.run(async_sync(factory_a, factory_b))
+    assert factory_a('item3').load() == {'index': 'changed'}
+    sync(factory_a, factory_b)
+    assert factory_a('item3').load() == {'index': 'changed'}
+
+
+def test_async_sync_storages():
+    storage_a = RamStorage.get('item', ram_area='a')
+    storage_b = RamStorage.get('item', ram_area='b')
+    storage_a.store('data')
+    asyncio.run(async_sync(storage_a, storage_b))
+    assert storage_b.load() == 'data'
+
+
+def test_async_sync_unsupported():
+    with pytest.raises(AppxfStorageSyncException):
+        asyncio.run(async_sync(RamStorage.get('item'), RamStorage.get_factory('other')))
+
+
+def test_async_overlapping_access():
+    storages = [RamStorage.get(f'item{i}', ram_area='overlap') for i in range(10)]
+
+    async def run():
+        await asyncio.gather(*(storage.astore(i) for i, storage in enumerate(storages)))
+        return await asyncio.gather(*(storage.aload() for storage in storages))
+
+    assert asyncio.run(run()) == list(range(10))
@@ -6,6 +6,7 @@ See specific test files for storage object related tests and implementation
 specific tests. Like in storage module: RamStorage or LocalStorage.
 '''
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from appxf.storage import Storage, MetaData
@@ -57,6 +58,18 @@ class BaseStorageTest(ABC):
         self.storage.store('new')
         assert 'new' == self.storage.load()
 
+    def test_async_store_load(self):
+        async def run():
+            assert await self.storage.aexists() is False
+            await self.storage.astore('init')
+            assert await self.storage.aexists() is True
+            return await self.storage.aload()
+
+        assert asyncio.run(run()) == 'init'
+        # same data as with synchronous access, including meta data:
+        assert self.storage.load() == 'init'
+        assert self.storage.get_meta_data() is not None
+
     def test_item_meta_data(self):
         # Nothing there means nothing stored
         meta = self.storage.get_meta_data()
@@ -97,3 +110,16 @@ class BaseStorageTest(ABC):
         other_two_reload = self.storage.get_meta('other').load()
         assert other_two == other_two_reload
         assert other_two is not other_two_reload
+
+    def test_meta_storage_reused(self):
+        meta_storage = self.storage.get_meta('other')
+        # meta storage is created once and not copied on each access:
+        assert self.storage.get_meta('other') is meta_storage
+        assert meta_storage.meta == 'other'
+        assert self.storage.meta == ''
+        assert self.storage.get_meta('meta') is not meta_storage
+        # same state as the originating storage (or its base storage):
+        origin = self.storage.base_storage or self.storage
+        assert meta_storage.name == origin.name
+        assert meta_storage.location == origin.location
+        assert type(meta_storage) is type(origin)
@@ -0,0 +1,117 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Testing LocalStorage shared between processes
+
+See appxf.storage.locking for the concurrency model.
+'''
+
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+import appxf
+from appxf.storage import AppxfStorageLockTimeout, LocalStorage, Storage, sync
+from tests._fixtures import test_sandbox
+
+SOURCE_PATH = str(Path(appxf.__file__).parent.parent)
+
+
+def start_process(script: str) -> subprocess.Popen:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [SOURCE_PATH] + ([env['PYTHONPATH']] if 'PYTHONPATH' in env else [])
+    )
+    return subprocess.Popen(
+        [sys.executable, '-c', textwrap.dedent(script)],
+        env=env,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+
+@pytest.fixture(autouse=True)
+def setup_storage():
+    Storage.reset()
+
+
+def test_store_waits_for_other_process(request):
+    path = test_sandbox.init_test_sandbox_from_fixture(request)
+    storage = LocalStorage.get(file='item', path=path)
+    process = start_process(f'''
+        import time
+        from appxf.storage import LocalStorage
+        storage = LocalStorage.get(file='item', path={path!r})
+        with storage.process_lock():
+            print('locked', flush=True)
+            time.sleep(1)
+        ''')
+    assert process.stdout.readline().strip() == 'locked'
+    with pytest.raises(AppxfStorageLockTimeout):
+        storage.process_lock().acquire(timeout=0.1)
+    # store() waits until the other process released the lock:
+    storage.store('data')
+    assert process.wait(timeout=10) == 0
+    assert storage.load() == 'data'
+
+
+def test_concurrent_processes_store_load(request):
+    path = test_sandbox.init_test_sandbox_from_fixture(request)
+    storage = LocalStorage.get(file='item', path=path)
+    storage.store({'index': 0, 'payload': ''})
+    processes = [
+        start_process(f'''
+            from appxf.storage import LocalStorage
+            storage = LocalStorage.get(file='item', path={path!r})
+            for i in range(50):
+                value = {index} * 1000 + i
+                storage.store({{'index': value, 'payload': 'x' * (value % 5000)}})
+            ''')
+        for index in range(1, 4)
+    ]
+    # readers do not lock but never see partially written files:
+    while any(process.poll() is None for process in processes):
+        data = storage.load()
+        assert len(data['payload']) == data['index'] % 5000
+        assert storage.get_meta_data() is not None
+    assert all(process.returncode == 0 for process in processes)
+
+
+def test_concurrent_processes_sync(request):
+    path = test_sandbox.init_test_sandbox_from_fixture(request)
+    shared_path = os.path.join(path, 'shared')
+    # two instances with their own local location syncing the same shared
+    # location at the same time:
+    processes = [
+        start_process(f'''
+            import os.path
+            from appxf.storage import LocalStorage, sync
+            local = LocalStorage.get_factory(path=os.path.join({path!r}, '{name}'))
+            shared = LocalStorage.get_factory(path={shared_path!r})
+            local('common').store('{name}')
+            for i in range(20):
+                local(f'{name}{{i}}').store(i)
+            for _ in range(3):
+                sync(local, shared, only_a_to_b=True)
+            ''')
+        for name in ('one', 'two')
+    ]
+    assert all(process.wait(timeout=60) == 0 for process in processes)
+
+    shared = LocalStorage.get_factory(path=shared_path)
+    for name in ('one', 'two'):
+        for i in range(20):
+            assert shared(f'{name}{i}').load() == i
+    assert shared('common').load() in ('one', 'two')
+    # shared location is consistent to be synced from:
+    target = LocalStorage.get_factory(path=os.path.join(path, 'target'))
+    for name in ('one', 'two'):
+        for i in range(20):
+            shared(f'{name}{i}')
+    shared('common')
+    sync(shared, target)
+    assert target('one3').load() == 3
+    assert target('common').load() == shared('common').load()
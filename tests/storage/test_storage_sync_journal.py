@@ -0,0 +1,210 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Testing the journal and group commit of sync()'''
+
+import asyncio
+import importlib
+import os.path
+import threading
+import time
+
+import pytest
+
+from appxf.storage import LocalStorage, Storage, async_sync, sync
+from appxf.storage.sync import SyncData
+from tests._fixtures import test_sandbox
+
+# (the facade's sync() function shadows the module)
+sync_module = importlib.import_module('appxf.storage.sync')
+
+
+@pytest.fixture(autouse=True)
+def setup_storage():
+    Storage.reset()
+
+
+def get_factories(request):
+    path = test_sandbox.init_test_sandbox_from_fixture(request)
+    return (
+        LocalStorage.get_factory(path=os.path.join(path, 'a')),
+        LocalStorage.get_factory(path=os.path.join(path, 'b')),
+    )
+
+
+def test_interrupted_sync_is_repeated(request, monkeypatch):
+    factory_a, factory_b = get_factories(request)
+    factory_a('item').store('data')
+
+    # crash after writing the target data, before updating the sync data:
+    def crash(self):
+        raise KeyboardInterrupt()
+
+    with monkeypatch.context() as patch:
+        patch.setattr(SyncData, 'store', crash)
+        with pytest.raises(KeyboardInterrupt):
+            sync(factory_a, factory_b)
+    assert factory_b('item').get_meta('journal').load()
+
+    # next sync completes the transfer:
+    sync(factory_a, factory_b)
+    assert factory_b('item').get_meta('journal').load() is None
+    assert factory_b('item').load() == 'data'
+    assert (
+        factory_b('item').get_meta_data().uuid == factory_a('item').get_meta_data().uuid
+    )
+
+    # and nothing is left to be transferred:
+    transfers = []
+    monkeypatch.setattr(sync_module, '_transfer', lambda *args: transfers.append(args))
+    sync(factory_a, factory_b)
+    assert not transfers
+
+
+def test_completed_journal_is_cleared(request, monkeypatch):
+    factory_a, factory_b = get_factories(request)
+    factory_a('item').store('data')
+    sync(factory_a, factory_b)
+    # journal that was not cleared after completing:
+    factory_b('item').get_meta('journal').store(
+        {
+            'source': factory_a('item').location,
+            'uuid': factory_a('item').get_meta_data().uuid,
+        }
+    )
+
+    transfers = []
+    monkeypatch.setattr(sync_module, '_transfer', lambda *args: transfers.append(args))
+    sync(factory_a, factory_b)
+    assert not transfers
+    assert factory_b('item').get_meta('journal').load() is None
+
+
+def test_group_commit(request, monkeypatch):
+    factory_a, factory_b = get_factories(request)
+    number_of_items = sync_module.GROUP_COMMIT_SIZE + 10
+    for i in range(number_of_items):
+        factory_a(f'item{i}').store(i)
+
+    commits = []
+    commit = LocalStorage.commit.__func__
+    monkeypatch.setattr(
+        LocalStorage,
+        'commit',
+        classmethod(lambda cls, items: commits.append(items) or commit(cls, items)),
+    )
+    fsyncs = []
+    fsync = os.fsync
+    monkeypatch.setattr(os, 'fsync', lambda fd: fsyncs.append(fd) or fsync(fd))
+    sync(factory_a, factory_b)
+
+    # two groups with three commits each:
+    assert len(commits) == 6
+    assert fsyncs
+    # the first commit of a group covers the journals of it's items:
+    assert len(commits[0]) == sync_module.GROUP_COMMIT_SIZE
+    assert len(commits[3]) == 10
+    for i in range(number_of_items):
+        assert factory_b(f'item{i}').load() == i
+
+
+def test_commit_only_within_transaction(request, monkeypatch):
+    factory_a, factory_b = get_factories(request)
+    commits = []
+    commit = LocalStorage.commit.__func__
+    monkeypatch.setattr(
+        LocalStorage,
+        'commit',
+        classmethod(lambda cls, items: commits.append(items) or commit(cls, items)),
+    )
+    # writes outside of sync() are not recorded for a later commit:
+    factory_a('other').store('other')
+    factory_a('item').store('data')
+    sync(factory_a('item'), factory_b('item'))
+    assert commits
+    written = set().union(*commits)
+    assert all('other' not in os.path.basename(path) for path in written)
+
+
+def patch_commit(monkeypatch) -> list[tuple[int, set]]:
+    '''Record (thread, items) of LocalStorage.commit()'''
+    commits = []
+    commit = LocalStorage.commit.__func__
+
+    def record(cls, items):
+        commits.append((threading.get_ident(), set(items)))
+        # give other syncs the chance to write in between:
+        time.sleep(0.001)
+        commit(cls, items)
+
+    monkeypatch.setattr(LocalStorage, 'commit', classmethod(record))
+    return commits
+
+
+def test_concurrent_sync_commits(request, monkeypatch):
+    path = test_sandbox.init_test_sandbox_from_fixture(request)
+    paths = [os.path.join(path, f'sync{i}') for i in range(2)]
+    factories = [
+        (
+            LocalStorage.get_factory(path=os.path.join(sync_path, 'a')),
+            LocalStorage.get_factory(path=os.path.join(sync_path, 'b')),
+        )
+        for sync_path in paths
+    ]
+    for factory_a, _ in factories:
+        for i in range(20):
+            factory_a(f'item{i}').store(i)
+    commits = patch_commit(monkeypatch)
+    threads = {}
+
+    def run(index):
+        threads[threading.get_ident()] = paths[index]
+        sync(*factories[index])
+
+    workers = [threading.Thread(target=run, args=(i,)) for i in range(2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+
+    # each sync commits it's own files, the journals of all 20 items first:
+    for thread, sync_path in threads.items():
+        own_commits = [items for ident, items in commits if ident == thread]
+        assert len(own_commits) == 3
+        assert len(own_commits[0]) == 20
+        for items in own_commits:
+            assert all(item.startswith(sync_path + os.sep) for item in items)
+    for factory_a, factory_b in factories:
+        for i in range(20):
+            assert factory_b(f'item{i}').load() == i
+
+
+def test_async_sync_group_commit(request, monkeypatch):
+    factory_a, factory_b = get_factories(request)
+    for i in range(20):
+        factory_a(f'item{i}').store(i)
+    commits = patch_commit(monkeypatch)
+
+    asyncio.run(async_sync(factory_a, factory_b, max_parallel=4))
+
+    # four groups of five items with three commits each:
+    assert len(commits) == 12
+    # writing and clearing the journals of each group is committed at once:
+    journal_commits = [
+        items
+        for _, items in commits
+        if all(item.endswith('.journal') for item in items)
+    ]
+    assert [len(items) for items in journal_commits] == [5] * 8
+    for i in range(20):
+        assert factory_b(f'item{i}').load() == i
+
+
+def test_one_way_sync_ignores_changes_on_b(request):
+    factory_a, factory_b = get_factories(request)
+    factory_a('item').store('A')
+    sync(factory_a('item'), factory_b('item'))
+    factory_b('item').store('B2')
+
+    sync(factory_a('item'), factory_b('item'), only_a_to_b=True)
+    assert factory_a('item').load() == 'A'
+    assert factory_b('item').load() == 'B2'
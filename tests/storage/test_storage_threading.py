@@ -0,0 +1,153 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Stress tests for concurrent storage access
+
+See appxf.storage.locking for the concurrency model.
+'''
+
+import gc
+import threading
+import time
+
+import pytest
+
+from appxf.storage import LocalStorage, RamStorage, Storage
+from appxf.storage.locking import ReadWriteLock
+from tests._fixtures import test_sandbox
+
+NUMBER_OF_THREADS = 8
+
+
+def run_threads(target, count: int = NUMBER_OF_THREADS):
+    '''Run target(index) in threads, starting at the same time'''
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def run(index):
+        barrier.wait()
+        try:
+            target(index)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+    assert not errors, errors
+
+
+@pytest.fixture(autouse=True)
+def setup_storage():
+    Storage.reset()
+
+
+def test_concurrent_get_returns_same_object():
+    names = [f'item{i}' for i in range(200)]
+    results = [dict() for _ in range(NUMBER_OF_THREADS)]
+
+    def get_all(index):
+        for name in names:
+            results[index][name] = RamStorage.get(name=name, ram_area='threads')
+
+    run_threads(get_all)
+    for name in names:
+        assert all(result[name] is results[0][name] for result in results)
+
+
+def test_concurrent_store_load(request):
+    path = test_sandbox.init_test_sandbox_from_fixture(request)
+    storage = LocalStorage.get(file='item', path=path)
+    storage.store({'index': 0, 'payload': ''})
+
+    def store_and_load(index):
+        for i in range(50):
+            if index % 2:
+                value = index * 1000 + i
+                storage.store({'index': value, 'payload': 'x' * (value % 5000)})
+            else:
+                # a partially written file would fail to load or mismatch:
+                data = storage.load()
+                assert len(data['payload']) == data['index'] % 5000
+
+    run_threads(store_and_load)
+
+
+def test_concurrent_meta_serializer():
+    from appxf.storage import JsonSerializer, StorageToBytes
+
+    successful = []
+
+    def set_serializer(index):
+        try:
+            StorageToBytes.set_meta_serializer('threading_test', JsonSerializer)
+            successful.append(index)
+        except Exception:
+            pass
+
+    run_threads(set_serializer)
+    assert len(successful) == 1
+
+
+def test_read_write_lock():
+    lock = ReadWriteLock()
+    active = {'readers': 0, 'writers': 0, 'max_readers': 0}
+    guard = threading.Lock()
+
+    def access(index):
+        for _ in range(20):
+            if index % 4 == 0:
+                with lock.write():
+                    with guard:
+                        active['writers'] += 1
+                        assert active['writers'] == 1
+                        assert active['readers'] == 0
+                    time.sleep(0.0005)
+                    with guard:
+                        active['writers'] -= 1
+            else:
+                with lock.read():
+                    with guard:
+                        assert active['writers'] == 0
+                        active['readers'] += 1
+                        active['max_readers'] = max(
+                            active['max_readers'], active['readers']
+                        )
+                    time.sleep(0.0005)
+                    with guard:
+                        active['readers'] -= 1
+
+    run_threads(access)
+    assert active['max_readers'] > 1
+
+
+def test_read_write_lock_reentrant_writer():
+    lock = ReadWriteLock()
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                pass
+    # released completely:
+    with lock.read():
+        pass
+
+
+def test_lock_registries_release_unused_locks(request):
+    from appxf.storage import locking
+
+    path = test_sandbox.init_test_sandbox_from_fixture(request)
+    storages = [LocalStorage.get(file=f'item{i}', path=path) for i in range(20)]
+    for storage in storages:
+        storage.store('data')
+        assert storage.load() == 'data'
+    # locks are kept while in use..
+    lock = storages[0]._item_lock()
+    with lock.write():
+        assert storages[0]._item_lock() is lock
+    del lock
+    # ..and released afterwards:
+    gc.collect()
+    assert not locking._item_locks
+    assert not locking._file_locks
+    assert not Storage._location_locks
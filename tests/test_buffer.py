@@ -1,7 +1,23 @@
 # Copyright 2023-2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
 # SPDX-License-Identifier: Apache-2.0
-from appxf.storage import Buffer, buffered
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from appxf.storage import (
+    AppxfStorableError,
+    Buffer,
+    LocalStorage,
+    RamStorage,
+    buffered,
+    register_key_hook,
+)
 from appxf.storage import Storage
+from appxf.storage import buffer as buffer_module
+from tests._fixtures import test_sandbox
 
 
 def assert_buffer_contains(buffer: Buffer, what: str, inputlist: list, exact=True):
@@ -24,6 +40,176 @@ def test_init():
     assert not buffer.buffer
 
 
+def test_get_set_independent():
+    Storage.reset()
+    buffer = Buffer()
+    data = {'a': [1, 2]}
+    buffer.set(data, 'what', 'input')
+    data['a'].append(3)
+    assert buffer.get('what', 'input') == {'a': [1, 2]}
+    assert buffer.get('what', 'input') is not buffer.get('what', 'input')
+
+
+def test_immutable_values_not_copied():
+    Storage.reset()
+    buffer = Buffer(immutable_values=True)
+    data = {'a': [1, 2]}
+    buffer.set(data, 'what', 'input')
+    assert buffer.get('what', 'input') is data
+
+
+def test_stats():
+    Storage.reset()
+    buffer = Buffer()
+    assert buffer.get('what', 'input') is None
+    buffer.set(42, 'what', 'input')
+    assert buffer.get('what', 'input') == 42
+    assert buffer.get('what', 'input') == 42
+    assert (buffer.stats.hits, buffer.stats.misses) == (2, 1)
+
+
+def test_max_entries_lru():
+    Storage.reset()
+    buffer = Buffer(max_entries=2)
+    buffer.set(1, 'what', 'one')
+    buffer.set(2, 'what', 'two')
+    # access 'one' such that 'two' is the least recently used:
+    buffer.get('what', 'one')
+    buffer.set(3, 'what', 'three')
+    assert buffer.isbuffered('what', 'one')
+    assert not buffer.isbuffered('what', 'two')
+    assert buffer.isbuffered('what', 'three')
+    assert buffer.stats.evictions == 1
+
+
+def test_max_entries_lfu():
+    Storage.reset()
+    buffer = Buffer(max_entries=2, eviction='lfu')
+    buffer.set(1, 'what', 'one')
+    buffer.set(2, 'what', 'two')
+    buffer.get('what', 'one')
+    buffer.get('what', 'one')
+    buffer.get('what', 'two')
+    # new values are not evicted directly, 'two' is less frequently used:
+    buffer.set(3, 'what', 'three')
+    assert buffer.isbuffered('what', 'one')
+    assert not buffer.isbuffered('what', 'two')
+    assert buffer.isbuffered('what', 'three')
+
+
+def test_max_bytes():
+    Storage.reset()
+    buffer = Buffer(max_bytes=2500)
+    buffer.set(b'1' * 1000, 'what', 'one')
+    buffer.set(b'2' * 1000, 'what', 'two')
+    buffer.set(b'3' * 1000, 'what', 'three')
+    assert not buffer.isbuffered('what', 'one')
+    assert buffer.isbuffered('what', 'two')
+    assert buffer.isbuffered('what', 'three')
+    # a value exceeding max_bytes on it's own is not buffered:
+    buffer.set(b'4' * 3000, 'what', 'four')
+    assert not buffer.isbuffered('what', 'four')
+    assert buffer.isbuffered('what', 'three')
+
+
+def test_invalid_eviction():
+    Storage.reset()
+    with pytest.raises(AppxfStorableError):
+        Buffer(eviction='fifo')
+
+
+def test_ttl():
+    Storage.reset()
+    buffer = Buffer(ttl={'short': 0.01})
+    buffer.set(1, 'short', 'input')
+    buffer.set(2, 'long', 'input')
+    time.sleep(0.02)
+    assert buffer.get('short', 'input') is None
+    assert buffer.get('long', 'input') == 2
+    assert buffer.stats.expirations == 1
+
+
+def test_write_behind():
+    Storage.reset()
+    storage = RamStorage()
+    buffer = Buffer(storage, flush_interval=None)
+    buffer.set(42, 'what', 'input')
+    assert not storage.exists()
+    buffer.flush()
+    assert storage.exists()
+
+    reloaded = Buffer(storage)
+    assert reloaded.get('what', 'input') == 42
+
+
+def test_store_on_change():
+    Storage.reset()
+    storage = RamStorage()
+    buffer = Buffer(storage)
+    buffer.set(42, 'what', 'input')
+    assert Buffer(storage).get('what', 'input') == 42
+    buffer.clear('what')
+    assert Buffer(storage).get('what', 'input') is None
+
+
+def test_factory_layout_on_demand(request):
+    Storage.reset()
+    path = test_sandbox.init_test_sandbox_from_fixture(request)
+    buffer = Buffer(storage_factory=LocalStorage.get_factory(path))
+    buffer.set('one', 'what', 'input1')
+    buffer.set('two', 'what', 'input2')
+    buffer.set('three', 'other', 'input')
+    # one storage per value plus the index:
+    assert sorted(name for name in os.listdir(path) if not name.startswith('.')) == [
+        'entry0',
+        'entry1',
+        'entry2',
+        'index',
+    ]
+
+    reloaded = Buffer(storage_factory=LocalStorage.get_factory(path))
+    assert reloaded.isbuffered('what', 'input1')
+    # values are only loaded on access:
+    assert all(
+        value is buffer_module._NOT_LOADED for value in reloaded.buffer['what'].values()
+    )
+    assert reloaded.get('what', 'input2') == 'two'
+    assert reloaded.buffer['what']['input1'] is buffer_module._NOT_LOADED
+
+    # clear(what) does not need the values:
+    reloaded.clear('what')
+    assert reloaded.get('other', 'input') == 'three'
+    assert (
+        Buffer(storage_factory=LocalStorage.get_factory(path)).get('what', 'input1')
+        is None
+    )
+
+
+def test_factory_layout_write_behind():
+    Storage.reset()
+    factory = RamStorage.get_factory(ram_area='buffer')
+    buffer = Buffer(storage_factory=factory, flush_interval=None)
+    buffer.set(42, 'what', 'input')
+    assert not factory('index').exists()
+    buffer.flush()
+    assert Buffer(storage_factory=factory).get('what', 'input') == 42
+
+
+def test_factory_layout_compact():
+    Storage.reset()
+    factory = RamStorage.get_factory(ram_area='buffer')
+    buffer = Buffer(storage_factory=factory)
+    for i in range(40):
+        buffer.set(i, 'what', str(i))
+    buffer.set('kept', 'other', 'input')
+    assert factory('entry40').load() == ('other', 'input', 'kept')
+    # most storages become unused which applies compact() on store():
+    buffer.clear('what')
+    assert factory('entry0').load() == ('other', 'input', 'kept')
+    assert factory('entry40').load() is None
+    assert Buffer(storage_factory=factory).get('other', 'input') == 'kept'
+
+
 # 2) Tests for decorator @buffered
 
 # TODO: There is not really a check if the functions to be buffered were
@@ -76,12 +262,263 @@ def test_buffered_mixedargs():
         return f'{a}, {c}: {tmp}'
 
     assert test_func('bah', 42) == 'bah, hello: 57'
-    assert_buffer_contains(buffer, 'test_func', ['bah,42,hello,15'])
+    assert_buffer_contains(buffer, 'test_func', ["'bah',42,'hello',15"])
+    assert buffer.isbuffered('test_func', "'bah',42,'hello',15")
     assert test_func('bah', 42, c='hello', d=15) == 'bah, hello: 57'
-    assert_buffer_contains(buffer, 'test_func', ['bah,42,hello,15'])
+    assert_buffer_contains(buffer, 'test_func', ["'bah',42,'hello',15"])
 
     assert test_func('this', 3, 'that', 4) == 'this, that: 7'
-    assert_buffer_contains(buffer, 'test_func', ['bah,42,hello,15', 'this,3,that,4'])
+    assert_buffer_contains(
+        buffer, 'test_func', ["'bah',42,'hello',15", "'this',3,'that',4"]
+    )
+
+
+def test_buffered_kwonly():
+    Storage.reset()
+    buffer = Buffer()
+
+    @buffered(buffer)
+    def test_func(a, *, b=2):
+        return a * b
+
+    assert test_func(3) == 6
+    assert test_func(3, b=2) == 6
+    assert_buffer_contains(buffer, 'test_func', ['3,b=2'])
+    assert test_func(3, b=3) == 9
+    assert_buffer_contains(buffer, 'test_func', ['3,b=2', '3,b=3'])
+
+
+def test_buffered_structural_key():
+    Storage.reset()
+    buffer = Buffer()
+    calls = []
+
+    @buffered(buffer)
+    def test_func(a):
+        calls.append(a)
+        return len(calls)
+
+    # same str() but different values:
+    assert test_func(1) == 1
+    assert test_func('1') == 2
+    assert test_func(1) == 1
+    # equal containers result in the same key:
+    assert test_func({'x': 1, 'y': 2}) == 3
+    assert test_func({'y': 2, 'x': 1}) == 3
+    # long keys are hashed:
+    assert test_func('a' * 1000) == 4
+    assert test_func('a' * 1000) == 4
+    assert all(len(key) <= 71 for key in buffer.buffer['test_func'])
+
+
+def test_buffered_key_hook():
+    Storage.reset()
+    buffer = Buffer()
+
+    class Point:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+    register_key_hook(Point, lambda point: (point.x, point.y))
+
+    @buffered(buffer)
+    def test_func(point):
+        return point.x + point.y
+
+    assert test_func(Point(1, 2)) == 3
+    assert_buffer_contains(
+        buffer, 'test_func', ['test_buffered_key_hook.<locals>.Point(1,2)']
+    )
+    # another object with same attributes hits the buffer:
+    assert test_func(Point(1, 2)) == 3
+    assert buffer.stats.hits == 1
+
+
+def test_buffered_structural_fallback():
+    Storage.reset()
+    buffer = Buffer()
+
+    class Plain:
+        def __init__(self, x):
+            self.x = x
+
+    class Slotted:
+        __slots__ = 'y'
+
+        def __init__(self, y):
+            self.y = y
+
+    @buffered(buffer)
+    def test_func(value):
+        return value
+
+    test_func(Plain(1))
+    test_func(Plain(1))
+    test_func(Slotted(2))
+    test_func(Slotted(2))
+    test_func(Slotted(3))
+    assert buffer.stats.hits == 2
+    assert buffer.stats.misses == 3
+    # no object ids in keys:
+    assert not any('0x' in key for key in buffer.buffer['test_func'])
+
+
+def test_buffered_store_without_lock():
+    Storage.reset()
+    storing = threading.Event()
+    release = threading.Event()
+    released = []
+
+    class SlowStorage(RamStorage):
+        def store_raw(self, data: object):
+            if not self._meta:
+                storing.set()
+                released.append(release.wait(timeout=5))
+            super().store_raw(data)
+
+    slow_buffer = Buffer(SlowStorage())
+    other_buffer = Buffer(RamStorage())
+
+    @buffered(slow_buffer)
+    def slow_func(a):
+        return a * 2
+
+    @buffered(other_buffer)
+    def other_func(a):
+        return a * 3
+
+    thread = threading.Thread(target=lambda: slow_func(1))
+    thread.start()
+    assert storing.wait(timeout=5)
+    # neither the buffer that is storing nor other buffers are blocked:
+    assert slow_buffer.get('slow_func', '1') == 2
+    assert other_func(1) == 3
+    release.set()
+    thread.join(timeout=5)
+    assert released == [True]
+
+
+def test_buffered_single_flight():
+    Storage.reset()
+    buffer = Buffer()
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    @buffered(buffer)
+    def test_func(a):
+        calls.append(a)
+        started.set()
+        release.wait(timeout=5)
+        return a * 2
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(test_func(21))) for _ in range(4)
+    ]
+    threads[0].start()
+    started.wait(timeout=5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert results == [42] * 4
+    assert calls == [21]
+
+
+def test_buffered_single_flight_independent_results():
+    Storage.reset()
+    buffer = Buffer(RamStorage())
+    started = threading.Event()
+    release = threading.Event()
+
+    @buffered(buffer)
+    def test_func(a):
+        started.set()
+        release.wait(timeout=5)
+        return [a]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(test_func(1))) for _ in range(3)
+    ]
+    threads[0].start()
+    started.wait(timeout=5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    results[0].append('changed')
+    assert results[1:] == [[1], [1]]
+    assert test_func(1) == [1]
+
+
+def test_concurrent_get_and_clear():
+    Storage.reset()
+    buffer = Buffer(RamStorage(), flush_interval=None)
+    errors = []
+    done = threading.Event()
+
+    def change():
+        for _ in range(2000):
+            buffer.set([1], 'what', 'input')
+            buffer.clear('what')
+        done.set()
+
+    def get():
+        try:
+            while not done.is_set():
+                assert buffer.get('what', 'input') in ([1], None)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=change), threading.Thread(target=get)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+    assert not errors
+    assert buffer.stats.hits + buffer.stats.misses > 0
+
+
+def test_buffered_async():
+    Storage.reset()
+    buffer = Buffer()
+    calls = []
+
+    @buffered(buffer)
+    async def test_func(a):
+        calls.append(a)
+        await asyncio.sleep(0.01)
+        return a * 2
+
+    async def run():
+        return await asyncio.gather(*[test_func(21) for _ in range(4)])
+
+    assert asyncio.run(run()) == [42] * 4
+    assert calls == [21]
+    assert asyncio.run(run()) == [42] * 4
+    assert calls == [21]
+
+
+def test_buffered_async_independent_results():
+    Storage.reset()
+    buffer = Buffer(RamStorage())
+
+    @buffered(buffer)
+    async def test_func(a):
+        await asyncio.sleep(0.01)
+        return [a]
+
+    async def run():
+        return await asyncio.gather(*[test_func(1) for _ in range(3)])
+
+    results = asyncio.run(run())
+    results[0].append('changed')
+    assert results[1:] == [[1], [1]]
 
 
 # Used to test logging:
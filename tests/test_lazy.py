@@ -0,0 +1,27 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+import appxf.storage
+from appxf.storage.buffer import Buffer
+
+
+def test_lazy_facade_access():
+    assert appxf.storage.Buffer is Buffer
+    assert 'Buffer' in dir(appxf.storage)
+    assert 'LocalStorage' in dir(appxf.storage)
+
+
+def test_lazy_facade_unknown_attribute():
+    with pytest.raises(AttributeError):
+        appxf.storage.NotExisting
+
+
+def test_lazy_facade_all_names_resolve():
+    import appxf.config
+    import appxf.registry
+    import appxf.security
+
+    for module in [appxf.config, appxf.registry, appxf.security, appxf.storage]:
+        for name in dir(module):
+            assert getattr(module, name) is not None
@@ -0,0 +1,120 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+import os
+import pytest
+
+from appxf.config import Config
+from appxf.security import SecurePrivateStorage, Security
+from appxf.startup import Startup
+from appxf.storage import LocalStorage, Storage
+
+from tests._fixtures import appxf_objects
+import tests._fixtures.test_sandbox
+
+
+def get_objects(path: str, security: Security):
+    config_factory = LocalStorage.get_factory(path=os.path.join(path, 'config'))
+    config = Config()
+    config.add_section('PLAIN', storage_factory=config_factory, settings={'x': 'A'})
+    config.add_section(
+        'SECURE',
+        storage_factory=SecurePrivateStorage.get_factory(
+            base_storage_factory=config_factory, security=security
+        ),
+        settings={'x': 'B'},
+    )
+    registry = appxf_objects.get_fresh_registry(
+        path=path, security=security, config=config
+    )
+    return config, registry
+
+
+@pytest.fixture
+def stored_objects(request):
+    '''Provide path with stored config and admin-initialized registry'''
+    Storage.reset()
+    path = tests._fixtures.test_sandbox.init_test_sandbox_from_fixture(request)
+    security = appxf_objects.get_security_unlocked(path)
+    config, registry = get_objects(path, security)
+    config.section('PLAIN')['x'] = 'stored A'
+    config.section('SECURE')['x'] = 'stored B'
+    config.store()
+    registry.initialize_as_admin()
+    registry.sync_with_remote('sending')
+    Storage.reset()
+    return path
+
+
+def test_startup(stored_objects):
+    security = appxf_objects.get_security(stored_objects)
+    config, registry = get_objects(stored_objects, security)
+    startup = Startup(security=security, config=config, registry=registry)
+    timings = startup.run('password')
+
+    assert security.is_user_unlocked()
+    assert config.section('PLAIN')['x'] == 'stored A'
+    assert config.section('SECURE')['x'] == 'stored B'
+    assert registry.is_initialized()
+    assert registry.user_id == 1
+    assert timings is startup.timings
+    for phase in [
+        'unlock',
+        'config_plain',
+        'remote',
+        'registry',
+        'config_secure',
+        'sync',
+        'total',
+    ]:
+        assert timings[phase] >= 0
+    assert timings['total'] >= timings['unlock']
+
+
+def test_startup_wrong_password(stored_objects):
+    security = appxf_objects.get_security(stored_objects)
+    config, registry = get_objects(stored_objects, security)
+    startup = Startup(security=security, config=config, registry=registry)
+    with pytest.raises(Exception):
+        startup.run('wrong password')
+    assert not startup.errors
+
+    assert not security.is_user_unlocked()
+    # plain section is loaded while unlocking, secure data is not:
+    assert config.section('PLAIN')['x'] == 'stored A'
+    assert config.section('SECURE')['x'] == 'B'
+    assert not registry.try_load()
+
+
+def test_startup_remote_failure(stored_objects, monkeypatch):
+    security = appxf_objects.get_security(stored_objects)
+    config, registry = get_objects(stored_objects, security)
+
+    def unavailable():
+        raise OSError('remote not available')
+
+    monkeypatch.setattr(registry, 'has_remote_user_db', unavailable)
+    startup = Startup(security=security, config=config, registry=registry)
+    startup.run('password')
+
+    # application can continue offline:
+    assert security.is_user_unlocked()
+    assert config.section('SECURE')['x'] == 'stored B'
+    assert registry.is_initialized()
+    assert isinstance(startup.errors['remote'], OSError)
+    assert 'sync' not in startup.timings
+
+
+def test_startup_sync_failure(stored_objects, monkeypatch):
+    security = appxf_objects.get_security(stored_objects)
+    config, registry = get_objects(stored_objects, security)
+
+    def failing_sync(mode):
+        raise OSError('sync failed')
+
+    monkeypatch.setattr(registry, 'sync_with_remote', failing_sync)
+    startup = Startup(security=security, config=config, registry=registry)
+    startup.run('password')
+
+    assert security.is_user_unlocked()
+    assert registry.is_initialized()
+    assert list(startup.errors) == ['sync']
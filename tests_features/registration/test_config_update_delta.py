@@ -0,0 +1,86 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Delta manual configuration updates
+
+Performance target: a routine manual configuration update changing a single
+setting of a larger configuration (NUMBER_OF_SECTIONS sections with
+NUMBER_OF_SETTINGS settings each) shall be much smaller and cheaper to apply
+as delta update than as full update. The test fails if the delta update
+exceeds MAX_SIZE_RATIO of the full update or if applying it takes longer than
+MAX_TIME_RATIO of applying the full update.
+'''
+
+import logging
+import os
+import time
+
+from appxf.registry import Registry
+from appxf.storage import Storage
+
+from tests._fixtures import appxf_objects, test_sandbox
+
+NUMBER_OF_SECTIONS = 20
+NUMBER_OF_SETTINGS = 50
+MAX_SIZE_RATIO = 0.1
+MAX_TIME_RATIO = 0.25
+
+
+def test_config_update_delta(request, caplog):
+    caplog.set_level(logging.WARNING, logger='appxf')
+    Storage.reset()
+    path = test_sandbox.init_test_sandbox_from_fixture(request, cleanup=True)
+    Storage.switch_context('admin')
+    admin_path = os.path.join(path, 'admin')
+    admin_registry = appxf_objects.get_registry_admin_initialized(
+        path=admin_path,
+        security=appxf_objects.get_security_unlocked(admin_path),
+        config=appxf_objects.get_dummy_user_config(),
+    )
+    Storage.switch_context('user')
+    user_path = os.path.join(path, 'user')
+    user_registry = appxf_objects.get_fresh_registry(
+        path=user_path,
+        security=appxf_objects.get_security_unlocked(user_path),
+        config=appxf_objects.get_dummy_user_config(),
+    )
+    appxf_objects.perform_registration(user_registry, admin_registry)
+
+    Storage.switch_context('admin')
+    sections = [f'SECTION_{i}' for i in range(NUMBER_OF_SECTIONS)]
+    for section in sections:
+        admin_registry._config.add_section(
+            section,
+            settings={
+                f'setting_{i}': (str, f'value {i} of {section}')
+                for i in range(NUMBER_OF_SETTINGS)
+            },
+        )
+    full_bytes = admin_registry.get_manual_config_update_bytes(
+        sections=sections, include_user_db=False
+    )
+    version = admin_registry.config_version
+    admin_registry._config.section('SECTION_3')['setting_7'] = 'changed'
+    delta_bytes = admin_registry.get_manual_config_update_bytes(
+        sections=sections, include_user_db=False, since_version=version
+    )
+
+    Storage.switch_context('user')
+    # first update includes one-time costs (like parsing the private key):
+    user_registry.set_manual_config_update_bytes(full_bytes)
+    start = time.perf_counter()
+    user_registry.set_manual_config_update_bytes(full_bytes)
+    full_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    user_registry.set_manual_config_update_bytes(delta_bytes)
+    delta_duration = time.perf_counter() - start
+
+    print(
+        f'Full update: {len(full_bytes)} bytes, {full_duration:.3f} s; '
+        f'delta update: {len(delta_bytes)} bytes, {delta_duration:.3f} s'
+    )
+    user_registry: Registry
+    assert user_registry._config.section('SECTION_3')['setting_7'] == 'changed'
+    assert user_registry.config_version == version + 1
+    assert len(delta_bytes) < MAX_SIZE_RATIO * len(full_bytes)
+    assert delta_duration < MAX_TIME_RATIO * full_duration
+    Storage.switch_context('')
@@ -0,0 +1,53 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Envelope for large configuration updates
+
+Performance target: a manual configuration update with a large payload shall
+not grow beyond the payload by more than MAX_OVERHEAD_RATIO and sealing plus
+opening it shall be faster than the previous nested format
+(Security.hybrid_signed_encrypt() with Fernet tokens inside serialized
+dictionaries). The payload is sent to NUMBER_OF_RECIPIENTS.
+'''
+
+import os
+import time
+
+from appxf.security import Envelope
+from appxf.storage import CompactSerializer, Storage
+
+from tests._fixtures import appxf_objects, test_sandbox
+
+PAYLOAD_SIZE = 8 * 1024 * 1024
+NUMBER_OF_RECIPIENTS = 20
+MAX_OVERHEAD_RATIO = 0.01
+
+
+def test_envelope_size(request):
+    Storage.reset()
+    path = test_sandbox.init_test_sandbox_from_fixture(request, cleanup=True)
+    security = appxf_objects.get_security_unlocked(path)
+    public_key = security.get_encryption_public_key()
+    public_keys = {user_id: public_key for user_id in range(NUMBER_OF_RECIPIENTS)}
+    payload = CompactSerializer.serialize(
+        {'SECTION': {'data': os.urandom(PAYLOAD_SIZE)}}
+    )
+
+    start = time.perf_counter()
+    legacy = security.hybrid_signed_encrypt(payload, public_keys)
+    legacy_payload, _ = security.hybrid_signed_decrypt(legacy, blob_identifier=1)
+    legacy_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    data = Envelope.seal(security, 'test', {'config_sections': payload}, public_keys)
+    envelope = Envelope.open(security, data, blob_identifier=1)
+    duration = time.perf_counter() - start
+
+    overhead = len(data) / len(payload) - 1
+    print(
+        f'Legacy: {len(legacy)} bytes, {legacy_duration:.3f} s; '
+        f'Envelope: {len(data)} bytes ({overhead:.2%} overhead), {duration:.3f} s'
+    )
+    assert legacy_payload == payload
+    assert envelope.sections['config_sections'] == payload
+    assert overhead < MAX_OVERHEAD_RATIO
+    assert duration < legacy_duration
@@ -0,0 +1,51 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Repeated signature verification
+
+Performance target: verifying the signature of unchanged data again (like on
+every load of an unchanged shared file) shall skip the public key operation.
+The test fails if NUMBER_OF_REPETITIONS verifications of DATA_SIZE bytes take
+longer than MAX_TIME_RATIO of the same number of uncached verifications.
+'''
+
+import logging
+import os
+import time
+
+from appxf.security import Security
+from appxf.storage import Storage
+
+from tests._fixtures import appxf_objects, test_sandbox
+
+DATA_SIZE = 16 * 1024
+NUMBER_OF_REPETITIONS = 200
+MAX_TIME_RATIO = 0.5
+
+
+def test_signature_cache(request, caplog):
+    caplog.set_level(logging.WARNING, logger='appxf')
+    Storage.reset()
+    path = test_sandbox.init_test_sandbox_from_fixture(request, cleanup=True)
+    registry = appxf_objects.get_registry_admin_initialized(
+        path=path,
+        security=appxf_objects.get_security_unlocked(path),
+        config=appxf_objects.get_dummy_config(),
+    )
+    data = os.urandom(DATA_SIZE)
+    public_key, signature = registry.sign(data)
+
+    start = time.perf_counter()
+    for _ in range(NUMBER_OF_REPETITIONS):
+        assert Security.verify_signature(data, signature, public_key)
+    uncached_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(NUMBER_OF_REPETITIONS):
+        assert registry.verify_signature(data, registry.user_id, signature, ['admin'])
+    duration = time.perf_counter() - start
+
+    print(
+        f'{NUMBER_OF_REPETITIONS} verifications: {uncached_duration:.3f} s '
+        f'uncached, {duration:.3f} s cached'
+    )
+    assert duration < MAX_TIME_RATIO * uncached_duration
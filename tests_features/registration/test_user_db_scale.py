@@ -0,0 +1,40 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''UserDatabase with many users
+
+Performance target: registering a user shall not degrade with the number of
+registered users such that bulk onboarding stays linear. The test fails if
+adding NUMBER_OF_USERS synthetic users (including duplicate detection)
+exceeds the time limit below which includes a large margin for slower
+machines.
+'''
+
+import logging
+import time
+
+from appxf.registry._user_db import UserDatabase
+from appxf.storage import RamStorage, Storage
+
+NUMBER_OF_USERS = 50000
+MAX_SECONDS = 2.0
+
+
+def test_user_db_scale(caplog):
+    # measure the user database, not capturing the info log per user:
+    caplog.set_level(logging.WARNING, logger=UserDatabase.log.name)
+    Storage.reset()
+    user_db = UserDatabase(RamStorage())
+    user_db.init_user_db(validation_key=b'val-admin', encryption_key=b'enc-admin')
+    start = time.perf_counter()
+    for i in range(NUMBER_OF_USERS):
+        user_id = user_db.add_new(
+            validation_key=b'val-%i' % i, encryption_key=b'enc-%i' % i
+        )
+        assert user_id > 0
+    duration = time.perf_counter() - start
+    print(f'Adding {NUMBER_OF_USERS} users: {duration:.2f} s')
+    assert len(user_db.get_users()) == NUMBER_OF_USERS + 1
+    # duplicates are still detected:
+    assert user_db.add_new(b'val-42', b'enc-42') == 44
+    assert user_db.add_new(b'val-42', b'enc-0') == -44
+    assert duration < MAX_SECONDS
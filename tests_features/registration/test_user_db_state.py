@@ -0,0 +1,51 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''UserDatabase state with many users
+
+Performance target: the stored USER_DB shall be dominated by the public keys
+of the users and it shall load quickly. The test fails if the serialized state
+of NUMBER_OF_USERS synthetic users exceeds the key bytes by more than
+MAX_OVERHEAD_PER_USER or if loading it (including a first lookup by key)
+exceeds the time limit below which includes a large margin for slower
+machines.
+'''
+
+import logging
+import time
+
+from appxf.registry._user_db import UserDatabase
+from appxf.storage import CompactSerializer, RamStorage, Storage
+
+NUMBER_OF_USERS = 50000
+# size of serialized public keys:
+KEY_SIZE = 300
+MAX_OVERHEAD_PER_USER = 40
+MAX_SECONDS = 1.0
+
+
+def test_user_db_state(caplog):
+    caplog.set_level(logging.WARNING, logger=UserDatabase.log.name)
+    Storage.reset()
+    user_db = UserDatabase(RamStorage())
+    for i in range(NUMBER_OF_USERS):
+        user_db.add_new(
+            validation_key=b'val-%0*i' % (KEY_SIZE - 4, i),
+            encryption_key=b'enc-%0*i' % (KEY_SIZE - 4, i),
+            roles=['user', 'group%i' % (i % 10)],
+        )
+    user_db.discard_changes()
+    data = CompactSerializer.serialize(user_db.get_state())
+    overhead = len(data) / NUMBER_OF_USERS - 2 * KEY_SIZE
+    print(f'State size: {len(data)} bytes, {overhead:.1f} bytes per user overhead')
+
+    start = time.perf_counter()
+    restored = UserDatabase(RamStorage())
+    restored.set_state(CompactSerializer.deserialize(data))
+    user_id = restored.get_user_by_validation_key(b'val-%0*i' % (KEY_SIZE - 4, 42))
+    duration = time.perf_counter() - start
+    print(f'Loading {NUMBER_OF_USERS} users: {duration:.2f} s')
+    assert user_id == 43
+    assert restored.get_roles(43) == ['user', 'group2']
+    assert len(restored.get_users('group2')) == NUMBER_OF_USERS // 10
+    assert overhead < MAX_OVERHEAD_PER_USER
+    assert duration < MAX_SECONDS
@@ -0,0 +1,107 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''User information files per role
+
+Performance target: the user information files (one per role, see Registry)
+shall follow the projection from the analysis in registry.py which is, in the
+worst case of each user having each role:
+
+    ROLES * USERS * (SIZE_UI + SIZE_KEY)
+
+with 50 bytes user information (SIZE_UI) and 256 bytes per encrypted key blob
+(SIZE_KEY). The test fails if the files exceed the projection by more than
+MAX_SIZE_FACTOR plus MAX_FILE_OVERHEAD per role file (signature and the key
+blob of the admin), if writing all files exceeds MAX_SECONDS plus
+MAX_SECONDS_PER_USER per user and role or if a role file is re-encrypted
+although it's members did not change. Synthetic users
+share the admin's encryption key to skip generating keys.
+'''
+
+import logging
+import os
+import time
+
+import pytest
+
+from appxf.registry import Registry, SecureSharedStorage
+from appxf.registry._user_db import UserDatabase
+from appxf.storage import LocalStorage, RamStorage, Storage
+
+from tests._fixtures import appxf_objects
+import tests._fixtures.test_sandbox
+
+ROLES = ['role1', 'role2', 'role3', 'role4', 'role5']
+SIZE_UI = 50
+SIZE_KEY = 256
+MAX_SIZE_FACTOR = 1.2
+MAX_FILE_OVERHEAD = 2000
+MAX_SECONDS = 2.0
+MAX_SECONDS_PER_USER = 0.001
+
+
+@pytest.mark.parametrize('number_of_users', [10, 100, 1000])
+def test_user_info_scale(number_of_users, request, caplog, monkeypatch):
+    caplog.set_level(logging.WARNING, logger=UserDatabase.log.name)
+    Storage.reset()
+    path = tests._fixtures.test_sandbox.init_test_sandbox_from_fixture(request)
+    registry = Registry(
+        local_storage_factory=RamStorage.get_factory(ram_area='local'),
+        remote_storage_factory=LocalStorage.get_factory(
+            path=os.path.join(path, 'remote')
+        ),
+        security=appxf_objects.get_security_unlocked(path),
+        config=appxf_objects.get_dummy_config(),
+        user_info_roles=ROLES,
+    )
+    registry.initialize_as_admin()
+    encryption_key = registry._user_db.get_encryption_key(1)
+    for user_id in range(2, number_of_users + 2):
+        registry._user_db.add(
+            user_id, b'val-%i' % user_id, encryption_key, ['user', *ROLES]
+        )
+        # 50 bytes of information:
+        registry.set_user_info(
+            user_id,
+            {'email': 'user%05i@example.org' % user_id, 'name': 'Name %05i' % user_id},
+        )
+    registry._user_db.discard_changes()
+
+    start = time.perf_counter()
+    registry._publish_user_info()
+    duration = time.perf_counter() - start
+
+    # size of data, key and signature files:
+    size = sum(
+        os.path.getsize(os.path.join(directory, file))
+        for directory, _, files in os.walk(os.path.join(path, 'remote'))
+        for file in files
+        if file.startswith('USER_INFO') and not file.endswith('.lock')
+    )
+    projection = len(ROLES) * number_of_users * (SIZE_UI + SIZE_KEY)
+    print(
+        f'{number_of_users} users: {size / 1000:.1f} kB '
+        f'(projection {projection / 1000:.1f} kB) in {duration:.2f} s'
+    )
+
+    # a change of one role only re-encrypts this role:
+    stored = []
+    store_raw = SecureSharedStorage.store_raw
+    monkeypatch.setattr(
+        SecureSharedStorage,
+        'store_raw',
+        lambda self, data: stored.append(self.name) or store_raw(self, data),
+    )
+    registry._user_db.set_roles(2, ['user', 'role1'])
+    registry._publish_user_info()
+    assert sorted(stored) == [
+        'USER_INFO_role2',
+        'USER_INFO_role3',
+        'USER_INFO_role4',
+        'USER_INFO_role5',
+    ]
+    Storage.reset()
+
+    assert size < MAX_SIZE_FACTOR * projection + MAX_FILE_OVERHEAD * len(ROLES)
+    assert duration < MAX_SECONDS + (
+        MAX_SECONDS_PER_USER * number_of_users * len(ROLES)
+    )
@@ -0,0 +1,69 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Memory footprint of settings
+
+Performance target: large setting collections (like a SettingDict holding a
+user database) shall not cost much more memory than the values themselves.
+The tests measure the bytes per setting via tracemalloc and fail if the
+footprint regresses beyond the limits below. The limits include some margin for
+different python versions.
+'''
+
+import tracemalloc
+
+import pytest
+
+from appxf.setting import SettingDict, SettingFloat, SettingInt, SettingString
+
+NUMBER_OF_SETTINGS = 5000
+
+
+def measure_bytes_per_setting(constructor) -> float:
+    # values are generated before tracing, only the settings shall count:
+    values = [str(i) for i in range(NUMBER_OF_SETTINGS)]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        settings = [constructor(value) for value in values]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(settings) == NUMBER_OF_SETTINGS
+    return (after - before) / NUMBER_OF_SETTINGS
+
+
+@pytest.mark.parametrize(
+    'constructor, max_bytes',
+    [
+        # string input is the value, no conversion:
+        (SettingString, 120),
+        # string inputs are converted and the input is kept:
+        (SettingInt, 160),
+        (SettingFloat, 160),
+    ],
+)
+def test_setting_memory_bytes_per_setting(constructor, max_bytes):
+    bytes_per_setting = measure_bytes_per_setting(constructor)
+    print(f'{constructor.__name__}: {bytes_per_setting:.0f} bytes per setting')
+    assert bytes_per_setting < max_bytes
+
+
+def test_setting_memory_bytes_per_setting_dict_entry():
+    # Settings in a SettingDict obtain the key as name which requires own
+    # options. The SettingDict itself adds the dictionary entry.
+    def constructor(value: str):
+        return SettingInt(int(value))
+
+    values = [str(i) for i in range(NUMBER_OF_SETTINGS)]
+    setting_dict = SettingDict()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for value in values:
+            setting_dict[value] = constructor(value)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    bytes_per_setting = (after - before) / NUMBER_OF_SETTINGS
+    print(f'SettingDict entry: {bytes_per_setting:.0f} bytes per setting')
+    assert bytes_per_setting < 400
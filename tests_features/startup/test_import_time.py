@@ -0,0 +1,89 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Startup time of APPXF imports
+
+Performance target: importing a facade shall not load dependencies of
+sub-modules that are not used. The tests run "python -X importtime" in a fresh
+interpreter and fail if expensive dependencies are loaded or if the cumulative
+import time regresses beyond the limits below. The limits include a large
+margin for slower machines, the dependency checks are the strict part.
+'''
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import appxf
+
+SOURCE_PATH = str(Path(appxf.__file__).parent.parent)
+NUMBER_OF_RUNS = 3
+
+# expensive to import and not needed before the corresponding feature is used:
+HEAVY_DEPENDENCIES = [
+    'babel',
+    'cryptography',
+    'email_validator',
+    'ftputil',
+    'recordclass',
+    'tkinter',
+]
+
+
+def import_time(module: str) -> tuple[float, set[str]]:
+    '''Get cumulative import time in ms and all imported modules
+
+    The minimum over several runs is taken to reduce noise.
+    '''
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [SOURCE_PATH] + ([env['PYTHONPATH']] if env.get('PYTHONPATH') else [])
+    )
+    best_time = float('inf')
+    modules: set[str] = set()
+    for _ in range(NUMBER_OF_RUNS):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        # lines are: "import time: <self us> | <cumulative us> | <name>"
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            _, cumulative, name = line[len('import time:') :].split('|')
+            name = name.strip()
+            modules.add(name)
+            if name == module:
+                best_time = min(best_time, int(cumulative) / 1000)
+    return best_time, modules
+
+
+@pytest.mark.parametrize(
+    'module, max_ms',
+    [
+        ('appxf', 60),
+        ('appxf.setting', 150),
+        ('appxf.storage', 120),
+        ('appxf.config', 60),
+        ('appxf.security', 60),
+        ('appxf.registry', 60),
+        ('appxf.gui', 60),
+    ],
+)
+def test_import_time(module, max_ms):
+    time_ms, modules = import_time(module)
+    print(f'Import time {module}: {time_ms:.1f} ms')
+    loaded = sorted(
+        dependency
+        for dependency in HEAVY_DEPENDENCIES
+        if any(
+            name == dependency or name.startswith(dependency + '.') for name in modules
+        )
+    )
+    assert not loaded, f'{module} loads {loaded} on import'
+    assert time_ms < max_ms
@@ -0,0 +1,30 @@
+# Copyright 2026 the contributors of APPXF (github.com/alexander-nbg/appxf)
+# SPDX-License-Identifier: Apache-2.0
+'''Storage registry with many storages
+
+Performance target: registry operations shall not degrade with the number of
+registered storages, like when using one storage per data record. The test
+fails if registering, iterating and resetting NUMBER_OF_STORAGES exceeds the
+time limit below which includes a large margin for slower machines.
+'''
+
+import time
+
+from appxf.storage import RamStorage, Storage
+
+NUMBER_OF_STORAGES = 20000
+MAX_SECONDS = 1.0
+
+
+def test_storage_registry_scale():
+    Storage.reset()
+    factory = RamStorage.get_factory(ram_area='scale')
+    start = time.perf_counter()
+    for i in range(NUMBER_OF_STORAGES):
+        factory(f'record{i}')
+    assert sum(1 for _ in factory(Storage.AllRegistered)) == NUMBER_OF_STORAGES
+    Storage.reset()
+    duration = time.perf_counter() - start
+    print(f'Register, iterate and reset {NUMBER_OF_STORAGES}: {duration:.2f} s')
+    assert not RamStorage.is_registered('record0', location='scale')
+    assert duration < MAX_SECONDS